@@ -0,0 +1,282 @@
+"""
+정수 ID 시퀀스 정렬 엔진
+Levenshtein 편집 거리를 계산하고 역추적으로 일치/치환/삽입/삭제 연산 목록을 반환
+
+- 기본: 비트 병렬 DP(Myers/Hyyrö, 열 하나를 정수 비트 연산 몇 번으로 계산) + 역추적,
+  입력이 BIT_MATRIX_LIMIT를 넘으면 Hirschberg 분할로 메모리 상한 유지 (항상 정확)
+- band 지정: 대각선 밴드 안만 행 단위 NumPy 연산으로 계산 (근사)
+"""
+
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 밴드 정렬 기본 반경 (대각선에서 벗어날 수 있는 최대 칸 수)
+DEFAULT_BAND = 128
+# 비트 병렬 DP에서 열 벡터를 모두 보관하고 바로 역추적하는 최대 셀 수 (약 16 MB),
+# 넘으면 Hirschberg 분할 (가운데 행 계산은 O(n + m) 메모리)
+BIT_MATRIX_LIMIT = 64_000_000
+
+_INF = np.iinfo(np.int32).max // 2
+
+# 연산 종류
+MATCH, SUBSTITUTE, INSERT, DELETE = 'match', 'substitute', 'insert', 'delete'
+
+
+class AlignmentResult:
+    """정렬 결과"""
+
+    def __init__(self, distance: int, ops: List[Tuple[str, int, int]], ref_len: int, hyp_len: int):
+        """
+        Args:
+            distance: 편집 거리
+            ops: (연산, 참조 인덱스, 인식 인덱스) 목록 (삽입은 참조 인덱스 -1, 삭제는 인식 인덱스 -1)
+            ref_len: 참조 시퀀스 길이
+            hyp_len: 인식 시퀀스 길이
+        """
+        self.distance = distance
+        self.ops = ops
+        self.ref_len = ref_len
+        self.hyp_len = hyp_len
+        self.matches = sum(1 for op, _, _ in ops if op == MATCH)
+
+    @property
+    def similarity(self) -> float:
+        """유사도 0~1 (2 × 일치 수 / 전체 길이, SequenceMatcher.ratio와 같은 척도)"""
+        total = self.ref_len + self.hyp_len
+        return 2.0 * self.matches / total if total else 1.0
+
+    def errors(self) -> List[Tuple[str, int, int]]:
+        """일치가 아닌 연산만"""
+        return [op for op in self.ops if op[0] != MATCH]
+
+
+def _band_limits(n: int, m: int, band: int) -> Tuple[np.ndarray, np.ndarray]:
+    """행별 계산 열 범위 [lo, hi] (대각선 i·m/n 주변 ±band)"""
+    rows = np.arange(n + 1)
+    center = rows * (m / n) if n else np.zeros(1)
+    lo = np.clip(np.floor(center).astype(np.int64) - band, 0, m)
+    hi = np.clip(np.ceil(center).astype(np.int64) + band, 0, m)
+    lo[0], hi[-1] = 0, m
+    # 기울기가 밴드보다 가파르면 인접 행 구간이 끊기므로 이전 행 구간과 겹치도록 확장
+    lo[1:] = np.minimum(lo[1:], hi[:-1])
+    return lo, hi
+
+
+def _peq(a: Sequence[int]) -> Dict[int, int]:
+    """토큰별 위치 비트마스크 (a[i] == 토큰이면 i번 비트)"""
+    masks: Dict[int, int] = {}
+    for i, token in enumerate(a):
+        masks[token] = masks.get(token, 0) | (1 << i)
+    return masks
+
+
+def _bit_columns(a: Sequence[int], b: Sequence[int]):
+    """
+    비트 병렬 편집 거리 (Myers/Hyyrö, 전역 정렬)
+    열 j마다 D[·, j]의 세로 차분을 a 길이 비트 벡터 두 개(+1 위치, -1 위치)로 계산
+    Yields:
+        (pv, mv, D[n, j]) (j = 1..len(b))
+    """
+    n = len(a)
+    peq = _peq(a)
+    mask = (1 << n) - 1
+    high = 1 << (n - 1)
+    pv, mv, score = mask, 0, n
+    for token in b:
+        eq = peq.get(token, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # 0행의 가로 차분은 항상 +1 (D[0, j] = j)
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        yield pv, mv, score
+
+
+def _last_row(a: List[int], b: List[int]) -> np.ndarray:
+    """a 전체와 b의 모든 접두사 사이 편집 거리 D[n, 0..m] (O(n + m) 메모리)"""
+    row = np.empty(len(b) + 1, dtype=np.int64)
+    row[0] = len(a)
+    if not a:
+        row[:] = np.arange(len(b) + 1)
+        return row
+    row[1:] = [score for _, _, score in _bit_columns(a, b)]
+    return row
+
+
+def _align_bits(a: List[int], b: List[int], i0: int, j0: int,
+                ops: List[Tuple[str, int, int]]):
+    """열 벡터를 모두 보관한 비트 병렬 DP + 역추적 (align과 같은 동점 처리 순서)"""
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        ops.extend([(DELETE, i0 + i, -1) for i in range(n)]
+                   + [(INSERT, -1, j0 + j) for j in range(m)])
+        return
+    pvs, mvs = [(1 << n) - 1], [0]
+    for pv, mv, _ in _bit_columns(a, b):
+        pvs.append(pv)
+        mvs.append(mv)
+
+    def cell(i: int, j: int) -> int:
+        below = (1 << i) - 1
+        return j + (pvs[j] & below).bit_count() - (mvs[j] & below).bit_count()
+
+    start = len(ops)
+    i, j = n, m
+    current = cell(n, m)
+    while i > 0 and j > 0:
+        same = a[i - 1] == b[j - 1]
+        diag = cell(i - 1, j - 1)
+        if diag + (0 if same else 1) == current:
+            ops.append((MATCH if same else SUBSTITUTE, i0 + i - 1, j0 + j - 1))
+            i, j, current = i - 1, j - 1, diag
+            continue
+        up = current - ((pvs[j] >> (i - 1)) & 1) + ((mvs[j] >> (i - 1)) & 1)
+        if up + 1 == current:
+            ops.append((DELETE, i0 + i - 1, -1))
+            i, current = i - 1, up
+        else:
+            ops.append((INSERT, -1, j0 + j - 1))
+            j, current = j - 1, current - 1
+    ops.extend([(DELETE, i0 + k, -1) for k in range(i - 1, -1, -1)]
+               + [(INSERT, -1, j0 + k) for k in range(j - 1, -1, -1)])
+    ops[start:] = ops[start:][::-1]
+
+
+def _hirschberg(a: List[int], b: List[int], i0: int, j0: int,
+                ops: List[Tuple[str, int, int]]):
+    """Hirschberg 분할: 참조 가운데 행에서 최적 분할 열을 찾아 양쪽을 따로 정렬"""
+    n, m = len(a), len(b)
+    if n <= 1 or n * m <= BIT_MATRIX_LIMIT:
+        _align_bits(a, b, i0, j0, ops)
+        return
+    mid = n // 2
+    forward = _last_row(a[:mid], b)
+    backward = _last_row(a[mid:][::-1], b[::-1])[::-1]
+    split = int(np.argmin(forward + backward))
+    _hirschberg(a[:mid], b[:split], i0, j0, ops)
+    _hirschberg(a[mid:], b[split:], i0 + mid, j0 + split, ops)
+
+
+def align(ref: Sequence[int], hyp: Sequence[int], band: Optional[int] = None) -> AlignmentResult:
+    """
+    두 정수 ID 시퀀스를 편집 거리로 정렬
+    Args:
+        ref: 참조 시퀀스 (정수 ID)
+        hyp: 인식 시퀀스 (정수 ID)
+        band: 대각선 밴드 반경 (None이면 비트 병렬 정확 정렬, 대각선에서 멀리 벗어난
+              정렬(긴 구간 누락/반복)도 찾음)
+    Returns:
+        AlignmentResult
+    """
+    if band is None:
+        a = np.asarray(ref, dtype=np.int32).tolist()
+        b = np.asarray(hyp, dtype=np.int32).tolist()
+        ops: List[Tuple[str, int, int]] = []
+        _hirschberg(a, b, 0, 0, ops)
+        distance = sum(1 for op, _, _ in ops if op != MATCH)
+        return AlignmentResult(distance, ops, len(a), len(b))
+
+    a = np.asarray(ref, dtype=np.int32)
+    b = np.asarray(hyp, dtype=np.int32)
+    n, m = len(a), len(b)
+
+    if n == 0 or m == 0:
+        ops = [(DELETE, i, -1) for i in range(n)] + [(INSERT, -1, j) for j in range(m)]
+        return AlignmentResult(n + m, ops, n, m)
+    lo, hi = _band_limits(n, m, band)
+    width = int((hi - lo).max()) + 1
+    offset = np.arange(width, dtype=np.int32)
+
+    # D[i, k] = 거리(i, lo[i] + k), 밴드 밖은 INF
+    D = np.full((n + 1, width), _INF, dtype=np.int32)
+    D[0, :hi[0] + 1] = np.arange(hi[0] + 1)
+
+    if band >= m:
+        # 밴드가 전체 행을 덮으면 열 인덱스 계산 없이 이전 행을 그대로 이동
+        for i in range(1, n + 1):
+            prev = D[i - 1]
+            best = prev + 1
+            np.minimum(best[1:], prev[:-1] + (b != a[i - 1]), out=best[1:])
+            best[0] = i
+            # 왼쪽(삽입) 의존성: D[i, j] = min_k≤j (best[k] + j - k) → 누적 최소값 한 번으로 처리
+            D[i] = np.minimum.accumulate(best - offset) + offset
+    else:
+        for i in range(1, n + 1):
+            cols = np.arange(lo[i], hi[i] + 1)
+            prev_lo, prev_hi = lo[i - 1], hi[i - 1]
+            prev = D[i - 1]
+
+            # 위(삭제): D[i-1, j] + 1
+            up = np.full(len(cols), _INF, dtype=np.int32)
+            valid = (cols >= prev_lo) & (cols <= prev_hi)
+            up[valid] = prev[cols[valid] - prev_lo] + 1
+
+            # 대각선(일치/치환): D[i-1, j-1] + cost
+            diag = np.full(len(cols), _INF, dtype=np.int32)
+            valid = (cols >= 1) & (cols - 1 >= prev_lo) & (cols - 1 <= prev_hi)
+            j = cols[valid]
+            diag[valid] = prev[j - 1 - prev_lo] + (b[j - 1] != a[i - 1])
+
+            best = np.minimum(up, diag)
+            if lo[i] == 0:
+                best[0] = i
+
+            k = offset[:len(cols)]
+            D[i, :len(cols)] = np.minimum.accumulate(best - k) + k
+
+    def cell(i: int, j: int) -> int:
+        if j < lo[i] or j > hi[i]:
+            return _INF
+        return int(D[i, j - lo[i]])
+
+    # 역추적 (원소 비교는 NumPy 스칼라보다 리스트가 빠름)
+    ref_ids, hyp_ids = a.tolist(), b.tolist()
+    ops: List[Tuple[str, int, int]] = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        current = cell(i, j)
+        if i > 0 and j > 0:
+            same = ref_ids[i - 1] == hyp_ids[j - 1]
+            if cell(i - 1, j - 1) + (0 if same else 1) == current:
+                ops.append((MATCH if same else SUBSTITUTE, i - 1, j - 1))
+                i, j = i - 1, j - 1
+                continue
+        if i > 0 and cell(i - 1, j) + 1 == current:
+            ops.append((DELETE, i - 1, -1))
+            i -= 1
+        else:
+            ops.append((INSERT, -1, j - 1))
+            j -= 1
+    ops.reverse()
+
+    return AlignmentResult(cell(n, m), ops, n, m)
+
+
+def encode_tokens(*sequences: Sequence[Hashable]) -> Tuple[List[np.ndarray], List[Hashable]]:
+    """
+    토큰 시퀀스들을 공통 정수 ID로 변환
+    Returns:
+        (ID 배열 목록, ID → 토큰 테이블)
+    """
+    table: Dict[Hashable, int] = {}
+    encoded = []
+    for sequence in sequences:
+        encoded.append(np.fromiter((table.setdefault(t, len(table)) for t in sequence),
+                                   dtype=np.int32, count=len(sequence)))
+    return encoded, list(table)
+
+
+def align_tokens(ref: Sequence[Hashable], hyp: Sequence[Hashable],
+                 band: Optional[int] = None) -> AlignmentResult:
+    """토큰(음소, 단어 문자열 등) 시퀀스 정렬: 정수 ID로 변환 후 align"""
+    (ref_ids, hyp_ids), _ = encode_tokens(ref, hyp)
+    return align(ref_ids, hyp_ids, band=band)
@@ -3,27 +3,362 @@
 모바일 앱, 웹 앱에서 호출 가능한 API 엔드포인트
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Request, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
-import tempfile
+from werkzeug.exceptions import HTTPException
+from collections import deque
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+import io
+import json
+import multiprocessing
 import os
+import time
+import metrics
+import model_registry
+from audio_io import decode_bytes, probe_duration
+from jobs import JobQueue, QueueFullError
+from passage import split_sentences
+from practice_store import PracticeStore
 from pronunciation_analyzer import PronunciationAnalyzer
+from result_cache import ResultCache, digest_bytes
+from streaming import StreamingSession, StreamingStats
+from stt_backends import decode_options
+from worker_pool import AnalyzerPool, PoolSaturatedError
+
+try:
+    from flask_sock import Sock
+except ImportError:
+    Sock = None
+    print("Warning: flask-sock not available, /ws/stream disabled")
+
+
+class InMemoryUploadRequest(Request):
+    """업로드 파일을 디스크 임시 파일 대신 메모리 버퍼로 받는 Request"""
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        # 업로드 크기는 MAX_CONTENT_LENGTH로 제한됨
+        return io.BytesIO()
+
 
 app = Flask(__name__)
+app.request_class = InMemoryUploadRequest
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_UPLOAD_MB', '25')) * 1024 * 1024
 CORS(app)  # CORS 허용 (프론트엔드 연결용)
+sock = Sock(app) if Sock is not None else None
+
+# 분석 백엔드 설정
+MODEL_SIZE = os.environ.get('WHISPER_MODEL_SIZE', 'base')
+STT_BACKEND = os.environ.get('STT_BACKEND', 'torch')  # torch / int8 (CPU 동적 양자화)
+STT_THREADS = int(os.environ.get('STT_THREADS', '0'))  # 0이면 torch 기본값 (process 백엔드는 워커당)
+WHISPER_DECODE = os.environ.get('WHISPER_DECODE', 'default')  # default / read_aloud (짧은 영어 낭독 고속 모드)
+WHISPER_DECODE_PROMPT = os.environ.get('WHISPER_DECODE_PROMPT', '').lower()  # 비우면 프리셋 값, true/false
+PROSODY_PITCH = os.environ.get('PROSODY_PITCH', 'piptrack')  # piptrack (STFT 피크, 배음 포함) / yin (60~400 Hz 실제 F0)
+PROSODY_BLOCK_S = float(os.environ.get('PROSODY_BLOCK_S', '0'))  # 0이면 전체를 한 번에, 양수면 블록 단위 운율 분석
+ANALYZER_BACKEND = os.environ.get('ANALYZER_BACKEND', 'inline')  # inline / process
+MAX_WORKERS = int(os.environ.get('API_MAX_WORKERS', '4'))
+MAX_QUEUE = int(os.environ.get('API_MAX_QUEUE', '16'))
+RETRY_AFTER = int(os.environ.get('API_RETRY_AFTER', '5'))
+ANALYSIS_TIMEOUT = float(os.environ.get('API_ANALYSIS_TIMEOUT', '120'))
+BATCH_MAX_SIZE = int(os.environ.get('WHISPER_BATCH_SIZE', '1'))
+BATCH_MAX_WAIT_MS = float(os.environ.get('WHISPER_BATCH_WAIT_MS', '20'))
+WARMUP = os.environ.get('WHISPER_WARMUP', 'true').lower() == 'true'
+SCORE_BATCH_CHUNK = int(os.environ.get('SCORE_BATCH_CHUNK', '256'))
+RESULT_CACHE_MB = float(os.environ.get('RESULT_CACHE_MB', '64'))
+RESULT_CACHE_PATH = os.environ.get('RESULT_CACHE_PATH', '')
+RESULT_CACHE_DISK_MB = float(os.environ.get('RESULT_CACHE_DISK_MB', '1024'))  # 0이면 제한 없음
+RESULT_CACHE_TTL_S = float(os.environ.get('RESULT_CACHE_TTL_S', '604800'))  # 디스크 보관 기간, 0이면 무기한
+JOBS_ENABLED = os.environ.get('JOBS_ENABLED', 'true').lower() == 'true'
+JOB_QUEUE_PATH = os.environ.get('JOB_QUEUE_PATH', os.path.join(os.environ.get('CACHE_DIR', './cache'), 'jobs.sqlite'))
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', '2'))
+JOB_SHORT_WORKERS = int(os.environ.get('JOB_SHORT_WORKERS', '1'))
+JOB_SHORT_CLIP_S = float(os.environ.get('JOB_SHORT_CLIP_S', '30'))
+JOB_MAX_QUEUED = int(os.environ.get('JOB_MAX_QUEUED', '1000'))
+JOB_MAX_WAIT_S = float(os.environ.get('JOB_MAX_WAIT_S', '30'))
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', '3'))
+JOB_LEASE_S = float(os.environ.get('JOB_LEASE_S', '60'))  # heartbeat가 이만큼 멈춘 처리 중 작업은 다시 대기열로
+STREAM_STEP_MS = float(os.environ.get('STREAM_STEP_MS', '1000'))
+STREAM_MAX_WINDOW_S = float(os.environ.get('STREAM_MAX_WINDOW_S', '15'))
+PASSAGE_MIN_SENTENCES = int(os.environ.get('PASSAGE_MIN_SENTENCES', '3'))
+PRACTICE_DATA_PATH = os.environ.get('PRACTICE_DATA_PATH', './data/practice_sentences.json')
+PRACTICE_REFERENCE_PROSODY = os.environ.get('PRACTICE_REFERENCE_PROSODY', 'true').lower() == 'true'
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+API_TIMINGS = os.environ.get('API_TIMINGS', 'false').lower() == 'true'  # 요청에 timings가 없을 때 기본값
+
+# 단계별/요청별 지연 시간 계측 (/metrics, 응답 timings)
+metrics.enable(METRICS_ENABLED)
+
+# Whisper 디코딩 옵션 (read_aloud: 영어 고정, greedy, 참조 텍스트 프롬프트, 짧은 클립 패딩 축소)
+stt_decode = decode_options(
+    WHISPER_DECODE,
+    prompt_reference={'true': True, 'false': False}.get(WHISPER_DECODE_PROMPT)
+)
+
+# 오디오 내용 해시 기반 결과 캐시 (재제출/재시도 시 STT·운율 분석 재사용)
+result_cache = None
+if RESULT_CACHE_MB > 0:
+    result_cache = ResultCache(
+        max_bytes=int(RESULT_CACHE_MB * 1024 * 1024),
+        path=RESULT_CACHE_PATH or None,
+        max_disk_bytes=int(RESULT_CACHE_DISK_MB * 1024 * 1024),
+        ttl_s=RESULT_CACHE_TTL_S
+    )
+
+# 글로벌 분석기 인스턴스 (텍스트 기반 엔드포인트, inline 백엔드용)
+# inline 백엔드에서는 동시 요청의 STT를 마이크로 배칭으로 묶음
+analyzer = PronunciationAnalyzer(
+    model_size=MODEL_SIZE,
+    batch_max_size=BATCH_MAX_SIZE if ANALYZER_BACKEND == 'inline' else 1,
+    batch_max_wait_ms=BATCH_MAX_WAIT_MS,
+    result_cache=result_cache,
+    stt_backend=STT_BACKEND,
+    stt_threads=STT_THREADS,
+    decode=stt_decode,
+    pitch_method=PROSODY_PITCH,
+    prosody_block_s=PROSODY_BLOCK_S
+)
+
+# 스트리밍 세션용 분석기 (부분 윈도 인식 결과가 결과 캐시에 쌓이지 않도록 캐시 없이 생성,
+# 모델은 레지스트리를 통해 위 분석기와 공유)
+stream_analyzer = PronunciationAnalyzer(
+    model_size=MODEL_SIZE,
+    batch_max_size=BATCH_MAX_SIZE,
+    batch_max_wait_ms=BATCH_MAX_WAIT_MS,
+    stt_backend=STT_BACKEND,
+    stt_threads=STT_THREADS,
+    decode=stt_decode,
+    pitch_method=PROSODY_PITCH,
+    prosody_block_s=PROSODY_BLOCK_S
+)
+stream_stats = StreamingStats()
+
+# 연습 문장 저장소 (시작 시 한 번 로드, 문장별 단어/음소/음소 ID/참조 운율을 미리 계산)
+practice_store = None
+if multiprocessing.current_process().name == 'MainProcess':
+    try:
+        practice_store = PracticeStore(PRACTICE_DATA_PATH, analyzer,
+                                       reference_prosody=PRACTICE_REFERENCE_PROSODY)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Warning: practice sentences not loaded ({e})")
+
+# 오디오 분석용 프로세스 풀 (워커마다 모델 1회 로드)
+# spawn된 워커가 메인 모듈을 다시 import해도 풀을 중복 생성하지 않도록 메인 프로세스에서만 생성
+pool = None
+if ANALYZER_BACKEND == 'process' and multiprocessing.current_process().name == 'MainProcess':
+    pool = AnalyzerPool(model_size=MODEL_SIZE, workers=MAX_WORKERS, max_queue=MAX_QUEUE,
+                        stt_backend=STT_BACKEND, stt_threads=STT_THREADS, decode=stt_decode,
+                        pitch_method=PROSODY_PITCH, prosody_block_s=PROSODY_BLOCK_S)
+elif ANALYZER_BACKEND == 'inline' and WARMUP:
+    # 첫 요청을 기다리지 않고 백그라운드에서 모델 로드 (서버는 바로 요청 수신)
+    model_registry.warmup(MODEL_SIZE, backend=STT_BACKEND, threads=STT_THREADS)
+
+
+@app.before_request
+def start_timing():
+    """요청 시작 시각 기록 + 요청 단위 단계 시간 수집 시작"""
+    g.request_start = time.perf_counter()
+    g.stage_collector = metrics.collect()
+    g.stage_timings = g.stage_collector.__enter__()
+
+
+@app.after_request
+def record_request_time(response):
+    """요청 처리 시간을 엔드포인트/메서드/상태별 히스토그램에 기록"""
+    if METRICS_ENABLED and 'request_start' in g:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics.REQUEST_SECONDS.observe(time.perf_counter() - g.request_start,
+                                        (endpoint, request.method, str(response.status_code)))
+    return response
+
+
+@app.teardown_request
+def stop_timing(error=None):
+    collector = g.pop('stage_collector', None)
+    if collector is not None:
+        collector.__exit__(None, None, None)
+
+
+def wants_timings(data=None) -> bool:
+    """응답에 단계별 처리 시간(timings)을 넣을지 (쿼리/폼/JSON의 timings, 없으면 API_TIMINGS)"""
+    value = request.args.get('timings') or request.form.get('timings')
+    if value is None and isinstance(data, dict):
+        value = data.get('timings')
+    if value is None:
+        return API_TIMINGS
+    return str(value).lower() == 'true'
+
+
+def with_timings(payload: dict, data=None) -> dict:
+    """요청하면 응답 본문에 단계별 처리 시간 추가 (ms, total은 요청 시작부터)"""
+    if METRICS_ENABLED and wants_timings(data):
+        payload['timings'] = metrics.as_ms(g.stage_timings, time.perf_counter() - g.request_start)
+    return payload
+
+
+def run_analysis(method: str, *args):
+    """
+    오디오 분석 실행: process 백엔드는 워커 풀로, inline은 직접 실행
+    (inline 분석기는 Whisper 모델 접근을 내부 잠금/배처로 직렬화)
+    Raises:
+        PoolSaturatedError: 워커 풀 대기열이 가득 참
+        concurrent.futures.TimeoutError: 워커 풀 분석이 ANALYSIS_TIMEOUT 안에 끝나지 않음
+    """
+    if pool is not None:
+        return pool.call(method, *args, timeout=ANALYSIS_TIMEOUT)
+    return getattr(analyzer, method)(*args)
+
+
+def lookup_sentence(sentence_id: str):
+    """연습 문장 조회 (저장소가 없거나 없는 ID면 None)"""
+    if practice_store is None:
+        return None
+    return practice_store.get(sentence_id)
+
+
+def sentence_not_found():
+    """없는 연습 문장 ID 응답"""
+    return jsonify({
+        'error': 'practice sentence not found',
+        'code': 'SENTENCE_NOT_FOUND'
+    }), 404
+
+
+def use_passage(reference_text: str, segment: str = 'auto') -> bool:
+    """문장 구간 분할 분석 여부 (auto: 참조 지문이 PASSAGE_MIN_SENTENCES 문장 이상)"""
+    if segment == 'auto':
+        return len(split_sentences(reference_text)) >= PASSAGE_MIN_SENTENCES
+    return segment == 'true'
+
+
+def run_passage(audio, reference_text: str, wait_for_slot: bool = False):
+    """
+    긴 지문 분석: 문장 구간 분할은 메인 프로세스에서,
+    구간별 인식·스코어링과 운율 분석은 process 백엔드면 워커 풀로 병렬 처리
+    (inline은 구간들을 한꺼번에 배처에 제출)
+    Args:
+        wait_for_slot: 워커 풀 자리가 날 때까지 제한 없이 기다릴지 여부 (비동기 작업용)
+    Raises:
+        PoolSaturatedError: ANALYSIS_TIMEOUT 안에 워커 풀 자리가 나지 않음
+    """
+    submit = None
+    if pool is not None:
+        def submit(method, *args):
+            return pool.submit(method, *args, block=True,
+                               timeout=None if wait_for_slot else ANALYSIS_TIMEOUT)
+    return analyzer.passage_analysis(audio, reference_text, submit=submit)
+
+
+def run_job(job):
+    """
+    비동기 작업 처리 (작업 워커 스레드에서 호출)
+    process 백엔드는 워커 풀에 자리가 날 때까지 기다렸다가 제출
+    """
+    audio = decode_bytes(job['audio'], job['filename'])
+    if result_cache is not None:
+        audio.digest = digest_bytes(job['audio'])
+    
+    # 연습 문장 작업은 등록 시 참조 텍스트를 문장 원문으로 저장해 둠
+    sentence_id = job['options'].get('sentence_id')
+    sentence = lookup_sentence(sentence_id) if sentence_id else None
+    
+    if sentence is None and use_passage(job['reference_text'], job['options'].get('segment', 'auto')):
+        result = run_passage(audio, job['reference_text'], wait_for_slot=True)
+    elif pool is not None:
+        result = pool.submit('full_analysis', audio, job['reference_text'], sentence, block=True).result()
+        if audio.digest is not None:
+            analyzer.store_analysis(audio.digest, result)
+    else:
+        result = analyzer.full_analysis(audio, job['reference_text'], sentence)
+    
+    if not job['options'].get('analyze_prosody', True):
+        result['prosody'] = None
+    return result
+
+
+# 긴 녹음용 비동기 작업 대기열 (short 전용 워커 + 짧은 것 우선 범용 워커)
+job_queue = None
+if JOBS_ENABLED and multiprocessing.current_process().name == 'MainProcess':
+    job_queue = JobQueue(JOB_QUEUE_PATH, short_clip_s=JOB_SHORT_CLIP_S, max_queued=JOB_MAX_QUEUED,
+                         max_attempts=JOB_MAX_ATTEMPTS, lease_s=JOB_LEASE_S)
+    short_workers = min(JOB_SHORT_WORKERS, JOB_WORKERS - 1) if JOB_WORKERS > 1 else 0
+    job_queue.start_workers(
+        run_job,
+        [('short',)] * short_workers + [('short', 'long')] * (JOB_WORKERS - short_workers)
+    )
+
 
-# 글로벌 분석기 인스턴스
-analyzer = PronunciationAnalyzer(model_size="base")
+def busy_response():
+    """대기열 포화 시 503 + Retry-After 응답"""
+    response = jsonify({
+        'success': False,
+        'error': 'server is busy, retry later',
+        'code': 'SERVER_BUSY'
+    })
+    response.headers['Retry-After'] = str(RETRY_AFTER)
+    return response, 503
+
+
+def timeout_response():
+    """워커 풀 분석이 ANALYSIS_TIMEOUT 안에 끝나지 않았을 때 504 응답"""
+    return jsonify({
+        'success': False,
+        'error': f'analysis did not finish within {ANALYSIS_TIMEOUT:g} seconds',
+        'code': 'ANALYSIS_TIMEOUT'
+    }), 504
 
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """서버 상태 확인"""
-    return jsonify({
+    status = {
         'status': 'healthy',
         'service': 'pronunciation-analyzer',
-        'version': '1.0.0'
-    })
+        'version': '1.0.0',
+        'backend': ANALYZER_BACKEND,
+        'stt_backend': STT_BACKEND,
+        'decode': stt_decode.key or stt_decode.name,
+        'prosody_pitch': PROSODY_PITCH
+    }
+    
+    if analyzer.batcher is not None:
+        status['batching'] = analyzer.batcher.stats()
+    
+    if result_cache is not None:
+        status['result_cache'] = result_cache.stats()
+    
+    if sock is not None:
+        status['streaming'] = stream_stats.stats()
+    
+    if job_queue is not None:
+        status['jobs'] = job_queue.stats()
+    
+    if practice_store is not None:
+        status['practice_sentences'] = practice_store.stats()
+    
+    if pool is not None:
+        pool_health = pool.health()
+        if pool_health['unhealthy']:
+            # 모델 로드 중에 죽어 백오프로 재시작을 기다리는 워커가 있음
+            status['status'] = 'unhealthy'
+        elif not all(worker['alive'] for worker in pool_health['workers']):
+            status['status'] = 'degraded'
+        elif any(worker['state'] in ('starting', 'loading') for worker in pool_health['workers']):
+            status['status'] = 'warming'
+        else:
+            status['status'] = 'ready'
+        status['pool'] = pool_health
+    else:
+        model_state = model_registry.model_state(MODEL_SIZE, STT_BACKEND)
+        status['model'] = model_state
+        if model_state == 'warming':
+            status['status'] = 'warming'
+        elif model_state == 'ready':
+            status['status'] = 'ready'
+        elif model_state == 'failed':
+            status['status'] = 'degraded'
+            status['model_error'] = model_registry.model_error(MODEL_SIZE, STT_BACKEND)
+    
+    return jsonify(status)
 
 
 @app.route('/api/analyze', methods=['POST'])
@@ -34,13 +369,21 @@ def analyze_pronunciation():
     Request:
         - audio: 오디오 파일 (multipart/form-data)
         - reference_text: 참조 텍스트 (string)
+        - sentence_id: 연습 문장 ID (reference_text 대신, 미리 계산한 참조 산출물 사용)
         - analyze_prosody: 운율 분석 여부 (boolean, optional)
+        - segment: 문장 구간 분할 분석 (auto/true/false, optional, 기본 auto:
+                   참조 지문이 PASSAGE_MIN_SENTENCES 문장 이상이면 분할,
+                   sentence_id를 쓰면 분할하지 않음)
+        - timings: 단계별 처리 시간 포함 여부 (boolean, optional, 기본 API_TIMINGS)
     
     Response:
         - spoken_text: 인식된 텍스트
         - pronunciation: 발음 분석 결과
         - prosody: 운율 분석 결과 (옵션)
         - feedback: AI 피드백
+        - segments: 문장 구간별 인식/스코어 (구간 분할 분석일 때)
+        - reference_prosody: 연습 문장 참조 녹음의 운율 (sentence_id + 참조 녹음이 있을 때)
+        - timings: 단계별 처리 시간 (ms, timings=true일 때)
     """
     try:
         # 파라미터 검증
@@ -50,38 +393,67 @@ def analyze_pronunciation():
                 'code': 'MISSING_AUDIO'
             }), 400
         
-        if 'reference_text' not in request.form:
+        sentence = None
+        if request.form.get('sentence_id'):
+            sentence = lookup_sentence(request.form['sentence_id'])
+            if sentence is None:
+                return sentence_not_found()
+            reference_text = sentence.text
+        elif 'reference_text' in request.form:
+            reference_text = request.form['reference_text']
+        else:
             return jsonify({
-                'error': 'reference_text is required',
+                'error': 'reference_text or sentence_id is required',
                 'code': 'MISSING_REFERENCE'
             }), 400
         
         audio_file = request.files['audio']
-        reference_text = request.form['reference_text']
         analyze_prosody_flag = request.form.get('analyze_prosody', 'true').lower() == 'true'
+        passage = sentence is None and use_passage(reference_text, request.form.get('segment', 'auto').lower())
         
-        # 오디오 파일을 임시 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp_file:
-            audio_file.save(tmp_file.name)
-            tmp_path = tmp_file.name
+        with metrics.span('upload'):
+            data = audio_file.read()
+        digest = digest_bytes(data) if result_cache is not None else None
         
-        try:
-            # 전체 분석 실행
-            result = analyzer.full_analysis(tmp_path, reference_text)
-            
-            # 운율 분석 제외 옵션
-            if not analyze_prosody_flag:
-                result['prosody'] = None
+        # process 백엔드는 워커에 보내기 전에 메인 프로세스 캐시 확인 (적중 시 디코딩도 생략)
+        # inline 백엔드는 full_analysis 안에서 같은 캐시를 사용
+        result = None
+        if pool is not None and digest is not None and not passage:
+            result = analyzer.cached_analysis(digest, reference_text, sentence)
+        
+        if result is None:
+            # 업로드를 메모리에서 바로 디코딩 (임시 파일은 폴백으로만 사용)
+            with metrics.span('decode'):
+                audio = decode_bytes(data, audio_file.filename)
+            audio.digest = digest
             
-            return jsonify({
-                'success': True,
-                'data': result
-            }), 200
+            if passage:
+                # 긴 지문: 문장 구간별 병렬 분석 (결과 캐시는 passage_analysis 안에서 사용)
+                result = run_passage(audio, reference_text)
+            else:
+                # 전체 분석 실행
+                result = run_analysis('full_analysis', audio, reference_text, sentence)
+                if pool is not None and digest is not None:
+                    analyzer.store_analysis(digest, result)
+        
+        # 운율 분석 제외 옵션
+        if not analyze_prosody_flag:
+            result['prosody'] = None
         
-        finally:
-            # 임시 파일 삭제
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        return jsonify(with_timings({
+            'success': True,
+            'data': result
+        })), 200
+    
+    except PoolSaturatedError:
+        return busy_response()
+    
+    except FuturesTimeoutError:
+        return timeout_response()
+    
+    except HTTPException:
+        # 413 등은 아래 에러 핸들러가 처리하도록 그대로 전달
+        raise
     
     except Exception as e:
         return jsonify({
@@ -91,6 +463,132 @@ def analyze_pronunciation():
         }), 500
 
 
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """
+    비동기 발음 분석 작업 등록 (긴 녹음용)
+    
+    Request (multipart/form-data): /api/analyze와 같음
+        - audio, reference_text 또는 sentence_id, analyze_prosody(선택), segment(선택)
+    
+    Response (202):
+        - job_id: 작업 ID
+        - status: queued
+        - lane: short/long (짧은 클립이 먼저 처리됨)
+        - poll_url: 결과 조회 URL
+    """
+    if job_queue is None:
+        return jsonify({
+            'error': 'job queue is disabled',
+            'code': 'JOBS_DISABLED'
+        }), 404
+    
+    try:
+        if 'audio' not in request.files:
+            return jsonify({
+                'error': 'audio file is required',
+                'code': 'MISSING_AUDIO'
+            }), 400
+        
+        sentence_id = request.form.get('sentence_id')
+        if sentence_id:
+            sentence = lookup_sentence(sentence_id)
+            if sentence is None:
+                return sentence_not_found()
+            reference_text = sentence.text
+        elif 'reference_text' in request.form:
+            reference_text = request.form['reference_text']
+        else:
+            return jsonify({
+                'error': 'reference_text or sentence_id is required',
+                'code': 'MISSING_REFERENCE'
+            }), 400
+        
+        audio_file = request.files['audio']
+        data = audio_file.read()
+        
+        # 길이로 차선 결정 (디코딩할 수 없는 파일은 여기서 거절)
+        try:
+            duration = probe_duration(data, audio_file.filename)
+        except Exception:
+            return jsonify({
+                'error': 'audio file could not be decoded',
+                'code': 'INVALID_AUDIO'
+            }), 400
+        
+        options = {
+            'analyze_prosody': request.form.get('analyze_prosody', 'true').lower() == 'true',
+            'segment': request.form.get('segment', 'auto').lower()
+        }
+        if sentence_id:
+            options['sentence_id'] = sentence_id
+        
+        job = job_queue.submit(
+            data,
+            reference_text,
+            filename=audio_file.filename,
+            duration=duration,
+            options=options
+        )
+        
+        return jsonify({
+            'success': True,
+            **job,
+            'poll_url': f"/api/jobs/{job['job_id']}"
+        }), 202
+    
+    except QueueFullError:
+        return busy_response()
+    
+    except HTTPException:
+        raise
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'code': 'JOB_SUBMIT_FAILED'
+        }), 500
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    비동기 작업 상태/결과 조회
+    
+    Query Parameters:
+        - wait: 작업이 끝날 때까지 기다릴 최대 시간 (초, 롱 폴링, 기본 0)
+    
+    Response:
+        - status: queued/running/done/failed
+        - position: 앞에 대기 중인 작업 수 (queued일 때)
+        - result: 분석 결과 (done일 때, /api/analyze의 data와 같음)
+        - error: 실패 사유 (failed일 때)
+    """
+    if job_queue is None:
+        return jsonify({
+            'error': 'job queue is disabled',
+            'code': 'JOBS_DISABLED'
+        }), 404
+    
+    try:
+        wait = min(max(float(request.args.get('wait', '0')), 0.0), JOB_MAX_WAIT_S)
+    except ValueError:
+        wait = 0.0
+    job = job_queue.wait(job_id, wait) if wait > 0 else job_queue.get(job_id)
+    
+    if job is None:
+        return jsonify({
+            'error': 'job not found',
+            'code': 'JOB_NOT_FOUND'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        **job
+    }), 200
+
+
 @app.route('/api/transcribe', methods=['POST'])
 def transcribe_only():
     """
@@ -98,9 +596,11 @@ def transcribe_only():
     
     Request:
         - audio: 오디오 파일
+        - timings: 단계별 처리 시간 포함 여부 (boolean, optional)
     
     Response:
         - text: 변환된 텍스트
+        - timings: 단계별 처리 시간 (ms, timings=true일 때)
     """
     try:
         if 'audio' not in request.files:
@@ -110,22 +610,36 @@ def transcribe_only():
             }), 400
         
         audio_file = request.files['audio']
+        with metrics.span('upload'):
+            data = audio_file.read()
+        digest = digest_bytes(data) if result_cache is not None else None
         
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp_file:
-            audio_file.save(tmp_file.name)
-            tmp_path = tmp_file.name
+        spoken_text = None
+        if pool is not None and digest is not None:
+            spoken_text = analyzer.cached_transcript(digest)
         
-        try:
-            spoken_text = analyzer.transcribe_audio(tmp_path)
-            
-            return jsonify({
-                'success': True,
-                'text': spoken_text
-            }), 200
+        if spoken_text is None:
+            with metrics.span('decode'):
+                audio = decode_bytes(data, audio_file.filename)
+            audio.digest = digest
+            with metrics.span('transcribe'):
+                spoken_text = run_analysis('transcribe_audio', audio)
+            if pool is not None and digest is not None:
+                analyzer.store_transcript(digest, spoken_text)
         
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        return jsonify(with_timings({
+            'success': True,
+            'text': spoken_text
+        })), 200
+    
+    except PoolSaturatedError:
+        return busy_response()
+    
+    except FuturesTimeoutError:
+        return timeout_response()
+    
+    except HTTPException:
+        raise
     
     except Exception as e:
         return jsonify({
@@ -135,6 +649,62 @@ def transcribe_only():
         }), 500
 
 
+def stream_analysis(ws):
+    """
+    실시간 스트리밍 분석 (WebSocket /ws/stream)
+    
+    Client → Server:
+        1. 텍스트 메시지 (JSON): {"reference_text": ..., "sample_rate": 16000, "format": "s16le"}
+        2. 바이너리 메시지: 모노 PCM 청크 (s16le 또는 f32le)
+        3. 텍스트 메시지 (JSON): {"type": "end"}
+    
+    Server → Client (JSON 텍스트 메시지):
+        - partial: 발화 중 부분 인식 결과 + 누적 단어 스코어
+        - segment: 묵음으로 확정된 구간 인식 결과 + 누적 단어 스코어
+        - final: 전체 분석 결과 + 지연 지표 (time_to_first_feedback_ms 등)
+        - error: 오류
+    """
+    try:
+        config = json.loads(ws.receive())
+        reference_text = config['reference_text']
+        session = StreamingSession(
+            stream_analyzer,
+            reference_text,
+            sample_rate=int(config.get('sample_rate', 16000)),
+            sample_format=config.get('format', 's16le'),
+            step_ms=STREAM_STEP_MS,
+            max_window_s=STREAM_MAX_WINDOW_S
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        ws.send(json.dumps({'type': 'error', 'error': f'invalid session config: {e}',
+                            'code': 'INVALID_CONFIG'}))
+        return
+    
+    stream_stats.session_started()
+    try:
+        while True:
+            message = ws.receive()
+            if isinstance(message, str):
+                if json.loads(message).get('type') == 'end':
+                    break
+                continue
+            for event in session.feed(message):
+                ws.send(json.dumps(event, ensure_ascii=False))
+        
+        ws.send(json.dumps(session.finish(), ensure_ascii=False))
+    except Exception as e:
+        try:
+            ws.send(json.dumps({'type': 'error', 'error': str(e), 'code': 'STREAMING_FAILED'}))
+        except Exception:
+            pass  # 클라이언트 연결이 이미 끊김
+    finally:
+        stream_stats.session_finished(session)
+
+
+if sock is not None:
+    sock.route('/ws/stream')(stream_analysis)
+
+
 @app.route('/api/score', methods=['POST'])
 def score_pronunciation():
     """
@@ -142,33 +712,50 @@ def score_pronunciation():
     
     Request:
         - reference_text: 참조 텍스트
+        - sentence_id: 연습 문장 ID (reference_text 대신, 미리 계산한 참조 산출물 사용)
         - spoken_text: 사용자가 말한 텍스트
+        - timings: 단계별 처리 시간 포함 여부 (boolean, optional)
     
     Response:
         - score: 발음 스코어
         - details: 상세 분석 결과
+        - timings: 단계별 처리 시간 (ms, timings=true일 때)
     """
     try:
         data = request.get_json()
         
-        if not data or 'reference_text' not in data or 'spoken_text' not in data:
+        if (not data or 'spoken_text' not in data
+                or ('reference_text' not in data and not data.get('sentence_id'))):
             return jsonify({
-                'error': 'reference_text and spoken_text are required',
+                'error': 'reference_text (or sentence_id) and spoken_text are required',
                 'code': 'MISSING_PARAMETERS'
             }), 400
         
-        reference_text = data['reference_text']
+        sentence = None
+        if data.get('sentence_id'):
+            sentence = lookup_sentence(data['sentence_id'])
+            if sentence is None:
+                return sentence_not_found()
+            reference_text = sentence.text
+        else:
+            reference_text = data['reference_text']
         spoken_text = data['spoken_text']
         
-        result = analyzer.calculate_pronunciation_score(reference_text, spoken_text)
-        feedback = analyzer.generate_feedback(result)
+        with metrics.span('score'):
+            result = analyzer.calculate_pronunciation_score(reference_text, spoken_text,
+                                                            reference=sentence)
+        with metrics.span('feedback'):
+            feedback = analyzer.generate_feedback(result)
         
-        return jsonify({
+        return jsonify(with_timings({
             'success': True,
             'score': result['overall_score'],
             'details': result,
             'feedback': feedback
-        }), 200
+        }, data)), 200
+    
+    except HTTPException:
+        raise
     
     except Exception as e:
         return jsonify({
@@ -178,6 +765,104 @@ def score_pronunciation():
         }), 500
 
 
+def iter_score_items():
+    """
+    배치 스코어링 입력 항목 순회
+    - application/x-ndjson: 한 줄에 객체 하나 (요청 본문을 스트리밍으로 읽음)
+    - application/json: {"pairs": [...]} 또는 항목 배열
+    Yields:
+        항목 객체 (파싱 실패 시 ValueError 인스턴스)
+    """
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+        for line in request.stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield ValueError(f'invalid JSON line: {e}')
+        return
+    
+    data = request.get_json(silent=True)
+    items = data.get('pairs') if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise ValueError('pairs must be a list')
+    yield from items
+
+
+@app.route('/api/score/batch', methods=['POST'])
+def score_batch():
+    """
+    텍스트 기반 발음 스코어링 (여러 쌍을 한 번에)
+    
+    Request (application/json 또는 application/x-ndjson):
+        - pairs: [{reference_text, spoken_text, id(선택)}, ...]
+          (NDJSON이면 한 줄에 항목 하나)
+    
+    Response (application/x-ndjson, 입력 순서대로 한 줄씩):
+        - index: 입력 내 위치
+        - id: 요청 항목의 id (있으면)
+        - score / details: 스코어 결과, 또는 error / code
+    """
+    if request.mimetype not in ('application/x-ndjson', 'application/jsonl'):
+        data = request.get_json(silent=True)
+        if not isinstance(data, list) and not (isinstance(data, dict) and isinstance(data.get('pairs'), list)):
+            return jsonify({
+                'error': 'pairs must be a list',
+                'code': 'MISSING_PARAMETERS'
+            }), 400
+    
+    include_feedback = request.args.get('feedback', 'false').lower() == 'true'
+    submit = None
+    if pool is not None:
+        # 청크를 워커 프로세스에 나눠 병렬 처리 (자리가 날 때까지 대기)
+        def submit(chunk):
+            return pool.submit('score_chunk', chunk, block=True, timeout=ANALYSIS_TIMEOUT)
+    
+    def generate():
+        # 스코어링할 항목과 잘못된 항목을 입력 순서대로 기록해 결과와 다시 맞춤
+        entries = deque()
+        
+        def valid_pairs():
+            for index, item in enumerate(iter_score_items()):
+                if isinstance(item, ValueError):
+                    entries.append((index, None, str(item)))
+                elif (not isinstance(item, dict)
+                        or not isinstance(item.get('reference_text'), str)
+                        or not isinstance(item.get('spoken_text'), str)):
+                    entries.append((index, item.get('id') if isinstance(item, dict) else None,
+                                    'reference_text and spoken_text are required'))
+                else:
+                    entries.append((index, item.get('id'), None))
+                    yield item['reference_text'], item['spoken_text']
+        
+        def line(index, item_id, payload):
+            payload = {'index': index, **({'id': item_id} if item_id is not None else {}), **payload}
+            return json.dumps(payload, ensure_ascii=False) + '\n'
+        
+        def flush_errors():
+            while entries and entries[0][2] is not None:
+                index, item_id, error = entries.popleft()
+                yield line(index, item_id, {'error': error, 'code': 'INVALID_ITEM'})
+        
+        try:
+            for result in analyzer.score_many(valid_pairs(), chunk_size=SCORE_BATCH_CHUNK,
+                                              submit=submit, max_in_flight=MAX_WORKERS):
+                yield from flush_errors()
+                index, item_id, _ = entries.popleft()
+                payload = {'score': result['overall_score'], 'details': result}
+                if include_feedback:
+                    payload['feedback'] = analyzer.generate_feedback(result)
+                yield line(index, item_id, payload)
+            yield from flush_errors()
+        except Exception as e:
+            # 스트리밍 중에는 상태 코드를 바꿀 수 없으므로 마지막 줄로 실패를 알림
+            yield json.dumps({'error': str(e), 'code': 'SCORING_FAILED'}) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
 @app.route('/api/phonemes', methods=['POST'])
 def get_phonemes():
     """
@@ -185,9 +870,11 @@ def get_phonemes():
     
     Request:
         - text: 입력 텍스트
+        - timings: 단계별 처리 시간 포함 여부 (boolean, optional)
     
     Response:
         - phonemes: 음소 리스트
+        - timings: 단계별 처리 시간 (ms, timings=true일 때)
     """
     try:
         data = request.get_json()
@@ -199,14 +886,18 @@ def get_phonemes():
             }), 400
         
         text = data['text']
-        phonemes = analyzer.get_phonemes(text)
+        with metrics.span('phonemes'):
+            phonemes = analyzer.get_phonemes(text)
         
-        return jsonify({
+        return jsonify(with_timings({
             'success': True,
             'text': text,
             'phonemes': phonemes,
             'phoneme_count': len(phonemes)
-        }), 200
+        }, data)), 200
+    
+    except HTTPException:
+        raise
     
     except Exception as e:
         return jsonify({
@@ -224,81 +915,57 @@ def get_practice_sentences():
     Query Parameters:
         - level: beginner/intermediate/advanced
         - category: daily/business/travel
+    
+    Response:
+        - sentences: 문장 텍스트 목록
+        - items: 문장 목록 (id, text, level, category) - id로 스코어링/분석 요청 가능
     """
     level = request.args.get('level', 'beginner')
     category = request.args.get('category', 'daily')
     
-    sentences = {
-        'beginner': {
-            'daily': [
-                "Hello, how are you?",
-                "Nice to meet you",
-                "What's your name?",
-                "I am fine, thank you"
-            ],
-            'business': [
-                "Good morning",
-                "Thank you for your time",
-                "Please send me the file",
-                "Let's have a meeting"
-            ],
-            'travel': [
-                "Where is the hotel?",
-                "How much is this?",
-                "I need help please",
-                "Thank you very much"
-            ]
-        },
-        'intermediate': {
-            'daily': [
-                "What's the weather like today?",
-                "I'd like a cup of coffee please",
-                "Could you help me with this?",
-                "That sounds like a great idea"
-            ],
-            'business': [
-                "Could you send me the report?",
-                "Let's schedule a meeting next week",
-                "I'll get back to you soon",
-                "What's your opinion on this?"
-            ],
-            'travel': [
-                "How do I get to the airport?",
-                "I'd like to make a reservation",
-                "Is there a pharmacy nearby?",
-                "What time does it close?"
-            ]
-        },
-        'advanced': {
-            'daily': [
-                "I've been thinking about trying that new restaurant",
-                "It's been quite challenging to manage everything lately",
-                "The presentation went better than I expected",
-                "I appreciate your understanding in this matter"
-            ],
-            'business': [
-                "We need to reassess our strategy moving forward",
-                "I'd like to discuss the quarterly projections",
-                "Could you elaborate on your proposal?",
-                "Let's align our objectives for the next quarter"
-            ],
-            'travel': [
-                "I'd like to extend my reservation for two more nights",
-                "Could you recommend any local attractions?",
-                "Is there a shuttle service to the city center?",
-                "What's the best way to get around the city?"
-            ]
-        }
-    }
+    items = practice_store.select(level, category) if practice_store is not None else []
     
     return jsonify({
         'success': True,
         'level': level,
         'category': category,
-        'sentences': sentences.get(level, {}).get(category, [])
+        'sentences': [sentence.text for sentence in items],
+        'items': [sentence.summary() for sentence in items]
     }), 200
 
 
+@app.route('/api/practice-sentences/<sentence_id>', methods=['GET'])
+def get_practice_sentence(sentence_id):
+    """
+    연습 문장 상세 (미리 계산한 단어/음소, 참조 녹음 운율)
+    
+    Response:
+        - id, text, level, category
+        - words, phonemes, phoneme_count
+        - reference_prosody: 참조 녹음 운율 + 피치 윤곽 (참조 녹음이 없으면 null)
+    """
+    sentence = lookup_sentence(sentence_id)
+    if sentence is None:
+        return sentence_not_found()
+    
+    return jsonify({
+        'success': True,
+        **sentence.to_dict()
+    }), 200
+
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """
+    Prometheus 지표 (텍스트 형식)
+    
+    Response:
+        - pronunciation_stage_seconds: 분석 단계별 처리 시간 히스토그램 (stage)
+        - pronunciation_http_request_seconds: 요청 처리 시간 히스토그램 (endpoint, method, status)
+    """
+    return Response(metrics.REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+
 # 에러 핸들러
 @app.errorhandler(404)
 def not_found(error):
@@ -308,6 +975,14 @@ def not_found(error):
     }), 404
 
 
+@app.errorhandler(413)
+def payload_too_large(error):
+    return jsonify({
+        'error': 'audio file is too large',
+        'code': 'PAYLOAD_TOO_LARGE'
+    }), 413
+
+
 @app.errorhandler(500)
 def internal_error(error):
     return jsonify({
@@ -224,7 +224,7 @@ with col2:
                     
                     col_pr1, col_pr2, col_pr3 = st.columns(3)
                     with col_pr1:
-                        st.metric("말하기 속도", f"{result['prosody']['speaking_rate']:.1f}")
+                        st.metric("말하기 속도", f"{result['prosody']['speaking_rate']:.1f} 음절/초")
                     with col_pr2:
                         st.metric("피치 변화", f"{result['prosody']['pitch_variation']:.1f}")
                     with col_pr3:
@@ -0,0 +1,322 @@
+"""
+오디오 디코딩 모듈
+요청당 한 번만 디코딩(16 kHz 모노)하여 STT와 운율 분석이 같은 파형을 공유
+"""
+
+import importlib.util
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Iterator, Union
+
+import numpy as np
+
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
+# librosa/whisper는 import 비용이 커서 실제 디코딩 시점에 import
+LIBROSA_AVAILABLE = importlib.util.find_spec("librosa") is not None
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
+
+# Whisper 입력 규격과 동일한 샘플링 레이트
+SAMPLE_RATE = 16000
+
+# 디코더(librosa 또는 Whisper의 ffmpeg 로더) 사용 가능 여부
+DECODER_AVAILABLE = LIBROSA_AVAILABLE or WHISPER_AVAILABLE
+
+# 압축 포맷(mp3/m4a/webm 등) 파이프 디코딩용 ffmpeg 경로
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+
+class DecodedAudio:
+    """디코딩된 오디오 (모노 float32 파형 + 샘플링 레이트)"""
+
+    def __init__(self, samples: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                 source: str = None, digest: str = None):
+        """
+        Args:
+            samples: 모노 파형 (1차원)
+            sample_rate: 샘플링 레이트 (Hz)
+            source: 원본 파일 경로 등 출처 정보 (선택)
+            digest: 원본 오디오 내용 해시 (결과 캐시 키, 선택)
+        """
+        self.samples = np.ascontiguousarray(samples, dtype=np.float32)
+        self.sample_rate = sample_rate
+        self.source = source
+        self.digest = digest
+
+    @property
+    def duration(self) -> float:
+        """길이 (초)"""
+        return len(self.samples) / float(self.sample_rate)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def __repr__(self) -> str:
+        return (f"DecodedAudio(duration={self.duration:.2f}s, "
+                f"sample_rate={self.sample_rate}, source={self.source!r})")
+
+
+# 분석기 메서드가 받는 오디오 입력 타입
+AudioInput = Union[str, os.PathLike, np.ndarray, DecodedAudio]
+
+
+def _to_mono(samples: np.ndarray) -> np.ndarray:
+    """다채널 배열을 모노로 변환 (channels-first/last 모두 허용)"""
+    samples = np.asarray(samples, dtype=np.float32)
+    if samples.ndim == 1:
+        return samples
+    if samples.ndim != 2:
+        raise ValueError(f"지원하지 않는 오디오 배열 형태: {samples.shape}")
+    # 짧은 축을 채널 축으로 간주
+    channel_axis = 0 if samples.shape[0] <= samples.shape[1] else 1
+    return samples.mean(axis=channel_axis)
+
+
+def resample(samples: np.ndarray, orig_sr: int, target_sr: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    샘플링 레이트 변환
+    Args:
+        samples: 모노 파형
+        orig_sr: 원본 샘플링 레이트
+        target_sr: 목표 샘플링 레이트
+    Returns:
+        변환된 파형
+    """
+    if orig_sr == target_sr:
+        return samples
+    if not LIBROSA_AVAILABLE:
+        raise RuntimeError("리샘플링에는 librosa가 필요합니다")
+    import librosa
+    return librosa.resample(samples, orig_sr=orig_sr, target_sr=target_sr)
+
+
+def load_audio(path: Union[str, os.PathLike], sr: int = SAMPLE_RATE) -> DecodedAudio:
+    """
+    오디오 파일을 한 번 디코딩하여 모노/목표 샘플링 레이트로 변환
+    Args:
+        path: 오디오 파일 경로
+        sr: 목표 샘플링 레이트
+    Returns:
+        DecodedAudio
+    """
+    path = os.fspath(path)
+    if LIBROSA_AVAILABLE:
+        import librosa
+        samples, _ = librosa.load(path, sr=sr, mono=True)
+    elif WHISPER_AVAILABLE:
+        # Whisper 로더는 ffmpeg로 16 kHz 모노 디코딩
+        import whisper
+        samples = whisper.load_audio(path, sr=sr)
+    else:
+        raise RuntimeError("오디오 디코더(librosa 또는 whisper)를 사용할 수 없습니다")
+    return DecodedAudio(samples, sr, source=path)
+
+
+def as_audio(audio: AudioInput, sr: int = SAMPLE_RATE) -> DecodedAudio:
+    """
+    다양한 오디오 입력을 DecodedAudio로 정규화
+    Args:
+        audio: 파일 경로, 파형 배열(이미 sr 기준으로 가정) 또는 DecodedAudio
+        sr: 목표 샘플링 레이트
+    Returns:
+        DecodedAudio (이미 디코딩된 입력은 복사 없이 그대로 반환)
+    """
+    if isinstance(audio, DecodedAudio):
+        if audio.sample_rate == sr:
+            return audio
+        return DecodedAudio(resample(audio.samples, audio.sample_rate, sr), sr,
+                            source=audio.source, digest=audio.digest)
+
+    if isinstance(audio, np.ndarray):
+        return DecodedAudio(_to_mono(audio), sr)
+
+    if isinstance(audio, (str, os.PathLike)):
+        return load_audio(audio, sr)
+
+    raise TypeError(f"지원하지 않는 오디오 입력 타입: {type(audio).__name__}")
+
+
+class BlockResampler:
+    """
+    블록 단위 샘플링 레이트 변환 (블록 사이 필터 상태·보간 위치를 유지해 경계에서 끊김 없음)
+    8차 버터워스 저역 통과(목표 나이퀴스트의 90%) 후 선형 보간
+    (긴 파일 블록 읽기, 스트리밍 PCM 청크용, 전체를 한 번에 변환할 수 있으면 resample이 더 정확)
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int = SAMPLE_RATE):
+        """
+        Args:
+            orig_sr: 원본 샘플링 레이트
+            target_sr: 목표 샘플링 레이트
+        """
+        self.step = orig_sr / float(target_sr)
+        self._sos = None
+        if orig_sr > target_sr:
+            from scipy import signal
+            self._sos = signal.butter(8, 0.45 * target_sr, fs=orig_sr, output='sos')
+            self._zi = np.zeros((len(self._sos), 2))
+        self._position = 0.0  # 다음 출력 샘플의 위치 (현재 블록 기준 입력 샘플 단위)
+        self._last = 0.0      # 이전 블록의 마지막 샘플 (블록 경계 보간용)
+
+    def __call__(self, samples: np.ndarray) -> np.ndarray:
+        """블록 하나 변환 (출력 길이는 누적 입력 길이 / step에 맞춰 블록마다 달라짐)"""
+        if self.step == 1.0 or len(samples) == 0:
+            return np.asarray(samples, dtype=np.float32)
+        if self._sos is not None:
+            from scipy import signal
+            samples, self._zi = signal.sosfilt(self._sos, samples, zi=self._zi)
+        extended = np.concatenate(([self._last], samples))
+        positions = np.arange(self._position, len(samples) - 1 + 1e-9, self.step)
+        output = np.interp(positions + 1.0, np.arange(len(extended)), extended)
+        self._position = (positions[-1] + self.step if len(positions) else self._position) - len(samples)
+        self._last = samples[-1]
+        return output.astype(np.float32)
+
+
+def _file_blocks(path: str, block_samples: int, sr: int) -> Iterator[np.ndarray]:
+    """파일을 고정 크기 블록으로 읽어 모노/목표 샘플링 레이트로 변환 (전체를 메모리에 올리지 않음)"""
+    if SOUNDFILE_AVAILABLE:
+        try:
+            info = sf.info(path)
+        except RuntimeError:
+            info = None
+        if info is not None:
+            resampler = BlockResampler(info.samplerate, sr)
+            native_block = max(1, int(block_samples * info.samplerate / sr))
+            for block in sf.blocks(path, blocksize=native_block, dtype='float32', always_2d=True):
+                yield resampler(block.mean(axis=1))
+            return
+
+    if not FFMPEG_PATH:
+        raise RuntimeError("블록 단위 디코딩에는 soundfile이 읽을 수 있는 포맷이거나 ffmpeg가 필요합니다")
+    cmd = [
+        FFMPEG_PATH, "-hide_banner", "-loglevel", "error",
+        "-i", path,
+        "-f", "f32le", "-ac", "1", "-ar", str(sr),
+        "pipe:1",
+    ]
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE) as proc:
+        while True:
+            data = proc.stdout.read(block_samples * 4)
+            if not data:
+                break
+            yield np.frombuffer(data[:len(data) // 4 * 4], dtype=np.float32)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def stream_blocks(audio: AudioInput, block_samples: int, sr: int = SAMPLE_RATE) -> Iterator[np.ndarray]:
+    """
+    오디오를 고정 크기 블록으로 순회 (최대 메모리가 녹음 길이와 무관)
+    Args:
+        audio: 파일 경로(블록 단위 디코딩), 파형 배열 또는 DecodedAudio (복사 없는 슬라이스)
+        block_samples: 블록 길이 (목표 샘플링 레이트 기준 샘플, 파일은 리샘플링으로 조금씩 다를 수 있음)
+        sr: 목표 샘플링 레이트
+    Returns:
+        모노 float32 블록 이터레이터
+    Raises:
+        RuntimeError: 파일을 블록 단위로 디코딩할 수 없음
+    """
+    if isinstance(audio, (str, os.PathLike)):
+        yield from _file_blocks(os.fspath(audio), block_samples, sr)
+        return
+    samples = as_audio(audio, sr).samples
+    for start in range(0, len(samples), block_samples):
+        yield samples[start:start + block_samples]
+
+
+def _decode_with_soundfile(data: bytes, sr: int) -> np.ndarray:
+    """WAV/FLAC/OGG 등 libsndfile 지원 포맷을 메모리에서 디코딩"""
+    samples, orig_sr = sf.read(io.BytesIO(data), dtype="float32", always_2d=False)
+    return resample(_to_mono(samples), orig_sr, sr)
+
+
+def _decode_with_ffmpeg(data: bytes, sr: int) -> np.ndarray:
+    """ffmpeg stdin/stdout 파이프로 압축 포맷을 디코딩 (디스크 미사용)"""
+    cmd = [
+        FFMPEG_PATH, "-hide_banner", "-loglevel", "error",
+        "-i", "pipe:0",
+        "-f", "f32le", "-ac", "1", "-ar", str(sr),
+        "pipe:1",
+    ]
+    proc = subprocess.run(cmd, input=data, capture_output=True, check=True)
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+def _decode_with_tempfile(data: bytes, filename: str, sr: int) -> np.ndarray:
+    """임시 파일 경유 디코딩 (파이프로 읽을 수 없는 컨테이너용 폴백)"""
+    suffix = os.path.splitext(filename or "")[1] or ".wav"
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+        tmp_file.write(data)
+        tmp_path = tmp_file.name
+    try:
+        return load_audio(tmp_path, sr).samples
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def decode_bytes(data: bytes, filename: str = None, sr: int = SAMPLE_RATE) -> DecodedAudio:
+    """
+    메모리 버퍼의 오디오를 디코딩
+    순서: soundfile(WAV/PCM) → ffmpeg 파이프(압축 포맷) → 임시 파일(폴백)
+    Args:
+        data: 인코딩된 오디오 바이트
+        filename: 원본 파일명 (확장자 힌트, 선택)
+        sr: 목표 샘플링 레이트
+    Returns:
+        DecodedAudio
+    """
+    if not data:
+        raise ValueError("빈 오디오 데이터입니다")
+
+    if SOUNDFILE_AVAILABLE:
+        try:
+            return DecodedAudio(_decode_with_soundfile(data, sr), sr, source=filename)
+        except RuntimeError:
+            # libsndfile이 모르는 포맷이거나 리샘플러가 없음 → 다음 단계
+            pass
+
+    if FFMPEG_PATH:
+        try:
+            samples = _decode_with_ffmpeg(data, sr)
+            if len(samples):
+                return DecodedAudio(samples, sr, source=filename)
+        except subprocess.CalledProcessError:
+            # moov atom이 끝에 있는 mp4처럼 seek이 필요한 컨테이너
+            pass
+
+    return DecodedAudio(_decode_with_tempfile(data, filename, sr), sr, source=filename)
+
+
+def probe_duration(data: bytes, filename: str = None) -> float:
+    """
+    인코딩된 오디오 길이 (초)
+    soundfile이 읽을 수 있는 포맷은 헤더만 읽고, 그 외에는 디코딩해서 계산
+    """
+    if SOUNDFILE_AVAILABLE:
+        try:
+            return sf.info(io.BytesIO(data)).duration
+        except RuntimeError:
+            pass
+    return decode_bytes(data, filename).duration
+
+
+def decode_upload(upload, sr: int = SAMPLE_RATE) -> DecodedAudio:
+    """
+    업로드 파일 객체(werkzeug FileStorage 등)를 메모리에서 바로 디코딩
+    Args:
+        upload: read()와 filename 속성을 가진 파일 객체
+        sr: 목표 샘플링 레이트
+    Returns:
+        DecodedAudio
+    """
+    data = upload.read()
+    return decode_bytes(data, getattr(upload, "filename", None), sr)
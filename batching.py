@@ -0,0 +1,159 @@
+"""
+Whisper 동적 마이크로 배칭
+여러 요청의 짧은 발화(30초 이하)를 최대 대기 시간/배치 크기 안에서 모아
+한 번의 배치 인코더/디코더 패스로 처리한 뒤 각 호출자에게 결과를 돌려줌
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from stt_backends import get_backend
+
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+
+class WhisperBatcher:
+    """Whisper 추론 배칭 스케줄러"""
+
+    def __init__(
+        self,
+        model,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20.0,
+        lock: Optional[threading.Lock] = None,
+        backend=None,
+        decode=None,
+    ):
+        """
+        초기화
+        Args:
+            model: 로드된 Whisper 모델
+            max_batch_size: 한 번에 처리할 최대 요청 수
+            max_wait_ms: 첫 요청 도착 후 배치를 채우기 위해 기다리는 최대 시간 (ms)
+            lock: 모델 접근 잠금 (같은 모델을 쓰는 다른 경로와 공유)
+            backend: 배치 디코딩을 수행할 STT 백엔드 (None이면 기본 torch 백엔드)
+            decode: 디코딩 옵션 (stt_backends.DecodeOptions, None이면 기본값)
+        """
+        if not WHISPER_AVAILABLE:
+            raise RuntimeError("배칭에는 whisper와 torch가 필요합니다")
+
+        self.model = model
+        self.backend = backend or get_backend()
+        self.decode = decode
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.max_samples = whisper.audio.N_SAMPLES  # 30초 윈도우
+        self._lock = lock or threading.Lock()
+        self._queue: "queue.Queue[Optional[Tuple[np.ndarray, Optional[str], Future]]]" = queue.Queue()
+        self._closed = False
+
+        self.batches_run = 0
+        self.items_processed = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="whisper-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, audio: np.ndarray, prompt: Optional[str] = None) -> Future:
+        """
+        16 kHz 모노 파형(30초 이하) 변환 요청
+        Args:
+            audio: 16 kHz 모노 파형
+            prompt: 디코더 프롬프트 (참조 텍스트, 디코딩 옵션이 프롬프트를 쓸 때만 사용)
+        Returns:
+            변환 텍스트 Future
+        """
+        if self._closed:
+            raise RuntimeError("배처가 종료되었습니다")
+        if len(audio) > self.max_samples:
+            raise ValueError("배칭은 30초 이하 오디오만 지원합니다")
+        future = Future()
+        self._queue.put((audio, prompt, future))
+        return future
+
+    def transcribe(self, audio: np.ndarray, timeout: Optional[float] = None,
+                   prompt: Optional[str] = None) -> str:
+        """요청을 제출하고 결과를 기다림"""
+        return self.submit(audio, prompt).result(timeout=timeout)
+
+    def _collect_batch(self, first) -> List[Tuple[np.ndarray, Optional[str], Future]]:
+        """첫 요청 이후 max_wait 동안 또는 max_batch_size까지 요청을 모음"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # 종료 신호는 현재 배치를 처리한 뒤 반영
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        """배칭 루프"""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = self._collect_batch(first)
+            self._process(batch)
+
+    def _process(self, batch: List[Tuple[np.ndarray, Optional[str], Future]]):
+        """mel 윈도우로 패딩 → 배치 인코딩/디코딩(백엔드) → 결과 분배"""
+        # 프롬프트는 배치 전체에 하나이므로 프롬프트를 쓰는 옵션이면 같은 프롬프트끼리 묶음
+        groups: Dict[Optional[str], List[Tuple[np.ndarray, Future]]] = {}
+        use_prompt = self.decode is not None and self.decode.prompt_reference
+        for audio, prompt, future in batch:
+            groups.setdefault(prompt if use_prompt else None, []).append((audio, future))
+
+        for prompt, items in groups.items():
+            futures = [future for _, future in items]
+            try:
+                with self._lock:
+                    texts = self.backend.decode_batch(
+                        self.model, [audio for audio, _ in items], self.decode, prompt
+                    )
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+
+            self.batches_run += 1
+            self.items_processed += len(items)
+            for future, text in zip(futures, texts):
+                future.set_result(text)
+
+    def stats(self) -> dict:
+        """배칭 통계"""
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000.0,
+            'batches_run': self.batches_run,
+            'items_processed': self.items_processed,
+            'avg_batch_size': round(self.items_processed / self.batches_run, 2)
+            if self.batches_run else 0.0,
+            'queued': self._queue.qsize(),
+        }
+
+    def close(self):
+        """배칭 스레드 종료"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join(timeout=5.0)
@@ -0,0 +1,67 @@
+"""
+음소 정렬 벤치마크
+기존 SequenceMatcher(공백으로 이어 붙인 음소 문자열) vs 정수 ID 편집 거리 정렬
+
+실행: python -m benchmarks.bench_alignment
+"""
+
+import argparse
+import random
+from difflib import SequenceMatcher
+
+from alignment import DEFAULT_BAND, align_tokens
+from benchmarks.bench_lexicon import PASSAGE
+from benchmarks.common import measure
+from phoneme_lexicon import PhonemeLexicon
+
+
+def legacy_similarity(ref_phonemes, spoken_phonemes):
+    """기존 calculate_pronunciation_score의 문자 단위 유사도"""
+    return SequenceMatcher(None, ' '.join(ref_phonemes), ' '.join(spoken_phonemes)).ratio()
+
+
+def corrupt(words, rate: float, seed: int):
+    """단어 단위 치환/삭제/삽입으로 인식 오류 흉내"""
+    rng = random.Random(seed)
+    result = []
+    for word in words:
+        roll = rng.random()
+        if roll < rate / 3:
+            result.append(rng.choice(PASSAGE))
+        elif roll < 2 * rate / 3:
+            continue
+        else:
+            result.append(word)
+            if roll < rate:
+                result.append(rng.choice(PASSAGE))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음소 정렬 벤치마크")
+    parser.add_argument('--words', type=int, nargs='+', default=[20, 200, 1000, 3000],
+                        help="지문 길이 (단어 수)")
+    parser.add_argument('--error-rate', type=float, default=0.15)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    lexicon = PhonemeLexicon.load_or_compile()
+    print(f"{'단어':>6} {'음소':>7} | {'SequenceMatcher':>16} {'align':>10} {'align(band)':>12}"
+          f" | {'유사도(기존)':>10} {'유사도(정렬)':>10}")
+    for num_words in args.words:
+        words = (PASSAGE * (num_words // len(PASSAGE) + 1))[:num_words]
+        ref = lexicon.phonemes(words)
+        spoken = lexicon.phonemes(corrupt(words, args.error_rate, seed=num_words))
+
+        legacy = measure(lambda: legacy_similarity(ref, spoken), args.repeat)
+        full = measure(lambda: align_tokens(ref, spoken), args.repeat)
+        banded = measure(lambda: align_tokens(ref, spoken, band=DEFAULT_BAND), args.repeat)
+
+        print(f"{num_words:>6} {len(ref):>7} | {legacy['best'] * 1e3:>13.2f} ms"
+              f" {full['best'] * 1e3:>7.2f} ms {banded['best'] * 1e3:>9.2f} ms"
+              f" | {legacy_similarity(ref, spoken):>10.3f}"
+              f" {align_tokens(ref, spoken).similarity:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
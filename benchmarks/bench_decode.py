@@ -0,0 +1,71 @@
+"""
+Whisper 디코딩 옵션 벤치마크
+기본 디코딩(언어 감지, 온도 폴백, 30초 패딩) vs read_aloud(영어 고정, greedy, 참조 텍스트 프롬프트,
+짧은 클립 패딩 축소)의 지연 시간/RTF와 정확도(정답 대비 WER, 기본 디코딩과의 불일치율)를 나란히 비교
+
+녹음 모음: 디렉터리의 오디오 파일 + 같은 이름의 .txt (낭독한 참조 텍스트 = 프롬프트 = 정답)
+
+실행: python -m benchmarks.bench_decode --fixtures <디렉터리> [--model base]
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.bench_stt_backends import load_fixtures, word_error_rate
+from benchmarks.common import SAMPLE_RATE, measure
+from pronunciation_analyzer import WHISPER_AVAILABLE, PronunciationAnalyzer
+from stt_backends import decode_options
+
+MODES = {
+    'default': lambda: decode_options('default'),
+    'read_aloud': lambda: decode_options('read_aloud'),
+    'read_aloud(no prompt)': lambda: decode_options('read_aloud', prompt_reference=False),
+    'read_aloud(30s pad)': lambda: decode_options('read_aloud', trim_padding=False),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Whisper 디코딩 옵션 벤치마크")
+    parser.add_argument('--fixtures', default=None, help="녹음 모음 디렉터리 (오디오 + .txt)")
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--backend', default='torch')
+    parser.add_argument('--modes', nargs='+', default=list(MODES), choices=list(MODES))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if not WHISPER_AVAILABLE:
+        print("Whisper가 설치되어 있지 않아 측정할 수 없습니다")
+        return
+
+    fixtures = load_fixtures(args.fixtures)
+    # 합성 톤은 정답이 없으므로 프롬프트만 고정 문장으로
+    prompts = [reference or "The quick brown fox jumps over the lazy dog." for _, _, reference in fixtures]
+    durations = [len(samples) / SAMPLE_RATE for _, samples, _ in fixtures]
+    print(f"녹음 {len(fixtures)}개, 길이 {min(durations):.1f}~{max(durations):.1f}초 "
+          f"(백엔드 {args.backend}, 모델 {args.model})")
+    print(f"{'모드':<22} | {'지연 평균':>9} {'RTF':>6} | {'WER(정답)':>9} {'기본 대비 불일치':>14}")
+
+    baseline = None
+    for mode in args.modes:
+        analyzer = PronunciationAnalyzer(model_size=args.model, preload=True,
+                                         stt_backend=args.backend, decode=MODES[mode]())
+        texts, latencies = [], []
+        for (_, samples, _), prompt in zip(fixtures, prompts):
+            latencies.append(measure(lambda: analyzer.transcribe_audio(samples, prompt=prompt),
+                                     args.repeat)['best'])
+            texts.append(analyzer.transcribe_audio(samples, prompt=prompt))
+
+        scored = [(reference, text) for (_, _, reference), text in zip(fixtures, texts)
+                  if reference is not None]
+        wer = (f"{np.mean([word_error_rate(r, t) for r, t in scored]) * 100:>8.1f}%"
+               if scored else f"{'-':>9}")
+        if baseline is None:
+            baseline = texts
+        disagreement = np.mean([word_error_rate(base, text) for base, text in zip(baseline, texts)])
+        print(f"{mode:<22} | {np.mean(latencies) * 1e3:>6.0f} ms {sum(latencies) / sum(durations):>6.3f} | "
+              f"{wer} {disagreement * 100:>13.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+프레임 특징 추출 벤치마크
+librosa.piptrack + librosa.feature.rms(기존: 각자 프레임 분할/STFT) vs 한 번의 STFT로 계산하는 extract_frame_features
+(피치 윤곽과 RMS가 기존과 같은지도 확인)
+
+실행: python -m benchmarks.bench_frame_features
+"""
+
+import argparse
+
+import librosa
+import numpy as np
+
+from benchmarks.common import SAMPLE_RATE, measure, synth_speech
+from prosody import extract_frame_features, extract_pitch_contour
+
+
+def legacy_features(y: np.ndarray):
+    """기존 analyze_prosody의 피치/에너지 계산"""
+    pitches, magnitudes = librosa.piptrack(y=y, sr=SAMPLE_RATE)
+    return extract_pitch_contour(pitches, magnitudes), librosa.feature.rms(y=y)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프레임 특징 추출 벤치마크")
+    parser.add_argument('--durations', type=float, nargs='+', default=[5, 30, 120],
+                        help="합성 음성 길이 (초)")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'길이(s)':>8} {'프레임':>8} {'기존(ms)':>10} {'단일 STFT(ms)':>14} {'속도향상':>8}")
+    for duration in args.durations:
+        y = synth_speech(duration, seed=int(duration))
+
+        pitch, rms = legacy_features(y)
+        features = extract_frame_features(y, SAMPLE_RATE)
+        assert np.allclose(pitch, features.voiced_pitch(), rtol=1e-5), "피치 윤곽이 기존과 다릅니다"
+        assert np.allclose(rms, features['rms'], atol=1e-6), "RMS가 기존과 다릅니다"
+
+        legacy = measure(lambda: legacy_features(y), args.repeat)
+        single = measure(lambda: extract_frame_features(y, SAMPLE_RATE), args.repeat)
+        print(f"{duration:>8.0f} {features.n_frames:>8} {legacy['best'] * 1e3:>10.2f} "
+              f"{single['best'] * 1e3:>14.2f} {legacy['best'] / single['best']:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
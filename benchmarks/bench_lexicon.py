@@ -0,0 +1,90 @@
+"""
+음소 사전 조회 벤치마크
+pronouncing 라이브러리(기존) vs 컴파일된 PhonemeLexicon (mmap + LRU 캐시)
+
+실행: python -m benchmarks.bench_lexicon
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+import pronouncing
+
+from benchmarks.common import measure
+from phoneme_lexicon import PhonemeLexicon
+
+PASSAGE = (
+    "the quick brown fox jumps over the lazy dog while the weather is beautiful today "
+    "and i would like a cup of coffee please could you send me the report by tomorrow "
+    "we need to reassess our strategy moving forward and align our objectives"
+).split()
+
+COLD_START_SNIPPETS = {
+    'pronouncing': "import pronouncing; pronouncing.phones_for_word('hello')",
+    'lexicon': ("from phoneme_lexicon import PhonemeLexicon; "
+                "PhonemeLexicon.load_or_compile().lookup_ids('hello')"),
+}
+
+
+def legacy_phonemes(words):
+    """기존 get_phonemes의 단어별 pronouncing 조회"""
+    phonemes = []
+    for word in words:
+        phones = pronouncing.phones_for_word(word)
+        if phones:
+            phonemes.extend(phones[0].split())
+        else:
+            phonemes.extend(list(word))
+    return phonemes
+
+
+def cold_start(snippet: str, runs: int) -> float:
+    """새 인터프리터에서 import + 첫 조회까지 걸린 최소 시간 (초)"""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', snippet], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음소 사전 조회 벤치마크")
+    parser.add_argument('--words', type=int, default=5000, help="조회할 단어 수")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--cold-runs', type=int, default=3)
+    args = parser.parse_args()
+
+    lexicon = PhonemeLexicon.load_or_compile()
+    words = (PASSAGE * (args.words // len(PASSAGE) + 1))[:args.words]
+    assert lexicon.phonemes(words) == legacy_phonemes(words), "조회 결과가 다릅니다"
+
+    print("콜드 스타트 (새 프로세스, import + 첫 조회)")
+    baseline = cold_start("pass", args.cold_runs)
+    for name, snippet in COLD_START_SNIPPETS.items():
+        elapsed = cold_start(snippet, args.cold_runs) - baseline
+        print(f"  {name:<12}: {elapsed * 1e3:8.1f} ms")
+
+    def uncached(batch):
+        lexicon.cache_clear()
+        lexicon.phonemes(batch)
+
+    # 반복 단어가 많은 실제 문장 vs 캐시가 도움이 안 되는 서로 다른 단어
+    pronouncing.init_cmu()
+    distinct = sorted(pronouncing.lookup)[::max(1, len(pronouncing.lookup) // args.words)]
+    for title, batch in (("문장 단어", words), ("서로 다른 사전 단어", distinct)):
+        results = {
+            'pronouncing': measure(lambda: legacy_phonemes(batch), args.repeat),
+            'lexicon (LRU)': measure(lambda: lexicon.phonemes(batch), args.repeat),
+            'lexicon (no cache)': measure(lambda: uncached(batch), args.repeat),
+            'lexicon.lookup_many': measure(lambda: lexicon.lookup_many(batch), args.repeat),
+        }
+        print(f"\n{title} {len(batch)}개 조회 (단어당 지연)")
+        for name, timing in results.items():
+            print(f"  {name:<20}: {timing['best'] / len(batch) * 1e6:8.2f} µs")
+
+
+if __name__ == '__main__':
+    main()
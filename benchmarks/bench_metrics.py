@@ -0,0 +1,60 @@
+"""
+지연 시간 계측 오버헤드 벤치마크
+span 하나의 비용(계측 켬/끔)과 전체 분석(full_analysis) 시간에서 계측이 차지하는 비율
+
+실행: python -m benchmarks.bench_metrics
+"""
+
+import argparse
+
+import metrics
+from benchmarks.common import measure, synth_tone
+from pronunciation_analyzer import PronunciationAnalyzer
+
+
+def span_cost(count: int) -> float:
+    """span 하나의 평균 비용 (초, 요청 단위 수집 포함)"""
+    def run():
+        with metrics.collect():
+            for _ in range(count):
+                with metrics.span('bench'):
+                    pass
+    return measure(run, repeat=5)['best'] / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지연 시간 계측 오버헤드 벤치마크")
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--duration', type=float, default=5.0, help="녹음 길이 (초)")
+    parser.add_argument('--spans', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    metrics.enable(False)
+    disabled = span_cost(args.spans)
+    metrics.enable(True)
+    enabled = span_cost(args.spans)
+    print(f"span 1개: 계측 끔 {disabled * 1e6:.2f} µs, 켬 {enabled * 1e6:.2f} µs")
+
+    analyzer = PronunciationAnalyzer(model_size=args.model, preload=True)
+    y = synth_tone(args.duration)
+    reference_text = "The quick brown fox jumps over the lazy dog."
+
+    results = {}
+    for flag in (False, True):
+        metrics.enable(flag)
+        results[flag] = measure(lambda: analyzer.full_analysis(y, reference_text), args.repeat)['best']
+    metrics.enable(True)
+
+    with metrics.collect() as timings:
+        analyzer.full_analysis(y, reference_text)
+    overhead = results[True] - results[False]
+    print(f"full_analysis {args.duration:.0f}초 녹음"
+          + ("" if analyzer.whisper_model is not None else " (Whisper 없음: STT 제외)")
+          + f": 계측 끔 {results[False] * 1e3:.1f} ms, 켬 {results[True] * 1e3:.1f} ms "
+          f"(차이 {overhead * 1e3:+.2f} ms, span {len(timings)}개 ≈ {len(timings) * enabled * 1e3:.3f} ms)")
+    print("단계별 (ms):", metrics.as_ms(timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+긴 지문 분할 벤치마크
+합성 문단 낭독(문장 사이 쉼 + 문장 안 짧은 쉼)에서 문장 경계 대응 정확도와
+분할 시간, full_analysis 대비 passage_analysis 시간
+
+실행: python -m benchmarks.bench_passage
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.common import SAMPLE_RATE, measure, synth_tone
+from passage import align_sentences, split_sentences, syllable_weight
+from pronunciation_analyzer import PronunciationAnalyzer
+from vad import detect_speech
+
+SENTENCES = [
+    "The library opens at nine in the morning.",
+    "Students often gather near the windows to read.",
+    "On rainy days the building becomes very crowded.",
+    "Quiet rooms on the second floor can be reserved online.",
+    "Please return borrowed books before the end of the month.",
+    "Late returns are charged a small fee.",
+]
+
+
+def read_passage(sentences, rng, rate: float = 4.0):
+    """
+    문장마다 음절 수 / rate 초 길이의 합성 발화, 문장 사이 0.4~0.9초 쉼,
+    문장 안에 가끔 0.3초 쉼을 넣은 녹음과 실제 문장 경계(샘플)
+    """
+    noise = lambda seconds: 0.002 * rng.standard_normal(int(seconds * SAMPLE_RATE)).astype(np.float32)
+    pieces, boundaries, position = [noise(0.5)], [], int(0.5 * SAMPLE_RATE)
+    for index, sentence in enumerate(sentences):
+        duration = syllable_weight(sentence) / rate * rng.uniform(0.85, 1.15)
+        if rng.random() < 0.5:
+            first = duration * rng.uniform(0.3, 0.7)
+            parts = [synth_tone(first, seed=index), noise(0.3), synth_tone(duration - first, seed=index)]
+        else:
+            parts = [synth_tone(duration, seed=index)]
+        for part in parts:
+            pieces.append(part)
+            position += len(part)
+        pause = noise(rng.uniform(0.4, 0.9))
+        boundaries.append(position + len(pause) // 2)
+        pieces.append(pause)
+        position += len(pause)
+    return np.concatenate(pieces), boundaries[:-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="긴 지문 분할 벤치마크")
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--trials', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    passage = ' '.join(SENTENCES)
+    sentences = split_sentences(passage)
+
+    errors, merged = [], 0
+    for _ in range(args.trials):
+        y, truth = read_passage(sentences, rng)
+        spans = align_sentences(detect_speech(y), sentences)
+        found = {first: start for first, _, start, _ in spans[1:]}
+        merged += len(sentences) - len(spans)
+        errors.extend(abs(found[b] - truth[b - 1]) / SAMPLE_RATE * 1000
+                      for b in range(1, len(sentences)) if b in found)
+    errors = np.array(errors)
+    print(f"문장 {len(sentences)}개 × {args.trials}회")
+    print(f"  대응된 경계: {len(errors)}/{(len(sentences) - 1) * args.trials} "
+          f"(묶인 경계 {merged}), 위치 오차 중앙값 {np.median(errors):.0f} ms, "
+          f"최대 {errors.max():.0f} ms")
+
+    y, _ = read_passage(sentences, rng)
+    speech = detect_speech(y)
+    seg_time = measure(lambda: align_sentences(speech, sentences), args.repeat)['best']
+    print(f"  녹음 {len(y) / SAMPLE_RATE:.1f}초: VAD {measure(lambda: detect_speech(y), args.repeat)['best'] * 1e3:.1f} ms, "
+          f"문장 대응 {seg_time * 1e3:.2f} ms")
+
+    analyzer = PronunciationAnalyzer(model_size=args.model, preload=True)
+    whole = measure(lambda: analyzer.full_analysis(y, passage), args.repeat)['best']
+    split = measure(lambda: analyzer.passage_analysis(y, passage), args.repeat)['best']
+    print(f"  full_analysis {whole * 1e3:.1f} ms → passage_analysis {split * 1e3:.1f} ms"
+          + ("" if analyzer.whisper_model is not None else " (Whisper 없음: STT 제외)"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+피치 컨투어 추출 벤치마크
+프레임 단위 Python 루프(기존) vs 벡터화 extract_pitch_contour
+
+실행: python -m benchmarks.bench_pitch
+"""
+
+import argparse
+
+import librosa
+import numpy as np
+
+from benchmarks.common import SAMPLE_RATE, measure, synth_tone
+from prosody import extract_pitch_contour
+
+
+def legacy_pitch_loop(pitches: np.ndarray, magnitudes: np.ndarray) -> np.ndarray:
+    """기존 analyze_prosody의 프레임별 루프"""
+    pitch_values = []
+    for t in range(pitches.shape[1]):
+        index = magnitudes[:, t].argmax()
+        pitch = pitches[index, t]
+        if pitch > 0:
+            pitch_values.append(pitch)
+    return np.array(pitch_values, dtype=pitches.dtype)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피치 컨투어 추출 벤치마크")
+    parser.add_argument('--durations', type=float, nargs='+', default=[5, 30, 60],
+                        help="합성 톤 길이 (초)")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'길이(s)':>8} {'프레임':>8} {'루프(ms)':>10} {'벡터(ms)':>10} {'속도향상':>8}")
+    for duration in args.durations:
+        y = synth_tone(duration)
+        pitches, magnitudes = librosa.piptrack(y=y, sr=SAMPLE_RATE)
+
+        expected = legacy_pitch_loop(pitches, magnitudes)
+        actual = extract_pitch_contour(pitches, magnitudes)
+        assert np.array_equal(expected, actual), "벡터화 결과가 기존 루프와 다릅니다"
+
+        loop = measure(lambda: legacy_pitch_loop(pitches, magnitudes), args.repeat)
+        vec = measure(lambda: extract_pitch_contour(pitches, magnitudes), args.repeat)
+        print(f"{duration:>8.0f} {pitches.shape[1]:>8} {loop['best'] * 1e3:>10.2f} "
+              f"{vec['best'] * 1e3:>10.2f} {loop['best'] / vec['best']:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
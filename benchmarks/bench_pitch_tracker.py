@@ -0,0 +1,104 @@
+"""
+피치 추적 벤치마크
+librosa.piptrack / STFT 피크 선택(extract_frame_features 기본값) / YIN(track_pitch_yin)의
+처리 시간, 최대 추가 메모리(tracemalloc), 알려진 F0(합성 톤 160±40 Hz)에 대한 정확도,
+탐색 대역(60~400 Hz) 전체 고정 톤 스윕에서의 옥타브 오류 여부
+
+실행: python -m benchmarks.bench_pitch_tracker
+"""
+
+import argparse
+import tracemalloc
+
+import librosa
+import numpy as np
+
+from benchmarks.common import SAMPLE_RATE, measure, synth_speech, synth_tone, with_noise
+from prosody import YIN_FMAX, YIN_FMIN, extract_frame_features, extract_pitch_contour, track_pitch_yin
+
+HOP_LENGTH = 512
+
+TRACKERS = {
+    'librosa.piptrack': lambda y: extract_pitch_contour(*librosa.piptrack(y=y, sr=SAMPLE_RATE)),
+    'piptrack(단일 STFT)': lambda y: extract_frame_features(y, SAMPLE_RATE).voiced_pitch(),
+    'yin': lambda y: extract_frame_features(y, SAMPLE_RATE, pitch_method='yin').voiced_pitch(),
+    'yin(피치만)': lambda y: track_pitch_yin(y, SAMPLE_RATE, HOP_LENGTH)[0],
+}
+
+
+def peak_memory(func, y: np.ndarray) -> float:
+    """func(y) 실행 중 최대 추가 메모리 (MB, NumPy 배열 포함)"""
+    tracemalloc.start()
+    try:
+        func(y)
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def tone_accuracy(snr_db: float = None):
+    """합성 톤(F0 = 160 + 40·sin(2π·0.3t))에서 YIN의 유성 비율, 중앙 오차, 20% 이상 벗어난 비율"""
+    y = synth_tone(10)
+    if snr_db is not None:
+        y = with_noise(y, snr_db)
+    f0, _ = track_pitch_yin(y, SAMPLE_RATE, HOP_LENGTH)
+    t = np.arange(len(f0)) * HOP_LENGTH / SAMPLE_RATE
+    truth = 160 + 40 * np.sin(2 * np.pi * 0.3 * t)
+    voiced = f0 > 0
+    error = np.abs(f0[voiced] - truth[voiced])
+    return voiced.mean(), np.median(error), np.mean(error > 0.2 * truth[voiced])
+
+
+def sweep_accuracy(f0: float, duration: float = 1.0):
+    """고정 F0 배음 톤에서 YIN의 유성 비율, 중앙 오차, 20% 이상 벗어난 비율 (양끝 프레임 제외)"""
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    phase = 2 * np.pi * f0 * t
+    y = (0.5 * np.sin(phase) + 0.25 * np.sin(2 * phase) + 0.1 * np.sin(3 * phase)).astype(np.float32)
+    f0_track = track_pitch_yin(y, SAMPLE_RATE, HOP_LENGTH)[0][2:-2]
+    voiced = f0_track > 0
+    error = np.abs(f0_track[voiced] - f0)
+    if not voiced.any():
+        return 0.0, float('nan'), 1.0
+    return voiced.mean(), np.median(error), np.mean(error > 0.2 * f0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피치 추적 벤치마크")
+    parser.add_argument('--durations', type=float, nargs='+', default=[5, 30, 120],
+                        help="합성 음성 길이 (초)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--sweep-step', type=float, default=10.0, help="톤 스윕 F0 간격 (Hz)")
+    args = parser.parse_args()
+
+    print(f"{'길이(s)':>8} {'방식':<20} {'시간(ms)':>10} {'메모리(MB)':>11} {'유성 프레임':>10} {'F0 중앙값':>9} {'F0 표준편차':>11}")
+    for duration in args.durations:
+        y = synth_speech(duration, seed=int(duration))
+        for name, tracker in TRACKERS.items():
+            pitch = np.asarray(tracker(y))
+            voiced = pitch[pitch > 0]
+            elapsed = measure(lambda: tracker(y), args.repeat)['best']
+            print(f"{duration:>8.0f} {name:<20} {elapsed * 1e3:>10.2f} {peak_memory(tracker, y):>11.1f} "
+                  f"{len(voiced):>10} {np.median(voiced) if len(voiced) else 0:>9.1f} "
+                  f"{np.std(voiced) if len(voiced) else 0:>11.1f}")
+
+    print("\nYIN 정확도 (합성 톤, 참값 F0 = 160 + 40·sin(2π·0.3t) Hz)")
+    for label, snr_db in (('깨끗함', None), ('SNR 10 dB', 10.0), ('SNR 0 dB', 0.0)):
+        voiced, median_error, gross = tone_accuracy(snr_db)
+        print(f"  {label:<10} 유성 {voiced:.0%}, 중앙 오차 {median_error:.2f} Hz, 20% 이상 오차 {gross:.1%}")
+
+    # 대역 양끝(60, 61, 399, 400 Hz)은 탐색 lag 경계라 옥타브 오류가 나기 쉬우므로 항상 포함
+    sweep = np.union1d(np.arange(YIN_FMIN, YIN_FMAX + 1e-9, args.sweep_step),
+                       [YIN_FMIN, YIN_FMIN + 1, YIN_FMAX - 1, YIN_FMAX])
+    print(f"\nYIN 톤 스윕 ({YIN_FMIN:.0f}~{YIN_FMAX:.0f} Hz, {len(sweep)}개)")
+    print(f"  {'F0(Hz)':>8} {'유성':>6} {'중앙 오차(Hz)':>13} {'20% 이상 오차':>13}")
+    failures = []
+    for f0 in sweep:
+        voiced, median_error, gross = sweep_accuracy(f0)
+        print(f"  {f0:>8.0f} {voiced:>6.0%} {median_error:>13.2f} {gross:>13.1%}")
+        if voiced < 0.9 or gross > 0:
+            failures.append(f"{f0:.0f}")
+    print(f"  실패(유성 90% 미만 또는 옥타브 오류): {', '.join(failures) if failures else '없음'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+연습 문장 저장소 벤치마크
+저장소 로드 시간, 참조 텍스트로 스코어링(참조 음소를 매번 계산) vs sentence_id로
+스코어링(미리 계산한 단어/음소/음소 ID 사용)의 문장당 시간
+
+실행: python -m benchmarks.bench_practice [--data data/practice_sentences.json]
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.bench_alignment import corrupt
+from benchmarks.common import measure
+from phoneme_lexicon import get_lexicon
+from practice_store import PracticeStore
+from pronunciation_analyzer import PronunciationAnalyzer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연습 문장 저장소 벤치마크")
+    parser.add_argument('--data', default='data/practice_sentences.json')
+    parser.add_argument('--error-rate', type=float, default=0.2)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    analyzer = PronunciationAnalyzer()
+    start = time.perf_counter()
+    store = PracticeStore(args.data, analyzer)
+    print(f"저장소 로드: 문장 {len(store)}개, {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    sentences = list(store)
+    spoken = [' '.join(corrupt(sentence.words, args.error_rate, seed=i))
+              for i, sentence in enumerate(sentences)]
+
+    def by_text():
+        for sentence, text in zip(sentences, spoken):
+            analyzer.calculate_pronunciation_score(sentence.text, text)
+
+    def by_id():
+        for sentence, text in zip(sentences, spoken):
+            analyzer.calculate_pronunciation_score(sentence.text, text, reference=sentence)
+
+    for sentence, text in zip(sentences, spoken):
+        assert (analyzer.calculate_pronunciation_score(sentence.text, text)
+                == analyzer.calculate_pronunciation_score(sentence.text, text, reference=sentence))
+
+    # warm: 렉시콘 단어 LRU가 데워진 상태 (서버 정상 상태), cold: 요청마다 LRU를 비움
+    lexicon = get_lexicon()
+    for label, prepare in (('warm', lambda: None), ('cold', lexicon.cache_clear)):
+        text_time = measure(lambda: (prepare(), by_text()), args.repeat)['best'] / len(sentences)
+        id_time = measure(lambda: (prepare(), by_id()), args.repeat)['best'] / len(sentences)
+        print(f"문장당 스코어링({label}): reference_text {text_time * 1e6:.0f} µs → "
+              f"sentence_id {id_time * 1e6:.0f} µs ({text_time / id_time:.2f}배)")
+
+    lookups = [random.Random(0).choice(sentences).id for _ in range(10000)]
+    lookup_time = measure(lambda: [store.get(sentence_id) for sentence_id in lookups],
+                          args.repeat)['best'] / len(lookups)
+    print(f"문장 조회: {lookup_time * 1e9:.0f} ns")
+
+
+if __name__ == '__main__':
+    main()
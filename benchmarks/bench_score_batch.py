@@ -0,0 +1,69 @@
+"""
+대량 텍스트 스코어링 벤치마크
+쌍마다 /api/score 호출(기존) vs /api/score/batch 한 번 (Flask 테스트 클라이언트, inline 백엔드)
+
+실행: python -m benchmarks.bench_score_batch
+"""
+
+import argparse
+import json
+import os
+import random
+
+from benchmarks.bench_lexicon import PASSAGE
+from benchmarks.common import measure
+
+os.environ.setdefault('WHISPER_WARMUP', 'false')
+
+
+def make_pairs(count: int, references: int, seed: int = 0):
+    """참조 문장 몇 개를 여러 번 채점하는 야간 재채점 형태의 입력"""
+    rng = random.Random(seed)
+    sentences = [' '.join(rng.sample(PASSAGE, 10)) for _ in range(references)]
+    pairs = []
+    for _ in range(count):
+        reference = rng.choice(sentences)
+        spoken = [w for w in reference.split() if rng.random() > 0.1]
+        pairs.append({'reference_text': reference, 'spoken_text': ' '.join(spoken)})
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대량 텍스트 스코어링 벤치마크")
+    parser.add_argument('--pairs', type=int, default=2000)
+    parser.add_argument('--references', type=int, default=50, help="서로 다른 참조 문장 수")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    from api import analyzer, app
+
+    client = app.test_client()
+    pairs = make_pairs(args.pairs, args.references)
+    ndjson = ''.join(json.dumps(pair) + '\n' for pair in pairs)
+    tuples = [(p['reference_text'], p['spoken_text']) for p in pairs]
+
+    def per_request():
+        for pair in pairs:
+            client.post('/api/score', json=pair).get_json()
+
+    def batch_json():
+        client.post('/api/score/batch', json={'pairs': pairs}).get_data()
+
+    def batch_ndjson():
+        client.post('/api/score/batch', data=ndjson, content_type='application/x-ndjson').get_data()
+
+    results = {
+        '/api/score x N': measure(per_request, args.repeat),
+        '/api/score/batch (JSON)': measure(batch_json, args.repeat),
+        '/api/score/batch (NDJSON)': measure(batch_ndjson, args.repeat),
+        'calculate_pronunciation_score': measure(
+            lambda: [analyzer.calculate_pronunciation_score(r, s) for r, s in tuples], args.repeat),
+        'score_many': measure(lambda: list(analyzer.score_many(tuples)), args.repeat),
+    }
+    print(f"{args.pairs}쌍 (참조 문장 {args.references}개) 처리 시간")
+    for name, timing in results.items():
+        print(f"  {name:<30}: {timing['best'] * 1e3:9.1f} ms  ({timing['best'] / args.pairs * 1e6:7.1f} µs/쌍)")
+
+
+if __name__ == '__main__':
+    main()
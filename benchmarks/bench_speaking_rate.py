@@ -0,0 +1,55 @@
+"""
+말하기 속도 추정 벤치마크
+librosa.beat.beat_track(기존) vs 음절핵 검출 estimate_syllable_rate
+
+실행: python -m benchmarks.bench_speaking_rate
+"""
+
+import argparse
+import sys
+
+import librosa
+import numpy as np
+
+from benchmarks.common import SAMPLE_RATE, measure, synth_tone
+from prosody import estimate_syllable_rate
+
+# 요구 속도 향상 배수
+MIN_SPEEDUP = 10.0
+
+
+def legacy_speaking_rate(y, sr):
+    """기존 analyze_prosody의 beat_track 기반 추정"""
+    tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
+    return float(np.atleast_1d(tempo)[0]) / 60.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="말하기 속도 추정 벤치마크")
+    parser.add_argument('--duration', type=float, default=30.0, help="합성 음성 길이 (초)")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # 합성 음성은 초당 4음절로 진폭 변조됨
+    y = synth_tone(args.duration)
+
+    legacy = measure(lambda: legacy_speaking_rate(y, SAMPLE_RATE), args.repeat)
+    engine = measure(lambda: estimate_syllable_rate(y, SAMPLE_RATE), args.repeat)
+    speedup = legacy['best'] / engine['best']
+
+    rate = estimate_syllable_rate(y, SAMPLE_RATE)
+    print(f"길이: {args.duration:.0f}s (정답 4.0 음절/초)")
+    print(f"beat_track        : {legacy['best'] * 1e3:8.1f} ms  "
+          f"→ {legacy_speaking_rate(y, SAMPLE_RATE):.2f} /s")
+    print(f"syllable detector : {engine['best'] * 1e3:8.1f} ms  "
+          f"→ {rate['speaking_rate']:.2f} 음절/초 "
+          f"(조음 속도 {rate['articulation_rate']:.2f})")
+    print(f"속도 향상: {speedup:.1f}x (기준 {MIN_SPEEDUP:.0f}x)")
+
+    if speedup < MIN_SPEEDUP:
+        print("❌ 속도 향상 기준 미달")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+스트리밍 분석 벤치마크
+실시간 속도로 PCM 청크를 흘려 넣었을 때 첫 피드백까지 시간(TTFF) vs
+녹음이 끝난 뒤 full_analysis를 호출하는 기존 방식의 결과 대기 시간
+
+실행: python -m benchmarks.bench_streaming
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.common import SAMPLE_RATE, synth_tone
+from pronunciation_analyzer import PronunciationAnalyzer
+from streaming import StreamingSession
+
+REFERENCE = "I have been thinking about trying that new restaurant downtown"
+
+
+def make_utterance(speech_s: float, pause_s: float, seed: int = 0) -> np.ndarray:
+    """묵음 - 발화 - 쉼 - 발화 - 묵음 형태의 합성 녹음"""
+    rng = np.random.default_rng(seed)
+    silence = lambda s: 0.001 * rng.standard_normal(int(s * SAMPLE_RATE)).astype(np.float32)
+    half = speech_s / 2
+    return np.concatenate([silence(0.5), synth_tone(half, seed=seed), silence(pause_s),
+                           synth_tone(half, seed=seed + 1), silence(0.8)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 분석 벤치마크")
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--speech', type=float, default=8.0, help="발화 길이 (초)")
+    parser.add_argument('--chunk-ms', type=float, default=100.0)
+    parser.add_argument('--step-ms', type=float, nargs='+', default=[500.0, 1000.0, 2000.0])
+    parser.add_argument('--realtime', action='store_true', help="청크를 실제 시간 간격으로 전송")
+    args = parser.parse_args()
+
+    analyzer = PronunciationAnalyzer(model_size=args.model, preload=True)
+    audio = make_utterance(args.speech, pause_s=0.8)
+    pcm = (audio * 32767).astype('<i2').tobytes()
+    chunk_bytes = int(SAMPLE_RATE * args.chunk_ms / 1000) * 2
+    analyzer.full_analysis(audio[:SAMPLE_RATE], REFERENCE)  # 워밍업
+
+    start = time.perf_counter()
+    analyzer.full_analysis(audio, REFERENCE)
+    batch_wait = time.perf_counter() - start
+    print(f"녹음 {len(audio) / SAMPLE_RATE:.1f}초, 청크 {args.chunk_ms:.0f} ms")
+    print(f"  기존 (녹음 종료 후 full_analysis) 결과 대기: {batch_wait * 1e3:8.1f} ms"
+          f" (+ 녹음 시간 {len(audio) / SAMPLE_RATE * 1e3:.0f} ms)")
+
+    for step_ms in args.step_ms:
+        session = StreamingSession(analyzer, REFERENCE, step_ms=step_ms)
+        for i in range(0, len(pcm), chunk_bytes):
+            sent = time.perf_counter()
+            session.feed(pcm[i:i + chunk_bytes])
+            if args.realtime:
+                time.sleep(max(0.0, args.chunk_ms / 1000 - (time.perf_counter() - sent)))
+        end = time.perf_counter()
+        final = session.finish()
+        metrics = final['metrics']
+        print(f"  스트리밍 step {step_ms:6.0f} ms: TTFF {metrics['time_to_first_feedback_ms']} ms,"
+              f" 종료 후 대기 {(time.perf_counter() - end) * 1e3:8.1f} ms,"
+              f" 인식 {metrics['transcribe_calls']}회 (RTF {metrics['real_time_factor']})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+블록 단위 운율 분석 벤치마크
+analyze_prosody 전체 한 번 vs 블록 단위(prosody_block_s)의 처리 시간, 최대 추가 메모리(tracemalloc), 결과 차이
+- 메모리: 16 kHz 파형을 이미 디코딩한 경우 (full_analysis와 같은 조건)
+- 파일: 48 kHz WAV 경로를 넘긴 경우 (전체 디코딩 vs 블록 디코딩)
+
+실행: python -m benchmarks.bench_streaming_prosody
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import soundfile as sf
+
+from audio_io import resample
+from benchmarks.common import SAMPLE_RATE, synth_speech
+from pronunciation_analyzer import PronunciationAnalyzer
+
+FILE_SAMPLE_RATE = 48000
+
+
+def profile(func):
+    """(결과, 시간 초, 최대 추가 메모리 MB)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func()
+        return result, time.perf_counter() - start, tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def difference(batch: dict, streamed: dict) -> str:
+    keys = ('speaking_rate', 'articulation_rate', 'pitch_variation', 'energy_variation')
+    return ', '.join(f"{key} {streamed[key] - batch[key]:+g}" for key in keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블록 단위 운율 분석 벤치마크")
+    parser.add_argument('--durations', type=float, nargs='+', default=[60, 300, 600],
+                        help="합성 음성 길이 (초)")
+    parser.add_argument('--block', type=float, default=30.0, help="블록 길이 (초)")
+    parser.add_argument('--pitch', default='piptrack', choices=['piptrack', 'yin'])
+    args = parser.parse_args()
+
+    whole = PronunciationAnalyzer(vad_trim=False, pitch_method=args.pitch)
+    blocks = PronunciationAnalyzer(vad_trim=False, pitch_method=args.pitch, prosody_block_s=args.block)
+
+    print(f"{'입력':<6} {'길이(s)':>8} {'전체(ms)':>10} {'전체(MB)':>10} {'블록(ms)':>10} {'블록(MB)':>10}  블록 - 전체")
+    for duration in args.durations:
+        y = synth_speech(duration, seed=int(duration))
+        batch, batch_time, batch_memory = profile(lambda: whole.analyze_prosody(y))
+        streamed, stream_time, stream_memory = profile(lambda: blocks.analyze_prosody(y))
+        print(f"{'메모리':<6} {duration:>8.0f} {batch_time * 1e3:>10.0f} {batch_memory:>10.1f} "
+              f"{stream_time * 1e3:>10.0f} {stream_memory:>10.1f}  {difference(batch, streamed)}")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'long.wav')
+            sf.write(path, resample(y, SAMPLE_RATE, FILE_SAMPLE_RATE), FILE_SAMPLE_RATE, subtype='PCM_16')
+            del y
+            batch, batch_time, batch_memory = profile(lambda: whole.analyze_prosody(path))
+            streamed, stream_time, stream_memory = profile(lambda: blocks.analyze_prosody(path))
+        print(f"{'파일':<6} {duration:>8.0f} {batch_time * 1e3:>10.0f} {batch_memory:>10.1f} "
+              f"{stream_time * 1e3:>10.0f} {stream_memory:>10.1f}  {difference(batch, streamed)}")
+
+
+if __name__ == '__main__':
+    main()
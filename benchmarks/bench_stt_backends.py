@@ -0,0 +1,113 @@
+"""
+STT 백엔드 벤치마크
+로컬 녹음 모음에서 백엔드별(기본 torch fp32 vs int8 동적 양자화) 인식 지연 시간,
+RTF(처리 시간 / 녹음 길이), fp32 인식 결과와의 일치도(단어 오류율)를 비교
+
+녹음 모음: 디렉터리의 오디오 파일 (같은 이름의 .txt가 있으면 정답 텍스트로 WER도 계산)
+없으면 합성 톤으로 지연 시간만 의미 있게 측정
+
+실행: python -m benchmarks.bench_stt_backends --fixtures <디렉터리> [--threads 4]
+"""
+
+import argparse
+import os
+import re
+import time
+
+import numpy as np
+
+from alignment import align_tokens
+from audio_io import as_audio
+from benchmarks.common import SAMPLE_RATE, measure, synth_tone
+from pronunciation_analyzer import WHISPER_AVAILABLE, PronunciationAnalyzer
+from stt_backends import available_backends
+
+AUDIO_EXTENSIONS = ('.wav', '.flac', '.mp3', '.m4a', '.ogg', '.webm')
+
+
+def load_fixtures(directory):
+    """(이름, 16 kHz 파형, 정답 텍스트 또는 None) 목록"""
+    if not directory or not os.path.isdir(directory):
+        return [(f"synth-{seconds}s", synth_tone(seconds, seed=seconds), None)
+                for seconds in (2, 5, 10, 20)]
+
+    fixtures = []
+    for name in sorted(os.listdir(directory)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in AUDIO_EXTENSIONS:
+            continue
+        reference = None
+        text_path = os.path.join(directory, stem + '.txt')
+        if os.path.exists(text_path):
+            with open(text_path, encoding='utf-8') as f:
+                reference = f.read()
+        fixtures.append((name, as_audio(os.path.join(directory, name)).samples, reference))
+    return fixtures
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """단어 오류율 (편집 거리 / 정답 단어 수)"""
+    ref = re.findall(r'\w+', reference.lower())
+    hyp = re.findall(r'\w+', hypothesis.lower())
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    return align_tokens(ref, hyp).distance / len(ref)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="STT 백엔드 벤치마크")
+    parser.add_argument('--fixtures', default=None, help="녹음 모음 디렉터리")
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--backends', nargs='+', default=['torch', 'int8'],
+                        choices=available_backends())
+    parser.add_argument('--threads', type=int, default=0, help="추론 스레드 수 (0=torch 기본값)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if not WHISPER_AVAILABLE:
+        print("Whisper가 설치되어 있지 않아 측정할 수 없습니다")
+        return
+
+    fixtures = load_fixtures(args.fixtures)
+    total_audio = sum(len(samples) for _, samples, _ in fixtures) / SAMPLE_RATE
+    print(f"녹음 {len(fixtures)}개, 총 {total_audio:.1f}초"
+          + ("" if args.fixtures else " (합성 톤: 일치도/WER은 의미 없음)"))
+
+    baseline = None
+    for backend in args.backends:
+        start = time.perf_counter()
+        analyzer = PronunciationAnalyzer(model_size=args.model, preload=True,
+                                         stt_backend=backend, stt_threads=args.threads)
+        load_time = time.perf_counter() - start
+        if analyzer.whisper_model is None:
+            print(f"[{backend}] 모델 로드 실패")
+            continue
+
+        texts, latencies, rtfs = [], [], []
+        for _, samples, _ in fixtures:
+            latency = measure(lambda: analyzer.transcribe_audio(samples), args.repeat)['best']
+            texts.append(analyzer.transcribe_audio(samples))
+            latencies.append(latency)
+            rtfs.append(latency / (len(samples) / SAMPLE_RATE))
+
+        print(f"[{backend}] 로드 {load_time:.1f}초, 지연 평균 {np.mean(latencies) * 1e3:.0f} ms, "
+              f"RTF 중앙값 {np.median(rtfs):.3f} (전체 {sum(latencies) / total_audio:.3f})")
+
+        references = [(reference, text) for (_, _, reference), text in zip(fixtures, texts)
+                      if reference is not None]
+        if references:
+            wer = np.mean([word_error_rate(reference, text) for reference, text in references])
+            print(f"  정답 대비 WER {wer * 100:.1f}% ({len(references)}개)")
+
+        if baseline is None:
+            baseline = (backend, texts, latencies)
+            continue
+        base_name, base_texts, base_latencies = baseline
+        agreement = [word_error_rate(base, text) for base, text in zip(base_texts, texts)]
+        same = sum(1 for base, text in zip(base_texts, texts) if base == text)
+        print(f"  {base_name} 대비: 속도 {sum(base_latencies) / sum(latencies):.2f}배, "
+              f"인식 결과 동일 {same}/{len(texts)}, 단어 불일치율 {np.mean(agreement) * 100:.1f}%")
+
+
+if __name__ == '__main__':
+    main()
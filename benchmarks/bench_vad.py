@@ -0,0 +1,52 @@
+"""
+VAD 묵음 제거 벤치마크
+앞뒤 묵음 비율별 STT/운율 분석 시간 (vad_trim 끔 vs 켬)
+
+실행: python -m benchmarks.bench_vad
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.common import SAMPLE_RATE, measure, synth_tone
+from pronunciation_analyzer import PronunciationAnalyzer
+from vad import detect_speech
+
+
+def padded_utterance(speech_s: float, silence_s: float, seed: int = 0) -> np.ndarray:
+    """발화 앞뒤로 silence_s초씩 약한 잡음을 붙인 녹음"""
+    rng = np.random.default_rng(seed)
+    silence = 0.002 * rng.standard_normal(int(silence_s * SAMPLE_RATE)).astype(np.float32)
+    return np.concatenate([silence, synth_tone(speech_s, seed=seed), silence])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VAD 묵음 제거 벤치마크")
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--speech', type=float, default=5.0, help="발화 길이 (초)")
+    parser.add_argument('--silence', type=float, nargs='+', default=[0.0, 2.0, 5.0, 15.0],
+                        help="앞뒤 묵음 길이 (초, 각각)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    plain = PronunciationAnalyzer(model_size=args.model, vad_trim=False, preload=True)
+    trimmed = PronunciationAnalyzer(model_size=args.model, vad_trim=True)
+    stages = {'prosody': 'analyze_prosody'}
+    if plain.whisper_model is not None:
+        stages['stt'] = 'transcribe_audio'
+
+    print(f"발화 {args.speech:.1f}초 (ms, vad_trim 끔 → 켬)")
+    for silence_s in args.silence:
+        y = padded_utterance(args.speech, silence_s)
+        vad_time = measure(lambda: detect_speech(y), args.repeat)['best']
+        line = f"  앞뒤 묵음 {silence_s:5.1f}초 (VAD {vad_time * 1e3:5.1f}):"
+        for name, method in stages.items():
+            before = measure(lambda: getattr(plain, method)(y), args.repeat)['best']
+            after = measure(lambda: getattr(trimmed, method)(y), args.repeat)['best']
+            line += f"  {name} {before * 1e3:8.1f} → {after * 1e3:8.1f}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
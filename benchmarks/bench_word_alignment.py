@@ -0,0 +1,56 @@
+"""
+단어 정렬 스코어링 벤치마크
+기존 위치 비교(ref_words[i] vs spoken_words[i]) vs 단어 ID 정렬의 정확도와 지문 길이별 지연 시간
+
+실행: python -m benchmarks.bench_word_alignment [--budget-ms 100]
+"""
+
+import argparse
+
+from alignment import DEFAULT_BAND, align_tokens
+from benchmarks.bench_alignment import corrupt
+from benchmarks.bench_lexicon import PASSAGE
+from benchmarks.common import measure
+from pronunciation_analyzer import PronunciationAnalyzer
+
+
+def positional_matches(ref_words, spoken_words):
+    """기존 calculate_pronunciation_score의 위치 비교 일치 수"""
+    return sum(1 for ref, spoken in zip(ref_words, spoken_words) if ref == spoken)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="단어 정렬 스코어링 벤치마크")
+    parser.add_argument('--words', type=int, nargs='+', default=[20, 200, 1000, 5000],
+                        help="지문 길이 (단어 수)")
+    parser.add_argument('--error-rate', type=float, default=0.1)
+    parser.add_argument('--budget-ms', type=float, default=100.0,
+                        help="가장 긴 지문의 단어 정렬 지연 예산 (ms)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    analyzer = PronunciationAnalyzer()
+    print(f"{'단어':>6} | {'정확도(위치)':>10} {'정확도(정렬)':>10} | {'정렬':>9} {'밴드 정렬':>10}"
+          f" {'전체 스코어':>11}")
+    for num_words in args.words:
+        ref = (PASSAGE * (num_words // len(PASSAGE) + 1))[:num_words]
+        # 앞부분 한 단어 누락 + 무작위 인식 오류
+        spoken = corrupt(ref[1:], args.error_rate, seed=num_words)
+        ref_text, spoken_text = ' '.join(ref), ' '.join(spoken)
+
+        exact = measure(lambda: analyzer.align_words(ref, spoken), args.repeat)
+        banded = measure(lambda: align_tokens(ref, spoken, band=DEFAULT_BAND), args.repeat)
+        full = measure(lambda: analyzer.calculate_pronunciation_score(ref_text, spoken_text),
+                       args.repeat)
+        matches, _ = analyzer.align_words(ref, spoken)
+
+        print(f"{num_words:>6} | {positional_matches(ref, spoken) / num_words * 100:>9.1f}%"
+              f" {matches / num_words * 100:>9.1f}% | {exact['best'] * 1e3:>6.2f} ms"
+              f" {banded['best'] * 1e3:>7.2f} ms {full['best'] * 1e3:>8.1f} ms")
+
+    verdict = "통과" if exact['best'] * 1e3 <= args.budget_ms else "초과"
+    print(f"{args.words[-1]}단어 정렬 {exact['best'] * 1e3:.1f} ms / 예산 {args.budget_ms:.0f} ms → {verdict}")
+
+
+if __name__ == '__main__':
+    main()
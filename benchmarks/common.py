@@ -0,0 +1,131 @@
+"""
+벤치마크 공통 유틸리티
+합성 오디오 생성 (톤, 포먼트 합성 음성 유사 신호, 잡음), 반복 측정
+"""
+
+import io
+import time
+import wave
+from typing import Callable, Dict
+
+import numpy as np
+from scipy.signal import lfilter
+
+SAMPLE_RATE = 16000
+
+
+def synth_tone(duration: float, sr: int = SAMPLE_RATE, seed: int = 0) -> np.ndarray:
+    """
+    음성 유사 합성 톤 생성 (피치 글라이드 + 음절 단위 진폭 변조 + 약한 잡음)
+    Args:
+        duration: 길이 (초)
+        sr: 샘플링 레이트
+        seed: 잡음 시드
+    Returns:
+        float32 파형
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * sr)) / sr
+    f0 = 160 + 40 * np.sin(2 * np.pi * 0.3 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sr
+    y = 0.5 * np.sin(phase) + 0.25 * np.sin(2 * phase) + 0.1 * np.sin(3 * phase)
+    envelope = 0.5 * (1 - np.cos(2 * np.pi * 4 * t))  # 초당 4음절
+    y = y * envelope + 0.005 * rng.standard_normal(len(t))
+    return y.astype(np.float32)
+
+
+# 모음 포먼트 (F1, F2, F3 Hz): /a/ /i/ /u/ /e/ /o/
+VOWEL_FORMANTS = ((730, 1090, 2440), (270, 2290, 3010), (300, 870, 2240),
+                  (530, 1840, 2480), (570, 840, 2410))
+FORMANT_BANDWIDTHS = (80, 100, 120)
+
+
+def _resonator(signal: np.ndarray, freq: float, bandwidth: float, sr: int) -> np.ndarray:
+    """2차 공진기 (Klatt 포먼트 필터)"""
+    r = np.exp(-np.pi * bandwidth / sr)
+    a1, a2 = -2 * r * np.cos(2 * np.pi * freq / sr), r * r
+    return lfilter([1 + a1 + a2], [1, a1, a2], signal)
+
+
+def synth_speech(duration: float, sr: int = SAMPLE_RATE, seed: int = 0) -> np.ndarray:
+    """
+    포먼트 합성 음성 유사 신호 (TTS 없이 재현 가능)
+    성문 펄스열(피치 변화 + 지터) → 음절마다 모음 포먼트 필터, 3~6음절마다 0.3~0.6초 쉼
+    Args:
+        duration: 길이 (초)
+        sr: 샘플링 레이트
+        seed: 음절 모음/길이/쉼 시드
+    Returns:
+        float32 파형 (최대 진폭 약 0.5)
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration * sr)
+    y = np.zeros(total, dtype=np.float64)
+    pos, syllables = int(0.2 * sr), 0
+    phrase = rng.integers(3, 7)
+    while pos < total:
+        length = int(rng.uniform(0.15, 0.3) * sr)
+        end = min(total, pos + length)
+        t = np.arange(end - pos) / sr
+        # 음절 안에서 내려가는 피치 + 지터로 성문 펄스 위치 결정
+        f0 = rng.uniform(110, 200) * (1 - 0.15 * t / max(t[-1], 1e-3)) if len(t) else t
+        phase = np.cumsum(f0 * (1 + 0.01 * rng.standard_normal(len(t)))) / sr
+        source = np.diff(np.floor(phase), prepend=0.0) + 0.02 * rng.standard_normal(len(t))
+        voiced = source
+        for freq, bandwidth in zip(VOWEL_FORMANTS[rng.integers(len(VOWEL_FORMANTS))], FORMANT_BANDWIDTHS):
+            voiced = voiced + _resonator(source, freq, bandwidth, sr)
+        y[pos:end] = voiced * np.hanning(len(t))
+        pos = end
+        syllables += 1
+        if syllables == phrase:
+            pos += int(rng.uniform(0.3, 0.6) * sr)
+            syllables, phrase = 0, rng.integers(3, 7)
+    y += 0.001 * rng.standard_normal(total)
+    return (0.5 * y / max(np.abs(y).max(), 1e-9)).astype(np.float32)
+
+
+def synth_noise(duration: float, sr: int = SAMPLE_RATE, seed: int = 0, level: float = 0.05) -> np.ndarray:
+    """핑크 잡음 (발화 없음 경로 측정용)"""
+    rng = np.random.default_rng(seed)
+    spectrum = np.fft.rfft(rng.standard_normal(int(duration * sr)))
+    spectrum /= np.sqrt(np.maximum(np.arange(len(spectrum)), 1))
+    y = np.fft.irfft(spectrum, int(duration * sr))
+    return (level * y / max(np.abs(y).max(), 1e-9)).astype(np.float32)
+
+
+def with_noise(y: np.ndarray, snr_db: float, seed: int = 0) -> np.ndarray:
+    """신호 대 잡음비 snr_db의 백색 잡음 추가"""
+    rng = np.random.default_rng(seed)
+    noise_power = np.mean(y.astype(np.float64) ** 2) / 10 ** (snr_db / 10)
+    return (y + np.sqrt(noise_power) * rng.standard_normal(len(y))).astype(np.float32)
+
+
+def wav_bytes(y: np.ndarray, sr: int = SAMPLE_RATE) -> bytes:
+    """16비트 PCM WAV 인코딩 (업로드 요청용)"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sr)
+        f.writeframes((np.clip(y, -1, 1) * 32767).astype(np.int16).tobytes())
+    return buffer.getvalue()
+
+
+def measure(func: Callable, repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """
+    함수 실행 시간 측정
+    Args:
+        func: 인자 없는 호출 대상
+        repeat: 측정 반복 횟수
+        warmup: 워밍업 횟수
+    Returns:
+        best/mean 실행 시간 (초)
+    """
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {'best': min(times), 'mean': sum(times) / len(times)}
@@ -0,0 +1,253 @@
+"""
+전체 파이프라인 벤치마크 모음
+재현 가능한 합성 녹음(톤, 포먼트 합성, 잡음 섞인 포먼트 합성, 잡음만)을 길이별로 만들어
+PronunciationAnalyzer 메서드와 Flask 엔드포인트(테스트 클라이언트)의 처리량과 p50/p95/p99 지연 시간을 측정하고,
+JSON 기준값으로 저장하거나 기준값과 비교해 임계치를 넘는 회귀가 있으면 종료 코드 1로 실패
+
+실행:
+    python -m benchmarks.suite --save benchmarks/baselines/local.json
+    python -m benchmarks.suite --compare benchmarks/baselines/local.json [--threshold 0.2]
+    python -m benchmarks.suite --cases analyzer.full_analysis api.score --durations 2 5
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.common import SAMPLE_RATE, synth_noise, synth_speech, synth_tone, wav_bytes, with_noise
+
+FORMAT_VERSION = 1
+
+REFERENCE_TEXT = "The quick brown fox jumps over the lazy dog."
+SPOKEN_TEXT = "the quick brown fox jump over a lazy dog"
+PASSAGE_TEXT = ("I usually wake up at seven. Then I make a cup of coffee. "
+                "After breakfast I walk to the station. The train is often late.")
+
+FIXTURES = {
+    'tone': lambda duration, seed: synth_tone(duration, seed=seed),
+    'formant': lambda duration, seed: synth_speech(duration, seed=seed),
+    'noisy': lambda duration, seed: with_noise(synth_speech(duration, seed=seed), snr_db=10, seed=seed),
+    'noise': lambda duration, seed: synth_noise(duration, seed=seed),
+}
+
+
+def make_fixtures(durations: List[float], seed: int = 0) -> Dict[str, np.ndarray]:
+    """'종류-길이s' → 16 kHz 파형 (시드가 같으면 항상 같은 파형)"""
+    return {f"{kind}-{duration:g}s": make(duration, seed)
+            for kind, make in FIXTURES.items() for duration in durations}
+
+
+def fixture_digest(fixtures: Dict[str, np.ndarray]) -> str:
+    """녹음 모음 해시 (기준값과 같은 입력인지 확인)"""
+    h = hashlib.sha256()
+    for name in sorted(fixtures):
+        h.update(name.encode())
+        h.update(fixtures[name].tobytes())
+    return h.hexdigest()[:16]
+
+
+def latency_stats(times: List[float], audio_s: Optional[float] = None) -> Dict[str, float]:
+    """반복 측정 시간(초) → 처리량과 지연 시간 분위수 (ms)"""
+    ms = np.asarray(times) * 1e3
+    stats = {
+        'n': len(times),
+        'throughput': round(len(times) / sum(times), 2),
+        'mean_ms': round(float(ms.mean()), 3),
+        'p50_ms': round(float(np.percentile(ms, 50)), 3),
+        'p95_ms': round(float(np.percentile(ms, 95)), 3),
+        'p99_ms': round(float(np.percentile(ms, 99)), 3),
+    }
+    if audio_s:
+        stats['rtf'] = round(stats['p50_ms'] / 1e3 / audio_s, 4)
+    return stats
+
+
+def run_case(func: Callable, repeat: int, warmup: int, audio_s: Optional[float] = None) -> Dict[str, float]:
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return latency_stats(times, audio_s)
+
+
+def analyzer_cases(analyzer, fixtures: Dict[str, np.ndarray], whisper: bool) -> Dict[str, tuple]:
+    """PronunciationAnalyzer 메서드 측정 대상: 이름 → (호출, 녹음 길이 또는 None)"""
+    cases = {
+        'analyzer.get_phonemes': (lambda: analyzer.get_phonemes(PASSAGE_TEXT), None),
+        'analyzer.calculate_pronunciation_score':
+            (lambda: analyzer.calculate_pronunciation_score(REFERENCE_TEXT, SPOKEN_TEXT), None),
+    }
+    scored = analyzer.calculate_pronunciation_score(REFERENCE_TEXT, SPOKEN_TEXT)
+    cases['analyzer.generate_feedback'] = (lambda: analyzer.generate_feedback(scored), None)
+
+    for name, y in fixtures.items():
+        audio_s = len(y) / SAMPLE_RATE
+        cases[f'analyzer.speech_activity[{name}]'] = (lambda y=y: analyzer.speech_activity(y), audio_s)
+        cases[f'analyzer.analyze_prosody[{name}]'] = (lambda y=y: analyzer.analyze_prosody(y), audio_s)
+        if whisper:
+            cases[f'analyzer.transcribe_audio[{name}]'] = (lambda y=y: analyzer.transcribe_audio(y), audio_s)
+        cases[f'analyzer.full_analysis[{name}]'] = \
+            (lambda y=y: analyzer.full_analysis(y, REFERENCE_TEXT), audio_s)
+        cases[f'analyzer.passage_analysis[{name}]'] = \
+            (lambda y=y: analyzer.passage_analysis(y, PASSAGE_TEXT), audio_s)
+    return cases
+
+
+def api_cases(client, fixtures: Dict[str, np.ndarray]) -> Dict[str, tuple]:
+    """Flask 엔드포인트 측정 대상 (테스트 클라이언트, 업로드는 포먼트 합성 녹음만)"""
+    import io
+
+    def post_audio(path, data, extra):
+        response = client.post(path, data={'audio': (io.BytesIO(data), 'clip.wav'), **extra})
+        assert response.status_code == 200, response.get_data(as_text=True)[:200]
+
+    def post_json(path, body):
+        response = client.post(path, json=body)
+        assert response.status_code == 200, response.get_data(as_text=True)[:200]
+        response.get_data()
+
+    pairs = [{'reference_text': REFERENCE_TEXT, 'spoken_text': SPOKEN_TEXT, 'id': i} for i in range(100)]
+    cases = {
+        'api.score': (lambda: post_json('/api/score', {'reference_text': REFERENCE_TEXT,
+                                                       'spoken_text': SPOKEN_TEXT}), None),
+        'api.phonemes': (lambda: post_json('/api/phonemes', {'text': PASSAGE_TEXT}), None),
+        'api.score_batch[100]': (lambda: post_json('/api/score/batch', {'pairs': pairs}), None),
+    }
+    for name, y in fixtures.items():
+        if not name.startswith('formant-'):
+            continue
+        data, audio_s = wav_bytes(y), len(y) / SAMPLE_RATE
+        cases[f'api.analyze[{name}]'] = \
+            (lambda data=data: post_audio('/api/analyze', data, {'reference_text': REFERENCE_TEXT}), audio_s)
+        cases[f'api.transcribe[{name}]'] = (lambda data=data: post_audio('/api/transcribe', data, {}), audio_s)
+    return cases
+
+
+def environment() -> Dict:
+    """측정 환경 (기준값과 비교할 때 다르면 경고)"""
+    from pronunciation_analyzer import WHISPER_AVAILABLE
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'whisper': WHISPER_AVAILABLE,
+    }
+
+
+def compare(results: Dict, baseline: Dict, metric: str, threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    기준값 대비 회귀 검사
+    Args:
+        metric: 비교할 지연 시간 (p50_ms/p95_ms/p99_ms)
+        threshold: 허용 증가율 (0.2 = 20%)
+        min_delta_ms: 이보다 작은 절대 증가는 측정 잡음으로 보고 무시
+    Returns:
+        회귀한 측정 대상 이름 목록
+    """
+    regressions = []
+    print(f"\n{'측정 대상':<52} {'기준':>10} {'현재':>10} {'변화':>8}")
+    for name, stats in results['cases'].items():
+        base = baseline['cases'].get(name)
+        if base is None:
+            print(f"{name:<52} {'-':>10} {stats[metric]:>10.2f} {'신규':>8}")
+            continue
+        before, after = base[metric], stats[metric]
+        change = after / before - 1 if before > 0 else 0.0
+        regressed = change > threshold and after - before > min_delta_ms
+        mark = '  ← 회귀' if regressed else ''
+        print(f"{name:<52} {before:>10.2f} {after:>10.2f} {change * 100:>+7.1f}%{mark}")
+        if regressed:
+            regressions.append(name)
+    missing = sorted(set(baseline['cases']) - set(results['cases']))
+    if missing:
+        print(f"기준값에만 있는 측정 대상 {len(missing)}개 (이번 실행에서 제외됨)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 파이프라인 벤치마크 모음")
+    parser.add_argument('--durations', type=float, nargs='+', default=[2.0, 5.0, 15.0], help="녹음 길이 (초)")
+    parser.add_argument('--cases', nargs='+', default=['*'],
+                        help="측정 대상 이름 패턴 (fnmatch, 예: 'analyzer.full_analysis*' 'api.*')")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-api', action='store_true', help="Flask 엔드포인트 측정 생략")
+    parser.add_argument('--save', default=None, help="결과를 기준값 JSON으로 저장")
+    parser.add_argument('--compare', default=None, help="비교할 기준값 JSON")
+    parser.add_argument('--metric', default='p50_ms', choices=['p50_ms', 'p95_ms', 'p99_ms'])
+    parser.add_argument('--threshold', type=float, default=0.2, help="허용 증가율 (0.2 = 20%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.5, help="무시할 절대 증가 (ms)")
+    args = parser.parse_args()
+
+    # 결과 캐시가 반복 요청을 가로채지 않도록 API는 캐시 없이 (import 전에 설정)
+    os.environ.setdefault('RESULT_CACHE_MB', '0')
+    os.environ.setdefault('WHISPER_WARMUP', 'false')
+    os.environ.setdefault('WHISPER_MODEL_SIZE', args.model)
+    from pronunciation_analyzer import WHISPER_AVAILABLE, PronunciationAnalyzer
+
+    fixtures = make_fixtures(args.durations, args.seed)
+    analyzer = PronunciationAnalyzer(model_size=args.model, preload=True)
+    whisper = WHISPER_AVAILABLE and analyzer.whisper_model is not None
+    cases = analyzer_cases(analyzer, fixtures, whisper)
+    if not args.no_api:
+        import api
+        cases.update(api_cases(api.app.test_client(), fixtures))
+
+    selected = {name: case for name, case in cases.items()
+                if any(fnmatch.fnmatchcase(name, pattern) for pattern in args.cases)}
+    print(f"녹음 {len(fixtures)}개 (해시 {fixture_digest(fixtures)}), 측정 대상 {len(selected)}개, "
+          f"반복 {args.repeat}회" + ("" if whisper else " (Whisper 없음: STT 제외)"))
+    print(f"{'측정 대상':<52} {'초당':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'RTF':>7}")
+
+    results = {
+        'version': FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': environment(),
+        'fixtures': fixture_digest(fixtures),
+        'repeat': args.repeat,
+        'cases': {},
+    }
+    for name, (func, audio_s) in selected.items():
+        stats = run_case(func, args.repeat, args.warmup, audio_s)
+        results['cases'][name] = stats
+        rtf = f"{stats['rtf']:>7.3f}" if 'rtf' in stats else f"{'-':>7}"
+        print(f"{name:<52} {stats['throughput']:>8.1f} {stats['p50_ms']:>7.2f}ms "
+              f"{stats['p95_ms']:>7.2f}ms {stats['p99_ms']:>7.2f}ms {rtf}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\n기준값 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('fixtures') != results['fixtures']:
+            print("경고: 기준값과 녹음 모음이 다릅니다 (--durations/--seed 확인)")
+        if baseline.get('environment') != results['environment']:
+            print(f"경고: 측정 환경이 다릅니다 (기준 {baseline.get('environment')})")
+        regressions = compare(results, baseline, args.metric, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n{args.metric} 기준 {args.threshold * 100:.0f}% 넘게 느려진 측정 대상 {len(regressions)}개")
+            sys.exit(1)
+        print(f"\n회귀 없음 ({args.metric}, 임계치 {args.threshold * 100:.0f}%)")
+
+
+if __name__ == '__main__':
+    main()
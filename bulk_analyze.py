@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+대량 오프라인 분석 CLI
+매니페스트(CSV/JSONL)의 (audio_path, reference_text) 행들을 워커 프로세스 풀(워커당 모델 1회 로드)로
+나눠 full_analysis하고, 결과를 완료되는 대로 JSONL 또는 Parquet에 기록
+출력에 이미 있는 행은 건너뛰므로 중단된 실행은 같은 명령으로 이어서 실행
+
+매니페스트 형식:
+    CSV: 헤더 행에 audio_path, reference_text (선택: id)
+    JSONL: 줄마다 {"audio_path": ..., "reference_text": ..., "id": ...}
+    audio_path는 매니페스트 파일 기준 상대 경로 가능, id가 없으면 audio_path를 행 키로 사용
+
+출력 형식:
+    JSONL: 행마다 한 줄 (id, audio_path, reference_text, spoken_text, overall_score, error, result)
+           같은 id가 여러 번 있으면 마지막 줄이 유효 (--retry-errors로 실패 행을 다시 분석한 경우)
+    Parquet: 디렉터리에 part-NNNNNN.parquet 파일을 --flush-rows 행마다 추가 (result는 JSON 문자열, pyarrow 필요)
+
+실행: python bulk_analyze.py manifest.csv -o results.jsonl --workers 4 [--model base]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, Iterator, List, Optional
+
+from passage import split_sentences
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+def read_manifest(path: str) -> List[Dict]:
+    """
+    매니페스트 읽기
+    Args:
+        path: CSV(.csv) 또는 JSONL(.jsonl/.ndjson) 파일 경로
+    Returns:
+        행 목록 (id, audio_path(절대 경로), reference_text)
+    Raises:
+        ValueError: 필수 열 누락 또는 중복된 id
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            entries = list(csv.DictReader(f))
+        else:
+            entries = [json.loads(line) for line in f if line.strip()]
+
+    rows, seen = [], set()
+    for number, entry in enumerate(entries, 1):
+        if not entry.get('audio_path') or entry.get('reference_text') is None:
+            raise ValueError(f"{path} {number}번째 행: audio_path와 reference_text가 필요합니다")
+        row_id = str(entry.get('id') or entry['audio_path'])
+        if row_id in seen:
+            raise ValueError(f"{path} {number}번째 행: 중복된 id {row_id}")
+        seen.add(row_id)
+        rows.append({
+            'id': row_id,
+            'audio_path': os.path.join(base_dir, entry['audio_path']),
+            'reference_text': entry['reference_text'],
+        })
+    return rows
+
+
+def make_record(row: Dict, result: Optional[Dict] = None, error: Optional[str] = None) -> Dict:
+    """출력 행 (분석 결과 또는 오류)"""
+    return {
+        'id': row['id'],
+        'audio_path': row['audio_path'],
+        'reference_text': row['reference_text'],
+        'spoken_text': result.get('spoken_text') if result else None,
+        'overall_score': result['pronunciation'].get('overall_score') if result else None,
+        'error': error,
+        'result': result,
+    }
+
+
+class JsonlResultWriter:
+    """JSONL 결과 기록 (행마다 flush → 강제 종료돼도 기록된 행은 유지)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._done = self._load()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _load(self) -> Dict[str, bool]:
+        """기존 출력의 id → 성공 여부 (강제 종료로 잘린 마지막 줄은 잘라냄)"""
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+        valid_end = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                done[record['id']] = record.get('error') is None
+                valid_end += len(line)
+        if valid_end < os.path.getsize(self.path):
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_end)
+        return done
+
+    def completed(self) -> Dict[str, bool]:
+        return self._done
+
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetResultWriter:
+    """Parquet 결과 기록 (flush_rows 행마다 파트 파일 하나, 임시 파일에 쓴 뒤 이름 변경)"""
+
+    SCHEMA_FIELDS = [
+        ('id', 'string'),
+        ('audio_path', 'string'),
+        ('reference_text', 'string'),
+        ('spoken_text', 'string'),
+        ('overall_score', 'float64'),
+        ('error', 'string'),
+        ('result', 'string'),
+    ]
+
+    def __init__(self, path: str, flush_rows: int = 500):
+        if not PARQUET_AVAILABLE:
+            raise RuntimeError("Parquet 출력에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        self.path = path
+        self.flush_rows = flush_rows
+        self.schema = pa.schema([(name, getattr(pa, kind)()) for name, kind in self.SCHEMA_FIELDS])
+        os.makedirs(path, exist_ok=True)
+        self._parts = sorted(name for name in os.listdir(path)
+                             if name.startswith('part-') and name.endswith('.parquet'))
+        self._buffer: List[Dict] = []
+
+    def completed(self) -> Dict[str, bool]:
+        done = {}
+        for name in self._parts:
+            table = pq.read_table(os.path.join(self.path, name), columns=['id', 'error'])
+            for row_id, error in zip(table.column('id').to_pylist(), table.column('error').to_pylist()):
+                done[row_id] = error is None
+        return done
+
+    def write(self, record: Dict):
+        record = dict(record)
+        if record['result'] is not None:
+            record['result'] = json.dumps(record['result'], ensure_ascii=False)
+        self._buffer.append(record)
+        if len(self._buffer) >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        name = f"part-{len(self._parts):06d}.parquet"
+        temp_path = os.path.join(self.path, f".{name}.tmp")
+        pq.write_table(pa.Table.from_pylist(self._buffer, schema=self.schema), temp_path)
+        os.replace(temp_path, os.path.join(self.path, name))
+        self._parts.append(name)
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+
+
+def open_writer(path: str, output_format: str, flush_rows: int):
+    if output_format == 'auto':
+        output_format = 'parquet' if path.rstrip('/').endswith('.parquet') else 'jsonl'
+    if output_format == 'parquet':
+        return ParquetResultWriter(path, flush_rows)
+    return JsonlResultWriter(path)
+
+
+def pending_rows(rows: List[Dict], done: Dict[str, bool], retry_errors: bool) -> Iterator[Dict]:
+    """아직 분석하지 않은 행 (retry_errors면 실패했던 행도)"""
+    for row in rows:
+        ok = done.get(row['id'])
+        if ok is None or (retry_errors and not ok):
+            yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대량 오프라인 발음 분석")
+    parser.add_argument('manifest', help="매니페스트 (CSV 또는 JSONL: audio_path, reference_text, 선택 id)")
+    parser.add_argument('-o', '--output', required=True, help="결과 파일 (.jsonl) 또는 디렉터리 (.parquet)")
+    parser.add_argument('--format', default='auto', choices=['auto', 'jsonl', 'parquet'])
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument('--model', default='base', help="Whisper 모델 크기")
+    parser.add_argument('--stt-backend', default='torch', help="STT 백엔드 (torch / int8)")
+    parser.add_argument('--stt-threads', type=int, default=0, help="워커당 추론 스레드 수 (0=torch 기본값)")
+    parser.add_argument('--decode', default='default', help="Whisper 디코딩 프리셋 (default / read_aloud)")
+    parser.add_argument('--pitch', default='piptrack', choices=['piptrack', 'yin'],
+                        help="운율 분석 피치 추적 방식 (piptrack: STFT 피크, 배음 포함 / yin: 60~400 Hz 실제 F0)")
+    parser.add_argument('--prosody-block-s', type=float, default=0.0,
+                        help="운율 분석 블록 길이 (초, 0=전체를 한 번에, 긴 녹음은 30 정도로 최대 메모리 제한)")
+    parser.add_argument('--segment', default='auto', choices=['auto', 'true', 'false'],
+                        help="긴 지문 문장 구간 분할 분석 (auto: 참조가 --passage-min-sentences 문장 이상)")
+    parser.add_argument('--passage-min-sentences', type=int, default=3)
+    parser.add_argument('--retry-errors', action='store_true', help="이전 실행에서 실패한 행도 다시 분석")
+    parser.add_argument('--flush-rows', type=int, default=500, help="Parquet 파트 파일당 행 수")
+    parser.add_argument('--progress', type=float, default=10.0, help="진행 상황 출력 간격 (초)")
+    parser.add_argument('--task-timeout', type=float, default=1800.0,
+                        help="행 하나의 최대 처리 시간 (초, 넘으면 오류 행으로 기록하고 진행)")
+    args = parser.parse_args()
+
+    from stt_backends import decode_options
+    from worker_pool import AnalyzerPool, PoolSaturatedError, WorkerTaskError
+
+    rows = read_manifest(args.manifest)
+    try:
+        writer = open_writer(args.output, args.format, args.flush_rows)
+    except RuntimeError as e:
+        parser.error(str(e))
+    done = writer.completed()
+    todo = list(pending_rows(rows, done, args.retry_errors))
+    print(f"매니페스트 {len(rows)}행, 이미 완료 {len(rows) - len(todo)}행, 남은 {len(todo)}행", file=sys.stderr)
+    if not todo:
+        writer.close()
+        return
+
+    def method_for(row: Dict) -> str:
+        if args.segment == 'auto':
+            passage = len(split_sentences(row['reference_text'])) >= args.passage_min_sentences
+        else:
+            passage = args.segment == 'true'
+        return 'passage_analysis' if passage else 'full_analysis'
+
+    workers = min(args.workers, len(todo))
+    pool = AnalyzerPool(model_size=args.model, workers=workers, max_queue=workers,
+                        stt_backend=args.stt_backend, stt_threads=args.stt_threads,
+                        decode=decode_options(args.decode), pitch_method=args.pitch,
+                        prosody_block_s=args.prosody_block_s)
+    capacity = workers * 2
+    pending = {}  # Future → (행, 마감 시각)
+    finished = failed = 0
+    start = last_report = time.perf_counter()
+
+    def record_for(row: Dict, future) -> Dict:
+        try:
+            return make_record(row, result=future.result())
+        except WorkerTaskError as e:
+            return make_record(row, error=str(e))
+        except Exception as e:
+            # 풀 종료 등 워커 밖의 실패도 행마다 기록
+            return make_record(row, error=f"{type(e).__name__}: {e}")
+
+    def drain(futures):
+        nonlocal finished, failed, last_report
+        now = time.perf_counter()
+        # 마감이 지난 행은 오류로 기록하고 더 기다리지 않음 (나중에 끝나도 무시)
+        expired = [future for future, (_, deadline) in pending.items()
+                   if future not in futures and deadline <= now]
+        for future in list(futures) + expired:
+            row, _ = pending.pop(future)
+            if future in futures:
+                record = record_for(row, future)
+            else:
+                record = make_record(row, error=f"TimeoutError: {args.task_timeout:g}초 안에 끝나지 않았습니다")
+            if record['error'] is not None:
+                failed += 1
+            writer.write(record)
+            finished += 1
+
+        if finished and now - last_report >= args.progress:
+            rate = finished / (now - start)
+            print(f"  {finished}/{len(todo)} (실패 {failed}), 초당 {rate:.2f}개, "
+                  f"남은 시간 약 {(len(todo) - finished) / rate / 60:.1f}분", file=sys.stderr)
+            last_report = now
+
+    def wait_some():
+        # 가장 이른 마감이나 진행 상황 출력 시각까지만 기다림 (잃어버린 작업 하나로 멈추지 않도록)
+        now = time.perf_counter()
+        timeout = min([deadline for _, deadline in pending.values()] + [now + args.progress]) - now
+        drain(wait(pending, timeout=max(timeout, 0.0), return_when=FIRST_COMPLETED).done)
+
+    try:
+        for row in todo:
+            while len(pending) >= capacity:
+                wait_some()
+            try:
+                future = pool.submit(method_for(row), row['audio_path'], row['reference_text'],
+                                     block=True, timeout=args.task_timeout)
+            except PoolSaturatedError as e:
+                # 마감이 지난 작업들이 워커를 계속 붙잡고 있음
+                writer.write(make_record(row, error=f"PoolSaturatedError: {e}"))
+                finished += 1
+                failed += 1
+                continue
+            pending[future] = (row, time.perf_counter() + args.task_timeout)
+        while pending:
+            wait_some()
+    except KeyboardInterrupt:
+        print("중단됨: 같은 명령으로 다시 실행하면 이어서 분석합니다", file=sys.stderr)
+    finally:
+        writer.close()
+        pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    print(f"완료 {finished}행 (실패 {failed}), {elapsed:.1f}초", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -77,10 +77,11 @@ def demo_text_analysis():
         print(f"  • 음소 유사도: {result['phoneme_similarity']}%")
         print(f"  • 정확한 단어: {result['correct_words']}/{result['word_count']}")
         
-        if result['mispronounced_words']:
-            print(f"\n🔍 틀린 단어 상세:")
-            for error in result['mispronounced_words']:
-                print(f"  위치 {error['position'] + 1}: "
+        if result['word_errors']:
+            labels = {'substitute': '치환', 'delete': '누락', 'insert': '추가'}
+            print(f"\n🔍 단어 오류 상세:")
+            for error in result['word_errors']:
+                print(f"  위치 {error['position'] + 1} [{labels[error['type']]}]: "
                       f"'{error['expected']}' → '{error['spoken']}'")
 
 
@@ -0,0 +1,360 @@
+"""
+비동기 분석 작업 대기열
+긴 녹음(1~5분 지문 낭독)을 HTTP 요청 밖에서 처리하기 위한 SQLite 기반 영속 대기열
+(서버가 재시작되어도 대기/처리 중이던 작업을 이어서 처리)
+
+처리 중인 작업은 가져간 JobQueue 인스턴스(owner)가 lease_s보다 짧은 간격으로 heartbeat를 갱신하고,
+heartbeat가 lease_s 넘게 멈춘 작업만 다른 인스턴스(또는 재시작한 서버)가 다시 대기열로 돌림
+(같은 파일을 여러 프로세스가 열어도 살아 있는 워커의 작업을 빼앗지 않음)
+
+우선순위 차선:
+    short  짧은 클립 (SHORT_CLIP_S 이하) - 먼저 처리, 전용 워커도 둘 수 있음
+    long   긴 녹음
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Sequence
+
+LANES = ('short', 'long')
+
+# 상태: queued → running → done / failed
+FINISHED = ('done', 'failed')
+
+
+class QueueFullError(RuntimeError):
+    """대기 중인 작업 수가 한도에 도달함"""
+
+
+class JobQueue:
+    """SQLite 영속 작업 대기열 + 워커 스레드"""
+
+    def __init__(
+        self,
+        path: str,
+        short_clip_s: float = 30.0,
+        max_queued: int = 1000,
+        retention_s: float = 24 * 3600,
+        max_attempts: int = 3,
+        lease_s: float = 60.0,
+    ):
+        """
+        초기화 (heartbeat가 멈춘 처리 중 작업은 다시 대기열로)
+        Args:
+            path: SQLite 파일 경로
+            short_clip_s: 이 길이 이하 녹음은 short 차선
+            max_queued: 대기 중인 작업 최대 수 (초과 시 QueueFullError)
+            retention_s: 끝난 작업(결과)을 보관하는 시간 (초)
+            max_attempts: 처리 중 중단된 작업을 다시 시도하는 최대 횟수 (이만큼 시도했으면 failed 처리,
+                          프로세스를 죽이는 녹음이 재시작마다 반복 처리되지 않도록)
+            lease_s: 처리 중 작업의 heartbeat가 이 시간(초) 넘게 갱신되지 않으면 중단된 것으로 봄
+        """
+        self.path = path
+        self.short_clip_s = short_clip_s
+        self.max_queued = max_queued
+        self.retention_s = retention_s
+        self.max_attempts = max_attempts
+        self.lease_s = lease_s
+        self.owner = uuid.uuid4().hex  # 이 인스턴스가 가져간 작업 표시
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, lane INTEGER NOT NULL, "
+            "reference_text TEXT NOT NULL, options TEXT NOT NULL, "
+            "filename TEXT, audio BLOB, duration REAL, "
+            "result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+            "created REAL NOT NULL, started REAL, finished REAL, owner TEXT, heartbeat REAL)"
+        )
+        # owner/heartbeat 열이 없던 이전 버전 파일
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(jobs)")]
+        for column, kind in (('owner', 'TEXT'), ('heartbeat', 'REAL')):
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (status, lane, created)")
+        self._db.commit()
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._workers: List[threading.Thread] = []
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._stopped = threading.Event()
+        self.abandoned = 0
+        self.recovered = 0
+        self._requeue_stale()
+
+    def _requeue_stale(self) -> int:
+        """
+        heartbeat가 lease_s 넘게 멈춘(또는 없는) running 작업을 다시 대기 상태로
+        (max_attempts만큼 시도한 작업은 failed)
+        Returns:
+            다시 대기열에 넣은 작업 수 (누적 self.recovered, failed 처리 누적 self.abandoned)
+        """
+        now = time.time()
+        stale = "status = 'running' AND (heartbeat IS NULL OR heartbeat < ?)"
+        with self._lock:
+            cursor = self._db.execute(
+                f"UPDATE jobs SET status = 'failed', error = ?, finished = ?, audio = NULL, owner = NULL "
+                f"WHERE {stale} AND attempts >= ?",
+                (f"처리 중 서버가 {self.max_attempts}번 중단되어 포기했습니다", now,
+                 now - self.lease_s, self.max_attempts),
+            )
+            self.abandoned += cursor.rowcount
+            cursor = self._db.execute(
+                f"UPDATE jobs SET status = 'queued', started = NULL, owner = NULL, heartbeat = NULL "
+                f"WHERE {stale}", (now - self.lease_s,)
+            )
+            self._db.commit()
+            self.recovered += cursor.rowcount
+            return cursor.rowcount
+
+    def _beat(self):
+        """이 인스턴스가 처리 중인 작업의 heartbeat 갱신"""
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET heartbeat = ? WHERE owner = ? AND status = 'running'",
+                (time.time(), self.owner),
+            )
+            self._db.commit()
+
+    def lane_for(self, duration: Optional[float]) -> str:
+        """녹음 길이로 차선 결정 (길이를 모르면 long)"""
+        if duration is not None and duration <= self.short_clip_s:
+            return 'short'
+        return 'long'
+
+    def submit(
+        self,
+        audio: bytes,
+        reference_text: str,
+        filename: Optional[str] = None,
+        duration: Optional[float] = None,
+        options: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        작업 등록
+        Args:
+            audio: 인코딩된 오디오 바이트
+            reference_text: 참조 텍스트
+            filename: 원본 파일명 (디코딩 확장자 힌트)
+            duration: 녹음 길이 (초, 차선 결정용)
+            options: 처리 옵션 (예: analyze_prosody)
+        Returns:
+            작업 정보
+        Raises:
+            QueueFullError: 대기 중인 작업이 너무 많음
+        """
+        job_id = uuid.uuid4().hex
+        lane = self.lane_for(duration)
+        with self._changed:
+            queued = self._db.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'queued'"
+            ).fetchone()[0]
+            if queued >= self.max_queued:
+                raise QueueFullError("작업 대기열이 가득 찼습니다")
+            self._db.execute(
+                "INSERT INTO jobs (id, status, lane, reference_text, options, filename, audio, "
+                "duration, created) VALUES (?, 'queued', ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, LANES.index(lane), reference_text, json.dumps(options or {}),
+                 filename, sqlite3.Binary(audio), duration, time.time()),
+            )
+            self._db.commit()
+            self._changed.notify_all()
+        return self.get(job_id)
+
+    def _describe(self, row: sqlite3.Row, position: Optional[int] = None) -> Dict:
+        job = {
+            'job_id': row['id'],
+            'status': row['status'],
+            'lane': LANES[row['lane']],
+            'duration': row['duration'],
+            'attempts': row['attempts'],
+            'max_attempts': self.max_attempts,
+            'created_at': row['created'],
+            'started_at': row['started'],
+            'finished_at': row['finished'],
+        }
+        if position is not None:
+            job['position'] = position
+        if row['status'] == 'done':
+            job['result'] = json.loads(row['result'])
+        elif row['status'] == 'failed':
+            job['error'] = row['error']
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        작업 조회
+        Returns:
+            작업 정보 (대기 중이면 앞선 작업 수 position 포함) 또는 None
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, status, lane, duration, attempts, created, started, finished, "
+                "result, error FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            position = None
+            if row['status'] == 'queued':
+                position = self._db.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND "
+                    "(lane < ? OR (lane = ? AND created < ?))",
+                    (row['lane'], row['lane'], row['created']),
+                ).fetchone()[0]
+        return self._describe(row, position)
+
+    def wait(self, job_id: str, timeout: float) -> Optional[Dict]:
+        """
+        롱 폴링: 작업이 끝나거나 timeout이 지날 때까지 대기
+        Returns:
+            작업 정보 또는 None (없는 작업)
+        """
+        deadline = time.monotonic() + timeout
+        job = self.get(job_id)
+        while job is not None and job['status'] not in FINISHED:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            with self._changed:
+                self._changed.wait(min(remaining, 1.0))
+            job = self.get(job_id)
+        return job
+
+    def claim(self, lanes: Sequence[str] = LANES) -> Optional[Dict]:
+        """
+        처리할 작업 하나를 running으로 바꾸고 반환 (차선 우선순위 → 등록 순서)
+        Args:
+            lanes: 이 워커가 처리할 차선
+        Returns:
+            오디오를 포함한 작업 또는 None
+        """
+        lane_ids = [LANES.index(lane) for lane in lanes]
+        placeholders = ','.join('?' * len(lane_ids))
+        with self._lock:
+            while True:
+                row = self._db.execute(
+                    f"SELECT id, reference_text, options, filename, audio FROM jobs "
+                    f"WHERE status = 'queued' AND lane IN ({placeholders}) "
+                    f"ORDER BY lane, created LIMIT 1", lane_ids
+                ).fetchone()
+                if row is None:
+                    return None
+                # 같은 파일을 연 다른 프로세스가 먼저 가져갔으면 rowcount 0 → 다음 작업
+                now = time.time()
+                cursor = self._db.execute(
+                    "UPDATE jobs SET status = 'running', started = ?, attempts = attempts + 1, "
+                    "owner = ?, heartbeat = ? WHERE id = ? AND status = 'queued'",
+                    (now, self.owner, now, row['id'])
+                )
+                self._db.commit()
+                if cursor.rowcount == 1:
+                    break
+        return {
+            'job_id': row['id'],
+            'reference_text': row['reference_text'],
+            'options': json.loads(row['options']),
+            'filename': row['filename'],
+            'audio': bytes(row['audio']),
+        }
+
+    def complete(self, job_id: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        """
+        작업 완료/실패 기록 (오디오는 더 이상 필요 없으므로 삭제)
+        heartbeat가 늦어 다른 인스턴스로 넘어간 작업이면 기록하지 않음
+        """
+        with self._changed:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished = ?, audio = NULL, "
+                "owner = NULL WHERE id = ? AND owner = ? AND status = 'running'",
+                ('failed' if error is not None else 'done',
+                 json.dumps(result, ensure_ascii=False) if error is None else None,
+                 error, time.time(), job_id, self.owner),
+            )
+            self._db.commit()
+            self._changed.notify_all()
+
+    def purge(self) -> int:
+        """보관 기간이 지난 끝난 작업 삭제"""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished < ?",
+                (time.time() - self.retention_s,),
+            )
+            self._db.commit()
+            return cursor.rowcount
+
+    def stats(self) -> Dict:
+        """차선별 대기/처리 중 작업 수"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT lane, status, COUNT(*) AS n FROM jobs GROUP BY lane, status"
+            ).fetchall()
+        counts = {lane: {'queued': 0, 'running': 0, 'done': 0, 'failed': 0} for lane in LANES}
+        for row in rows:
+            counts[LANES[row['lane']]][row['status']] = row['n']
+        return {'lanes': counts, 'workers': len(self._workers), 'recovered': self.recovered,
+                'abandoned': self.abandoned, 'max_attempts': self.max_attempts, 'lease_s': self.lease_s}
+
+    def start_workers(self, handler: Callable[[Dict], Dict], lanes: Sequence[Sequence[str]]):
+        """
+        워커 스레드 시작 (+ heartbeat 스레드 하나)
+        Args:
+            handler: 작업(claim 결과)을 받아 분석 결과를 반환하는 함수
+            lanes: 워커별 처리 차선 (예: [('short',), ('short', 'long')] →
+                   short 전용 1개 + 짧은 것 우선 범용 1개)
+        """
+        for i, worker_lanes in enumerate(lanes):
+            thread = threading.Thread(
+                target=self._work, args=(handler, tuple(worker_lanes)),
+                name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._workers.append(thread)
+        if lanes and self._heartbeat_thread is None:
+            self._heartbeat_thread = threading.Thread(target=self._heartbeat, name="job-heartbeat",
+                                                      daemon=True)
+            self._heartbeat_thread.start()
+
+    def _heartbeat(self):
+        """heartbeat 루프: lease_s/3마다 처리 중 작업의 heartbeat 갱신 + 멈춘 작업 회수"""
+        while not self._stopped.wait(self.lease_s / 3):
+            self._beat()
+            if self._requeue_stale():
+                with self._changed:
+                    self._changed.notify_all()
+
+    def _work(self, handler: Callable[[Dict], Dict], lanes: Sequence[str]):
+        """워커 루프: 작업을 가져와 처리하고 결과 기록"""
+        last_purge = 0.0
+        while not self._closed:
+            if time.monotonic() - last_purge > 600:
+                self.purge()
+                last_purge = time.monotonic()
+
+            job = self.claim(lanes)
+            if job is None:
+                with self._changed:
+                    self._changed.wait(1.0)
+                continue
+            try:
+                self.complete(job['job_id'], result=handler(job))
+            except Exception as e:
+                self.complete(job['job_id'], error=f"{type(e).__name__}: {e}")
+
+    def shutdown(self, timeout: float = 5.0):
+        """워커 종료 (처리 중인 작업은 heartbeat가 멈춘 뒤 lease_s가 지나면 다시 대기열로)"""
+        self._closed = True
+        self._stopped.set()
+        with self._changed:
+            self._changed.notify_all()
+        for thread in self._workers:
+            thread.join(timeout)
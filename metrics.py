@@ -0,0 +1,194 @@
+"""
+지연 시간 계측
+분석 단계(디코딩, VAD, STT, 스코어링, 운율, 피드백)와 HTTP 요청마다 시간 구간(span)을 재서
+히스토그램에 누적하고 Prometheus 텍스트 형식으로 내보냄
+(요청 처리 중이면 요청별 단계 시간도 모아 JSON 응답의 timings로 돌려줌)
+
+사용:
+    with metrics.collect() as timings:      # 요청 단위 수집 시작
+        with metrics.span('transcribe'):    # 단계 시간 측정 → 히스토그램 + timings
+            ...
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 지연 시간 버킷 (초): 짧은 스코어링(ms 단위)부터 긴 녹음 STT(수십 초)까지
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_enabled = True
+_current: ContextVar[Optional[Dict[str, float]]] = ContextVar('timings', default=None)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value)) if value != float('inf') else '+Inf'
+
+
+class Histogram:
+    """레이블별 누적 히스토그램 (스레드 안전)"""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        """
+        Args:
+            name: 지표 이름
+            documentation: HELP 설명
+            labels: 레이블 이름
+            buckets: 버킷 상한 (오름차순, +Inf는 자동 추가)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # 레이블 값 → [버킷별 개수(+Inf 포함), 합계]
+        self._series: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()):
+        """관측값 하나 기록"""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> Iterable[str]:
+        """Prometheus 텍스트 형식 줄들"""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            snapshot = [(labels, list(counts), total)
+                        for labels, (counts, total) in sorted(self._series.items())]
+        for labels, counts, total in snapshot:
+            pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labels, labels)]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                bucket_labels = ','.join(pairs + [f'le="{_format_float(bound)}"'])
+                yield f"{self.name}_bucket{{{bucket_labels}}} {cumulative}"
+            suffix = f"{{{','.join(pairs)}}}" if pairs else ''
+            yield f"{self.name}_sum{suffix} {_format_float(total)}"
+            yield f"{self.name}_count{suffix} {cumulative}"
+
+
+class Registry:
+    """지표 모음"""
+
+    def __init__(self):
+        self._metrics: List[Histogram] = []
+
+    def register(self, metric: Histogram) -> Histogram:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """/metrics 응답 본문"""
+        return '\n'.join(line for metric in self._metrics for line in metric.render()) + '\n'
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    'pronunciation_stage_seconds',
+    'Time spent in each analysis stage',
+    labels=('stage',),
+))
+
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    'pronunciation_http_request_seconds',
+    'HTTP request handling time',
+    labels=('endpoint', 'method', 'status'),
+))
+
+
+def enable(flag: bool = True):
+    """계측 켜기/끄기 (끄면 span은 시간을 재지 않음)"""
+    global _enabled
+    _enabled = flag
+
+
+class _Span:
+    """단계 시간 측정 구간"""
+
+    __slots__ = ('stage', 'start')
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        if _enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if not _enabled:
+            return False
+        elapsed = time.perf_counter() - self.start
+        STAGE_SECONDS.observe(elapsed, (self.stage,))
+        timings = _current.get()
+        if timings is not None:
+            timings[self.stage] = timings.get(self.stage, 0.0) + elapsed
+        return False
+
+
+class _Collector:
+    """요청 단위 단계 시간 수집"""
+
+    __slots__ = ('timings', '_token')
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._token = None
+
+    def __enter__(self) -> Dict[str, float]:
+        self._token = _current.set(self.timings)
+        return self.timings
+
+    def __exit__(self, *exc):
+        _current.reset(self._token)
+        return False
+
+
+def span(stage: str) -> _Span:
+    """단계 시간 측정 (컨텍스트 관리자: 히스토그램 기록 + 수집 중이면 요청 timings에 합산)"""
+    return _Span(stage)
+
+
+def collect() -> _Collector:
+    """요청 단위 단계 시간 수집 (컨텍스트 관리자, with 값은 단계 → 초 딕셔너리)"""
+    return _Collector()
+
+
+def observe_stages(timings: Dict[str, float]):
+    """다른 프로세스(워커 풀)에서 잰 단계 시간을 히스토그램에 기록"""
+    if not _enabled:
+        return
+    for stage, seconds in timings.items():
+        STAGE_SECONDS.observe(seconds, (stage,))
+
+
+def merge(timings: Dict[str, float]):
+    """다른 프로세스에서 잰 단계 시간을 현재 요청 timings에 합산 (히스토그램에는 기록하지 않음)"""
+    current = _current.get()
+    if current is not None:
+        for stage, seconds in timings.items():
+            current[stage] = current.get(stage, 0.0) + seconds
+
+
+def as_ms(timings: Dict[str, float], total: Optional[float] = None) -> Dict[str, float]:
+    """응답용 단계 시간 (ms, 0.1 단위)"""
+    result = {stage: round(seconds * 1000.0, 1) for stage, seconds in timings.items()}
+    if total is not None:
+        result['total'] = round(total * 1000.0, 1)
+    return result
@@ -0,0 +1,127 @@
+"""
+Whisper 모델 레지스트리
+프로세스 전역에서 model_size/STT 백엔드별 모델을 첫 사용 시 한 번만 로드하여 공유
+(여러 PronunciationAnalyzer 인스턴스, Streamlit 세션이 같은 모델을 사용)
+"""
+
+import importlib.util
+import threading
+from typing import Dict, Optional
+
+from stt_backends import DEFAULT_BACKEND, get_backend
+
+# whisper/torch는 import 자체가 무거우므로 설치 여부만 확인하고 실제 import는 로드 시점에
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
+
+_registry_lock = threading.Lock()
+_load_locks: Dict[str, threading.Lock] = {}
+_model_locks: Dict[str, threading.Lock] = {}
+_models: Dict[str, object] = {}
+_states: Dict[str, str] = {}
+_errors: Dict[str, str] = {}
+
+
+def model_key(model_size: str, backend: str = DEFAULT_BACKEND) -> str:
+    """레지스트리/결과 캐시 키 (기본 백엔드는 model_size 그대로)"""
+    return model_size if backend == DEFAULT_BACKEND else f"{model_size}-{backend}"
+
+
+def _load_lock(key: str) -> threading.Lock:
+    with _registry_lock:
+        return _load_locks.setdefault(key, threading.Lock())
+
+
+def model_lock(model_size: str, backend: str = DEFAULT_BACKEND) -> threading.Lock:
+    """
+    모델 추론 잠금 (같은 모델을 공유하는 모든 인스턴스가 함께 사용)
+    Whisper 추론은 모델 내부 상태(kv-cache hook)를 건드리므로 동시 호출을 직렬화
+    """
+    with _registry_lock:
+        return _model_locks.setdefault(model_key(model_size, backend), threading.Lock())
+
+
+def get_model(model_size: str, backend: str = DEFAULT_BACKEND, threads: int = 0):
+    """
+    모델 반환 (첫 호출 시 로드, 동시 호출은 하나의 로드를 기다림)
+    Args:
+        model_size: Whisper 모델 크기
+        backend: STT 백엔드 이름 (torch / int8)
+        threads: 추론 스레드 수 (0이면 torch 기본값, 첫 로드 시에만 적용)
+    Returns:
+        로드된 모델 또는 None (미설치/로드 실패)
+    """
+    key = model_key(model_size, backend)
+    model = _models.get(key)
+    if model is not None or not WHISPER_AVAILABLE:
+        return model
+
+    with _load_lock(key):
+        if key in _models:
+            return _models[key]
+        if _states.get(key) == 'failed':
+            return None
+
+        _states[key] = 'warming'
+        try:
+            model = get_backend(backend, threads).load(model_size)
+            _models[key] = model
+            _states[key] = 'ready'
+            print(f"Whisper {model_size} 모델 로드 완료 (백엔드: {backend})")
+        except Exception as e:
+            _states[key] = 'failed'
+            _errors[key] = str(e)
+            print(f"Whisper 로드 실패: {e}")
+            model = None
+    return model
+
+
+def register_model(model_size: str, model, backend: str = DEFAULT_BACKEND):
+    """이미 로드된 모델을 등록 (테스트, 커스텀 체크포인트용)"""
+    key = model_key(model_size, backend)
+    with _load_lock(key):
+        _models[key] = model
+        _states[key] = 'ready'
+        _errors.pop(key, None)
+
+
+def warmup(model_size: str, background: bool = True, backend: str = DEFAULT_BACKEND,
+           threads: int = 0) -> Optional[threading.Thread]:
+    """
+    모델 미리 로드
+    Args:
+        model_size: Whisper 모델 크기
+        background: True면 백그라운드 스레드에서 로드
+        backend: STT 백엔드 이름
+        threads: 추론 스레드 수 (0이면 torch 기본값)
+    Returns:
+        워밍업 스레드 (background=True일 때)
+    """
+    if not background:
+        get_model(model_size, backend, threads)
+        return None
+
+    key = model_key(model_size, backend)
+    if _states.get(key) is None:
+        _states[key] = 'warming'
+    thread = threading.Thread(
+        target=get_model, args=(model_size, backend, threads),
+        name=f"whisper-warmup-{key}", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def model_state(model_size: str, backend: str = DEFAULT_BACKEND) -> str:
+    """
+    모델 상태
+    Returns:
+        unavailable(미설치) / cold(미로드) / warming(로드 중) / ready / failed
+    """
+    if not WHISPER_AVAILABLE:
+        return 'unavailable'
+    return _states.get(model_key(model_size, backend), 'cold')
+
+
+def model_error(model_size: str, backend: str = DEFAULT_BACKEND) -> Optional[str]:
+    """로드 실패 메시지"""
+    return _errors.get(model_key(model_size, backend))
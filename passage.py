@@ -0,0 +1,167 @@
+"""
+긴 지문 분할
+참조 지문을 문장으로 나누고 녹음을 쉼 위치에서 잘라 문장 단위로 대응시킴
+(문단 낭독을 통째로 인식/비교하지 않고 문장 구간별로 병렬 인식·스코어링)
+
+대응 방법:
+    문장 경계마다 예상 위치(앞 문장들의 음절 수 비율 × 전체 발화 시간)를 구하고,
+    실제 쉼 후보(발화 구간 사이 묵음)와 순서를 지키며 짝지음 (편집 거리 형태의 DP)
+    - 경계 ↔ 쉼 짝: 위치 차이 비용 - 긴 쉼 가산점
+    - 짝이 없는 경계: 두 문장을 한 구간으로 묶음 (쉼 없이 이어 읽은 경우)
+    - 짝이 없는 쉼: 문장 안의 쉼으로 보고 무시
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from vad import SpeechActivity
+
+# 문장 경계를 쉼에 대응시키지 않고 묶는 비용 (전체 발화 길이 대비 위치 차이와 같은 단위)
+UNMATCHED_COST = 0.15
+
+# 긴 쉼 가산점 (LONG_PAUSE_MS 이상이면 최대)
+PAUSE_BONUS = 0.05
+LONG_PAUSE_MS = 600.0
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+|(?<=[.!?]["\')\]])\s+|\n\s*\n')
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    지문을 문장으로 분할 (마침표/물음표/느낌표 뒤 공백, 빈 줄 기준)
+    Returns:
+        단어가 있는 문장 목록 (원문 표기 유지)
+    """
+    sentences = [s.strip() for s in _SENTENCE_END.split(text)]
+    return [s for s in sentences if re.search(r'\w', s)]
+
+
+def syllable_weight(text: str) -> int:
+    """예상 발화 길이 가중치 (단어별 모음 묶음 수 ≈ 음절 수)"""
+    return sum(max(1, len(re.findall(r'[aeiouy]+', word)))
+               for word in re.findall(r'\w+', text.lower()))
+
+
+def align_sentences(
+    speech: SpeechActivity,
+    sentences: List[str],
+) -> List[Tuple[int, int, int, int]]:
+    """
+    문장과 발화 구간 대응
+    Args:
+        speech: 녹음 전체의 발화 구간 검출 결과
+        sentences: 참조 문장 목록
+    Returns:
+        (첫 문장, 마지막 문장 + 1, 시작 샘플, 끝 샘플) 목록
+        (구간들이 앞뒤 묵음을 뺀 녹음 전체를 빈틈없이 덮음)
+    """
+    start, end = speech.bounds
+    n = len(sentences)
+    if n <= 1 or len(speech.segments) <= 1:
+        return [(0, n, start, end)]
+
+    # 쉼 후보: 발화 구간 사이 묵음 (앞까지의 발화 길이, 묵음 길이, 자를 위치)
+    segments = speech.segments
+    lengths = segments[:, 1] - segments[:, 0]
+    total_speech = float(lengths.sum())
+    speech_before = np.cumsum(lengths)[:-1] / total_speech
+    gaps = (segments[1:, 0] - segments[:-1, 1]) * 1000.0 / speech.sample_rate
+    cuts = ((segments[1:, 0] + segments[:-1, 1]) // 2).tolist()
+    bonus = PAUSE_BONUS * np.minimum(gaps / LONG_PAUSE_MS, 1.0)
+
+    # 문장 경계의 예상 위치 (앞 문장들 음절 비율)
+    weights = np.array([syllable_weight(s) for s in sentences], dtype=np.float64)
+    expected = np.cumsum(weights)[:-1] / weights.sum()
+
+    # cost[b, p]: 경계 b를 쉼 p에 대응시키는 비용
+    cost = np.abs(expected[:, None] - speech_before[None, :]) - bonus[None, :]
+    boundaries, pauses = cost.shape
+
+    # dp[b, p]: 앞 b개 경계와 앞 p개 쉼을 대응시킨 최소 비용
+    dp = np.zeros((boundaries + 1, pauses + 1))
+    dp[1:, 0] = np.arange(1, boundaries + 1) * UNMATCHED_COST
+    move = np.zeros((boundaries + 1, pauses + 1), dtype=np.int8)  # 0 쉼 무시, 1 경계 묶음, 2 대응
+    move[1:, 0] = 1
+    for b in range(1, boundaries + 1):
+        row, prev = dp[b], dp[b - 1]
+        for p in range(1, pauses + 1):
+            best, step = row[p - 1], 0
+            if prev[p] + UNMATCHED_COST < best:
+                best, step = prev[p] + UNMATCHED_COST, 1
+            if prev[p - 1] + cost[b - 1, p - 1] < best:
+                best, step = prev[p - 1] + cost[b - 1, p - 1], 2
+            row[p], move[b, p] = best, step
+
+    # 역추적: 대응된 경계에서 구간을 자름
+    matched = {}
+    b, p = boundaries, pauses
+    while b > 0:
+        step = move[b, p]
+        if step == 2:
+            matched[b] = cuts[p - 1]
+            b, p = b - 1, p - 1
+        elif step == 1:
+            b -= 1
+        else:
+            p -= 1
+
+    result = []
+    first, position = 0, start
+    for b in sorted(matched):
+        result.append((first, b, position, matched[b]))
+        first, position = b, matched[b]
+    result.append((first, n, position, end))
+    return result
+
+
+def merge_scores(scores: List[Dict], phoneme_counts: List[int]) -> Dict:
+    """
+    구간별 발음 스코어를 지문 전체 스코어로 합침
+    (단어 정확도는 맞은 단어 합계, 음소 유사도는 참조 음소 수 가중 평균,
+    단어/음소 오류 위치는 지문 처음 기준으로 이동)
+    Args:
+        scores: calculate_pronunciation_score 결과 목록 (지문 순서)
+        phoneme_counts: 구간별 참조 음소 수
+    Returns:
+        calculate_pronunciation_score와 같은 형태의 스코어
+    """
+    word_count = sum(score['word_count'] for score in scores)
+    correct_words = sum(score['correct_words'] for score in scores)
+    total_phonemes = sum(phoneme_counts)
+
+    word_accuracy = correct_words / word_count * 100 if word_count else 0.0
+    phoneme_similarity = (
+        sum(score['phoneme_similarity'] * count for score, count in zip(scores, phoneme_counts))
+        / total_phonemes if total_phonemes else 0.0
+    )
+
+    mispronounced_words, word_errors, phoneme_errors = [], [], []
+    word_offset = phoneme_offset = 0
+    for score, count in zip(scores, phoneme_counts):
+        mispronounced_words.extend(
+            dict(error, position=error['position'] + word_offset)
+            for error in score['mispronounced_words']
+        )
+        word_errors.extend(
+            dict(error, position=error['position'] + word_offset)
+            for error in score.get('word_errors', [])
+        )
+        phoneme_errors.extend(
+            dict(error, position=error['position'] + phoneme_offset)
+            for error in score.get('phoneme_errors', [])
+        )
+        word_offset += score['word_count']
+        phoneme_offset += count
+
+    return {
+        'overall_score': round(word_accuracy * 0.6 + phoneme_similarity * 0.4, 1),
+        'word_accuracy': round(word_accuracy, 1),
+        'phoneme_similarity': round(phoneme_similarity, 1),
+        'mispronounced_words': mispronounced_words,
+        'word_errors': word_errors,
+        'phoneme_errors': phoneme_errors,
+        'word_count': word_count,
+        'correct_words': correct_words
+    }
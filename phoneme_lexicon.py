@@ -0,0 +1,245 @@
+"""
+CMU 발음 사전 음소 렉시콘
+CMUdict를 한 번 컴파일해 정수 음소 ID 배열로 저장하고(mmap 로드), LRU 캐시로 조회
+
+디스크 형식 (CACHE_DIR/cmudict-v1/):
+    meta.json          심볼 테이블(음소 ID → 문자열), 단어 수
+    words.npy          정렬된 단어 (고정폭 바이트 배열, searchsorted로 검색)
+    phone_offsets.npy  단어별 음소 구간 시작 위치 (uint32, 단어 수 + 1)
+    phones.npy         음소 ID 연속 배열 (uint8)
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+CMUDICT_AVAILABLE = importlib.util.find_spec("cmudict") is not None
+
+FORMAT_VERSION = 1
+DEFAULT_CACHE_DIR = os.environ.get("CACHE_DIR", "./cache")
+
+# 사전에 없는 단어는 문자 단위로 대체하므로 문자도 심볼 테이블에 포함
+FALLBACK_SYMBOLS = list("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+def _parse_cmudict() -> Dict[str, str]:
+    """CMUdict 원본 파싱 (단어별 첫 번째 발음만 사용)"""
+    import cmudict
+
+    entries: Dict[str, str] = {}
+    with cmudict.dict_stream() as stream:
+        for line in stream:
+            line = line.strip().decode("utf-8")
+            if not line or line.startswith(";"):
+                continue
+            word, phones = line.split(" ", 1)
+            word = word.split("(", 1)[0].lower()
+            # 주석 제거 ("# ..." 형태)
+            phones = phones.split("#", 1)[0].strip()
+            if word not in entries:
+                entries[word] = phones
+    return entries
+
+
+class PhonemeLexicon:
+    """정수 ID 기반 음소 사전"""
+
+    def __init__(self, path: str, cache_size: int = 65536):
+        """
+        컴파일된 사전 로드 (배열은 mmap으로 열어 필요한 페이지만 읽음)
+        Args:
+            path: 컴파일된 사전 디렉터리
+            cache_size: 단어 조회 LRU 캐시 크기
+        """
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 렉시콘 버전: {meta.get('version')}")
+
+        self.symbols: List[str] = meta["symbols"]
+        # 파일에 들어 있는 기호 수 (이후 token_id가 붙이는 ID는 프로세스마다 다를 수 있음)
+        self.static_symbols = len(self.symbols)
+        self._symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._extra_lock = threading.Lock()
+
+        self._words = np.load(os.path.join(path, "words.npy"), mmap_mode="r")
+        self._offsets = np.load(os.path.join(path, "phone_offsets.npy"), mmap_mode="r")
+        self._phones = np.load(os.path.join(path, "phones.npy"), mmap_mode="r")
+        self._max_word_bytes = self._words.dtype.itemsize
+
+        self.lookup_ids = lru_cache(maxsize=cache_size)(self._lookup_ids)
+        self.word_phonemes = lru_cache(maxsize=cache_size)(self._word_phonemes)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @classmethod
+    def compile(cls, path: str, entries: Optional[Dict[str, str]] = None) -> "PhonemeLexicon":
+        """
+        CMUdict를 컴파일하여 디스크에 저장
+        Args:
+            path: 저장할 디렉터리
+            entries: 단어 → 공백 구분 음소 문자열 (기본: cmudict 패키지)
+        Returns:
+            로드된 PhonemeLexicon
+        """
+        if entries is None:
+            if not CMUDICT_AVAILABLE:
+                raise RuntimeError("cmudict 패키지가 필요합니다")
+            entries = _parse_cmudict()
+
+        words = sorted(w for w in entries if w.isascii())
+        symbols = sorted({p for w in words for p in entries[w].split()})
+        symbols += [s for s in FALLBACK_SYMBOLS if s not in symbols]
+        if len(symbols) > 255:
+            raise ValueError("음소 심볼이 너무 많습니다 (uint8 초과)")
+        symbol_ids = {s: i for i, s in enumerate(symbols)}
+
+        offsets = np.zeros(len(words) + 1, dtype=np.uint32)
+        phones: List[int] = []
+        for i, word in enumerate(words):
+            phones.extend(symbol_ids[p] for p in entries[word].split())
+            offsets[i + 1] = len(phones)
+
+        # 다른 프로세스와 동시에 컴파일해도 안전하도록 임시 디렉터리에 쓴 뒤 교체
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=parent, prefix=".lexicon-")
+        try:
+            np.save(os.path.join(tmp_dir, "words.npy"),
+                    np.array([w.encode("ascii") for w in words]))
+            np.save(os.path.join(tmp_dir, "phone_offsets.npy"), offsets)
+            np.save(os.path.join(tmp_dir, "phones.npy"), np.array(phones, dtype=np.uint8))
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": FORMAT_VERSION,
+                    "symbols": symbols,
+                    "num_words": len(words),
+                }, f)
+            if os.path.isdir(path):
+                shutil.rmtree(tmp_dir)
+            else:
+                os.replace(tmp_dir, path)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        return cls(path)
+
+    @classmethod
+    def load_or_compile(cls, path: Optional[str] = None) -> "PhonemeLexicon":
+        """컴파일된 사전이 있으면 로드, 없으면 컴파일"""
+        path = path or os.path.join(DEFAULT_CACHE_DIR, f"cmudict-v{FORMAT_VERSION}")
+        if os.path.exists(os.path.join(path, "meta.json")):
+            return cls(path)
+        return cls.compile(path)
+
+    def _index(self, word: str) -> int:
+        """정렬된 단어 배열에서 이진 탐색 (-1: 없음)"""
+        key = word.encode("ascii", "ignore")
+        if not key or len(key) > self._max_word_bytes or len(key) != len(word):
+            return -1
+        i = int(np.searchsorted(self._words, key))
+        if i < len(self._words) and self._words[i] == key:
+            return i
+        return -1
+
+    def _lookup_ids(self, word: str) -> Optional[Tuple[int, ...]]:
+        index = self._index(word)
+        if index < 0:
+            return None
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return tuple(self._phones[start:end].tolist())
+
+    def lookup_many(self, words: Iterable[str]) -> Dict[str, Optional[Tuple[int, ...]]]:
+        """
+        여러 단어를 한 번에 조회 (고유 단어만 모아 한 번의 벡터화 searchsorted)
+        Args:
+            words: 소문자 단어 목록
+        Returns:
+            단어 → 음소 ID 튜플 (사전에 없으면 None)
+        """
+        unique = sorted(set(words))
+        if not unique:
+            return {}
+        keys = np.array([w.encode("ascii", "ignore")[:self._max_word_bytes] for w in unique],
+                        dtype=self._words.dtype)
+        positions = np.searchsorted(self._words, keys)
+        found = positions < len(self._words)
+        found[found] &= self._words[positions[found]] == keys[found]
+
+        result = {}
+        for word, key, position, hit in zip(unique, keys, positions, found):
+            if hit and len(key) == len(word):
+                start, end = self._offsets[position], self._offsets[position + 1]
+                result[word] = tuple(self._phones[start:end].tolist())
+            else:
+                result[word] = None
+        return result
+
+    def token_id(self, token: str) -> int:
+        """음소/문자 토큰의 정수 ID (처음 보는 토큰은 새 ID 부여)"""
+        token_id = self._symbol_ids.get(token)
+        if token_id is None:
+            with self._extra_lock:
+                token_id = self._symbol_ids.setdefault(token, len(self.symbols))
+                if token_id == len(self.symbols):
+                    self.symbols.append(token)
+        return token_id
+
+    def word_ids(self, word: str) -> Tuple[int, ...]:
+        """단어의 음소 ID (사전에 없으면 문자 단위 ID)"""
+        ids = self.lookup_ids(word)
+        if ids is None:
+            ids = tuple(self.token_id(ch) for ch in word)
+        return ids
+
+    def to_symbols(self, ids: Iterable[int]) -> List[str]:
+        """음소 ID → 음소 문자열"""
+        return [self.symbols[i] for i in ids]
+
+    def _word_phonemes(self, word: str) -> Tuple[str, ...]:
+        return tuple(self.to_symbols(self.word_ids(word)))
+
+    def phonemes(self, words: Iterable[str]) -> List[str]:
+        """단어 목록의 음소 문자열 리스트 (사전에 없는 단어는 문자 단위)"""
+        result: List[str] = []
+        for word in words:
+            result.extend(self.word_phonemes(word))
+        return result
+
+    def cache_clear(self):
+        """조회 캐시 비우기"""
+        self.lookup_ids.cache_clear()
+        self.word_phonemes.cache_clear()
+
+
+_lexicon: Optional[PhonemeLexicon] = None
+_lexicon_failed = False
+_lexicon_lock = threading.Lock()
+
+
+def get_lexicon() -> Optional[PhonemeLexicon]:
+    """
+    프로세스 전역 렉시콘 (첫 호출 시 로드, 필요하면 컴파일)
+    Returns:
+        PhonemeLexicon 또는 None (cmudict 미설치/컴파일 실패)
+    """
+    global _lexicon, _lexicon_failed
+    if _lexicon is not None or _lexicon_failed:
+        return _lexicon
+    with _lexicon_lock:
+        if _lexicon is None and not _lexicon_failed:
+            try:
+                _lexicon = PhonemeLexicon.load_or_compile()
+            except Exception as e:
+                _lexicon_failed = True
+                print(f"음소 렉시콘 로드 실패: {e}")
+    return _lexicon
@@ -0,0 +1,156 @@
+"""
+연습 문장 저장소
+데이터 파일(JSON)의 연습 문장을 서버 시작 시 한 번 읽고, 문장마다 참조 쪽 산출물
+(단어 목록, 음소, 음소 ID 배열, 선택적으로 참조 TTS 녹음의 운율)을 미리 계산해 보관
+→ sentence_id로 스코어링/분석하면 참조 텍스트 처리 없이 바로 비교
+
+데이터 파일 형식:
+    {"version": 1, "sentences": [
+        {"id": "beginner-daily-01", "level": "beginner", "category": "daily",
+         "text": "Hello, how are you?", "reference_audio": "tts/beginner-daily-01.wav"},
+        ...
+    ]}
+    reference_audio(선택)는 데이터 파일 기준 상대 경로
+"""
+
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from prosody import summarize_prosody
+
+FORMAT_VERSION = 1
+
+
+class PracticeSentence:
+    """연습 문장 하나와 미리 계산한 참조 산출물"""
+
+    def __init__(
+        self,
+        sentence_id: str,
+        text: str,
+        level: str,
+        category: str,
+        words: List[str],
+        phonemes: List[str],
+        phoneme_ids: Optional[np.ndarray] = None,
+        reference_prosody: Optional[Dict] = None,
+    ):
+        """
+        Args:
+            sentence_id: 문장 ID
+            text: 문장 원문
+            level: 난이도 (beginner/intermediate/advanced)
+            category: 분류 (daily/business/travel)
+            words: 소문자 단어 목록
+            phonemes: 음소 문자열 목록
+            phoneme_ids: 렉시콘 음소 ID 배열 (렉시콘이 없으면 None)
+            reference_prosody: 참조 녹음 운율 분석 결과 + 피치 윤곽 (녹음이 없으면 None)
+        """
+        self.id = sentence_id
+        self.text = text
+        self.level = level
+        self.category = category
+        self.words = words
+        self.phonemes = phonemes
+        self.phoneme_ids = phoneme_ids
+        self.reference_prosody = reference_prosody
+
+    def summary(self) -> Dict:
+        """목록용 요약"""
+        return {'id': self.id, 'text': self.text, 'level': self.level, 'category': self.category}
+
+    def to_dict(self) -> Dict:
+        """상세 정보 (참조 산출물 포함)"""
+        return {
+            **self.summary(),
+            'words': self.words,
+            'phonemes': self.phonemes,
+            'phoneme_count': len(self.phonemes),
+            'reference_prosody': self.reference_prosody,
+        }
+
+
+class PracticeStore:
+    """연습 문장 저장소 (읽기 전용, 스레드 간 공유)"""
+
+    def __init__(self, path: str, analyzer, reference_prosody: bool = True):
+        """
+        데이터 파일을 읽고 문장별 참조 산출물 계산
+        Args:
+            path: 연습 문장 JSON 파일 경로
+            analyzer: 음소 변환/운율 분석에 사용할 PronunciationAnalyzer
+            reference_prosody: reference_audio가 있는 문장의 운율을 미리 분석할지 여부
+        """
+        self.path = path
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 연습 문장 파일 버전: {data.get('version')}")
+
+        base_dir = os.path.dirname(os.path.abspath(path))
+        self._sentences: Dict[str, PracticeSentence] = {}
+        self._by_group: Dict[tuple, List[PracticeSentence]] = {}
+        for entry in data['sentences']:
+            if entry['id'] in self._sentences:
+                raise ValueError(f"중복된 문장 ID: {entry['id']}")
+            sentence = self._prepare(entry, analyzer, base_dir, reference_prosody)
+            self._sentences[sentence.id] = sentence
+            self._by_group.setdefault((sentence.level, sentence.category), []).append(sentence)
+
+    @staticmethod
+    def _prepare(entry: Dict, analyzer, base_dir: str, reference_prosody: bool) -> PracticeSentence:
+        """문장 하나의 참조 산출물 계산"""
+        text = entry['text']
+        phoneme_ids = analyzer.get_phoneme_ids(text, static_only=True)
+
+        prosody_result = None
+        audio_path = entry.get('reference_audio')
+        if reference_prosody and audio_path:
+            audio_path = os.path.join(base_dir, audio_path)
+            try:
+                # 운율 결과와 피치 윤곽(유성 프레임, Hz)을 같은 프레임 특징에서 계산
+                features = analyzer.prosody_features(audio_path)
+                prosody_result = summarize_prosody(*features)
+                prosody_result['pitch_contour'] = np.round(features[1].voiced_pitch().astype(float), 1).tolist()
+            except Exception as e:
+                print(f"참조 운율 분석 실패 ({entry['id']}): {e}")
+                prosody_result = None
+
+        return PracticeSentence(
+            sentence_id=entry['id'],
+            text=text,
+            level=entry.get('level', ''),
+            category=entry.get('category', ''),
+            words=re.findall(r'\w+', text.lower()),
+            phonemes=analyzer.get_phonemes(text),
+            phoneme_ids=phoneme_ids,
+            reference_prosody=prosody_result,
+        )
+
+    def __len__(self) -> int:
+        return len(self._sentences)
+
+    def __iter__(self):
+        return iter(self._sentences.values())
+
+    def get(self, sentence_id: str) -> Optional[PracticeSentence]:
+        """ID로 문장 조회 (없으면 None)"""
+        return self._sentences.get(sentence_id)
+
+    def select(self, level: str, category: str) -> List[PracticeSentence]:
+        """난이도/분류별 문장 목록 (파일 순서)"""
+        return self._by_group.get((level, category), [])
+
+    def stats(self) -> Dict:
+        """문장 수와 참조 녹음 운율이 있는 문장 수"""
+        return {
+            'sentences': len(self._sentences),
+            'with_reference_prosody': sum(
+                1 for sentence in self._sentences.values() if sentence.reference_prosody
+            ),
+            'path': self.path,
+        }
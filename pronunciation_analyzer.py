@@ -3,65 +3,285 @@
 STT → Phoneme 비교 → 스코어링 → 피드백 생성
 """
 
+import importlib.util
 import io
+import itertools
 import re
+import threading
+from collections import deque
+from concurrent.futures import Future
 from difflib import SequenceMatcher
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional
 
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
-    WHISPER_AVAILABLE = False
+import metrics
+import model_registry
+from stt_backends import DECODE_PRESETS, DEFAULT_BACKEND, DecodeOptions, get_backend
+
+# Whisper 한 번에 처리하는 입력 길이 (30초 윈도우)
+WHISPER_WINDOW_SAMPLES = 30 * 16000
+
+# whisper(torch), librosa, pronouncing은 import 비용이 크므로 설치 여부만 확인하고
+# 실제 import와 모델 로드는 처음 사용할 때 수행 (API/Streamlit 콜드 스타트 단축)
+WHISPER_AVAILABLE = model_registry.WHISPER_AVAILABLE
+if not WHISPER_AVAILABLE:
     print("Warning: Whisper not available, using fallback STT")
 
-try:
-    import pronouncing
-    PRONOUNCING_AVAILABLE = True
-except ImportError:
-    PRONOUNCING_AVAILABLE = False
+PRONOUNCING_AVAILABLE = importlib.util.find_spec("pronouncing") is not None
+if not PRONOUNCING_AVAILABLE:
     print("Warning: pronouncing library not available")
 
+LIBROSA_AVAILABLE = importlib.util.find_spec("librosa") is not None
+if not LIBROSA_AVAILABLE:
+    print("Warning: librosa not available, prosody analysis disabled")
+
 try:
-    import librosa
     import numpy as np
-    LIBROSA_AVAILABLE = True
+    from audio_io import AudioInput, DecodedAudio, SAMPLE_RATE, as_audio, stream_blocks, DECODER_AVAILABLE
+    from prosody import (PITCH_METHODS, FrameFeatures, StreamingProsody, estimate_syllable_rate,
+                         extract_frame_features, summarize_prosody)
+    from phoneme_lexicon import get_lexicon
+    from alignment import align, align_tokens
+    from result_cache import ResultCache, audio_digest, digest_text
+    from vad import SpeechActivity, detect_speech
+    from passage import align_sentences, merge_scores, split_sentences
+    from practice_store import PracticeSentence
 except ImportError:
+    # numpy가 없으면 오디오 입력은 파일 경로로만 처리
+    AudioInput = str
+    DECODER_AVAILABLE = False
     LIBROSA_AVAILABLE = False
-    print("Warning: librosa not available, prosody analysis disabled")
+    
+    def get_lexicon():
+        return None
+    
+    align = align_tokens = None
+
+
+def _alignment_errors(ops: List[Tuple[str, int, int]], ref: List[str], hyp: List[str]) -> List[Dict]:
+    """
+    정렬 연산 중 일치가 아닌 것을 오류 목록으로 변환
+    (position은 참조 인덱스, 삽입은 바로 뒤 참조 토큰의 인덱스 = 끼어든 위치)
+    """
+    errors = []
+    next_ref = 0
+    for op, i, j in ops:
+        if i >= 0:
+            next_ref = i + 1
+        if op == 'match':
+            continue
+        errors.append({
+            'type': op,
+            'expected': ref[i] if i >= 0 else '',
+            'spoken': hyp[j] if j >= 0 else '',
+            'position': i if i >= 0 else next_ref
+        })
+    return errors
+
+
+def _opcode_ops(ref: List[str], hyp: List[str]) -> List[Tuple[str, int, int]]:
+    """SequenceMatcher 구간 → (연산, 참조 인덱스, 인식 인덱스) 목록 (numpy가 없을 때)"""
+    ops = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, ref, hyp, autojunk=False).get_opcodes():
+        pairs = min(i2 - i1, j2 - j1)
+        kind = 'match' if tag == 'equal' else 'substitute'
+        ops.extend((kind, i1 + k, j1 + k) for k in range(pairs))
+        ops.extend(('delete', i, -1) for i in range(i1 + pairs, i2))
+        ops.extend(('insert', -1, j) for j in range(j1 + pairs, j2))
+    return ops
 
 
 class PronunciationAnalyzer:
     """영어 발음 및 유창성 분석 클래스"""
     
-    def __init__(self, model_size: str = "base"):
+    def __init__(
+        self,
+        model_size: str = "base",
+        batch_max_size: int = 1,
+        batch_max_wait_ms: float = 20.0,
+        preload: bool = False,
+        result_cache: Optional["ResultCache"] = None,
+        vad_trim: bool = True,
+        stt_backend: str = DEFAULT_BACKEND,
+        stt_threads: int = 0,
+        decode: Optional[DecodeOptions] = None,
+        pitch_method: str = 'piptrack',
+        prosody_block_s: float = 0.0
+    ):
         """
-        초기화
+        초기화 (Whisper 모델은 첫 사용 시 로드되며 같은 model_size·백엔드 인스턴스끼리 공유)
         Args:
             model_size: Whisper 모델 크기 (tiny/base/small/medium)
+            batch_max_size: 동시 요청 STT 배칭 최대 크기 (1이면 배칭 안 함)
+            batch_max_wait_ms: 배치를 채우기 위한 최대 대기 시간 (ms)
+            preload: True면 생성 시점에 모델을 바로 로드
+            result_cache: 오디오 내용 해시 기반 결과 캐시 (None이면 캐시 안 함)
+            vad_trim: STT/운율 분석 전에 앞뒤 묵음을 자르고 긴 녹음을 쉼에서 분할
+            stt_backend: STT 백엔드 (torch: PyTorch 그대로, int8: CPU 동적 양자화)
+            stt_threads: STT 추론 스레드 수 (0이면 torch 기본값, 프로세스 전역 설정)
+            decode: Whisper 디코딩 옵션 (None이면 기본값, 짧은 영어 낭독은 read_aloud 프리셋)
+            pitch_method: 운율 분석 피치 추적 방식 (piptrack: STFT 피크, yin: 60~400 Hz F0 추적)
+            prosody_block_s: 운율 분석 블록 길이 (초, 0이면 전체를 한 번에, 양수면 블록 단위로 분석해
+                             최대 메모리가 녹음 길이와 무관)
+        Raises:
+            ValueError: 알 수 없는 피치 추적 방식
         """
+        if LIBROSA_AVAILABLE and pitch_method not in PITCH_METHODS:
+            raise ValueError(f"알 수 없는 피치 추적 방식: {pitch_method} (사용 가능: {', '.join(PITCH_METHODS)})")
         self.model_size = model_size
-        self.whisper_model = None
+        self.stt_backend = stt_backend
+        self.stt_threads = stt_threads
+        self.stt = get_backend(stt_backend, stt_threads)
+        self.decode = decode or DECODE_PRESETS['default']
+        # 결과 캐시 키 (백엔드·디코딩 옵션마다 인식 결과가 다를 수 있으므로 구분)
+        self.model_id = model_registry.model_key(model_size, stt_backend)
+        if self.decode.key:
+            self.model_id += f"+{self.decode.key}"
+        # 운율 결과 캐시 키 접미사 (기본 설정이면 없음, 피치 방식마다 pitch_variation이 다르고
+        # 블록 분석은 말하기 속도가 조금 다름)
+        self.pitch_method = pitch_method
+        self.prosody_block_s = prosody_block_s
+        self._prosody_suffix = ''
+        if pitch_method != 'piptrack':
+            self._prosody_suffix += f"+pitch={pitch_method}"
+        if prosody_block_s > 0:
+            self._prosody_suffix += f"+block={prosody_block_s:g}"
+        self.batch_max_size = batch_max_size
+        self.batch_max_wait_ms = batch_max_wait_ms
+        self.batcher = None
+        # 같은 모델을 공유하는 인스턴스끼리 추론 잠금도 공유
+        self._model_lock = model_registry.model_lock(model_size, stt_backend)
+        self._batcher_lock = threading.Lock()
+        self.result_cache = result_cache
+        self.vad_trim = vad_trim and DECODER_AVAILABLE
         
-        if WHISPER_AVAILABLE:
-            try:
-                self.whisper_model = whisper.load_model(model_size)
-                print(f"Whisper {model_size} 모델 로드 완료")
-            except Exception as e:
-                print(f"Whisper 로드 실패: {e}")
+        if preload:
+            model_registry.get_model(model_size, stt_backend, stt_threads)
+    
+    @property
+    def whisper_model(self):
+        """Whisper 모델 (첫 접근 시 레지스트리에서 로드)"""
+        if not WHISPER_AVAILABLE:
+            return None
+        return model_registry.get_model(self.model_size, self.stt_backend, self.stt_threads)
+    
+    def _get_batcher(self):
+        """STT 배처 (배칭이 켜져 있으면 첫 사용 시 생성)"""
+        if self.batch_max_size <= 1:
+            return None
+        if self.batcher is None:
+            with self._batcher_lock:
+                if self.batcher is None:
+                    from batching import WhisperBatcher
+                    self.batcher = WhisperBatcher(
+                        self.whisper_model,
+                        backend=self.stt,
+                        decode=self.decode,
+                        max_batch_size=self.batch_max_size,
+                        max_wait_ms=self.batch_max_wait_ms,
+                        lock=self._model_lock
+                    )
+        return self.batcher
     
-    def transcribe_audio(self, audio_path: str) -> str:
+    def _cache_digest(self, audio: AudioInput) -> Optional[str]:
+        """결과 캐시 키로 쓸 오디오 내용 해시 (캐시를 쓰지 않으면 None)"""
+        if self.result_cache is None:
+            return None
+        return audio_digest(audio)
+    
+    def _analysis_key(self, digest: str, reference_text: str) -> str:
+        return f"{self.model_id}{self._prosody_suffix}:{digest}:{digest_text(reference_text)}"
+    
+    def _prosody_key(self, digest: str) -> str:
+        return f"{digest}{self._prosody_suffix}"
+    
+    def _transcript_key(self, digest: str, prompt: Optional[str]) -> str:
+        # 참조 텍스트를 프롬프트로 쓰면 인식 결과가 참조 텍스트에 따라 달라짐
+        if prompt and self.decode.prompt_reference:
+            return f"{self.model_id}:{digest}:{digest_text(prompt)}"
+        return f"{self.model_id}:{digest}"
+    
+    def cached_transcript(self, digest: str, prompt: Optional[str] = None) -> Optional[str]:
+        """캐시된 인식 텍스트 (없으면 None)"""
+        if self.result_cache is None:
+            return None
+        return self.result_cache.get('transcript', self._transcript_key(digest, prompt))
+    
+    def store_transcript(self, digest: str, text: str, prompt: Optional[str] = None):
+        """인식 텍스트 캐시 저장 (빈 결과는 STT 실패일 수 있으므로 저장하지 않음)"""
+        if self.result_cache is not None and text:
+            self.result_cache.put('transcript', self._transcript_key(digest, prompt), text)
+    
+    def speech_activity(self, audio: AudioInput) -> Optional["SpeechActivity"]:
+        """
+        발화 구간 검출 (vad_trim이 꺼져 있으면 None)
+        Args:
+            audio: 오디오 파일 경로, 16 kHz 모노 파형 또는 DecodedAudio
+        Returns:
+            SpeechActivity 또는 None
+        """
+        if not self.vad_trim:
+            return None
+        decoded = as_audio(audio)
+        return detect_speech(decoded.samples, decoded.sample_rate)
+    
+    def _transcribe_many(self, model, chunks: List, prompts: Optional[List[str]] = None) -> List[str]:
+        """30초 이하 조각들을 각각 인식 (배칭이 켜져 있으면 한꺼번에 제출, prompts는 조각별 참조 텍스트)"""
+        prompts = prompts or [None] * len(chunks)
+        batcher = self._get_batcher()
+        if batcher is not None and all(len(chunk) <= batcher.max_samples for chunk in chunks):
+            futures = [batcher.submit(chunk, prompt) for chunk, prompt in zip(chunks, prompts)]
+            return [future.result() for future in futures]
+        texts = []
+        for chunk, prompt in zip(chunks, prompts):
+            with self._model_lock:
+                texts.append(self.stt.transcribe(model, chunk, self.decode, prompt))
+        return texts
+    
+    def _transcribe_chunks(self, model, chunks: List, prompt: Optional[str] = None) -> str:
+        """30초 이하 조각들을 인식해 이어 붙임"""
+        texts = self._transcribe_many(model, chunks, [prompt] * len(chunks))
+        return ' '.join(text for text in texts if text)
+    
+    def transcribe_audio(
+        self,
+        audio: AudioInput,
+        speech: Optional["SpeechActivity"] = None,
+        prompt: Optional[str] = None
+    ) -> str:
         """
         음성을 텍스트로 변환 (STT)
         Args:
-            audio_path: 오디오 파일 경로
+            audio: 오디오 파일 경로, 16 kHz 모노 파형 또는 DecodedAudio
+            speech: 미리 검출한 발화 구간 (없으면 vad_trim 설정에 따라 검출)
+            prompt: 참조 텍스트 (디코딩 옵션이 prompt_reference일 때 디코더 프롬프트로 사용)
         Returns:
             변환된 텍스트
         """
-        if self.whisper_model:
+        digest = self._cache_digest(audio)
+        if digest is not None:
+            cached = self.cached_transcript(digest, prompt)
+            if cached is not None:
+                return cached
+        
+        model = self.whisper_model
+        if model:
             try:
-                result = self.whisper_model.transcribe(audio_path)
-                return result["text"].strip().lower()
+                if DECODER_AVAILABLE:
+                    audio = as_audio(audio).samples
+                
+                if self.vad_trim:
+                    # 앞뒤 묵음을 잘라내고 30초 넘는 녹음은 쉼에서 분할 (발화가 없으면 STT 생략)
+                    speech = speech or detect_speech(audio)
+                    chunks = [audio[start:end] for start, end in speech.chunks(WHISPER_WINDOW_SAMPLES)]
+                else:
+                    chunks = [audio]
+                
+                # 30초 이하 조각은 다른 요청과 묶어 배치 추론
+                text = self._transcribe_chunks(model, chunks, prompt) if chunks else ""
+                
+                if digest is not None:
+                    self.store_transcript(digest, text, prompt)
+                return text
             except Exception as e:
                 print(f"Whisper 변환 실패: {e}")
                 return ""
@@ -77,11 +297,19 @@ class PronunciationAnalyzer:
         Returns:
             음소 리스트
         """
+        words = re.findall(r'\w+', text.lower())
+        
+        # 컴파일된 CMU 렉시콘 (mmap + LRU 캐시)
+        lexicon = get_lexicon()
+        if lexicon is not None:
+            return lexicon.phonemes(words)
+        
         if not PRONOUNCING_AVAILABLE:
             # Fallback: 간단한 음절 분리
             return text.lower().split()
         
-        words = re.findall(r'\w+', text.lower())
+        import pronouncing
+        
         phonemes = []
         
         for word in words:
@@ -95,52 +323,124 @@ class PronunciationAnalyzer:
         
         return phonemes
     
+    def get_phoneme_ids(self, text: str, static_only: bool = False) -> Optional["np.ndarray"]:
+        """
+        텍스트를 렉시콘 음소 ID 배열로 변환 (get_phonemes와 같은 순서)
+        Args:
+            text: 입력 텍스트
+            static_only: 렉시콘 파일에 없는 기호(처음 보는 문자)가 섞이면 None
+                         (다른 프로세스로 넘길 참조 ID는 파일 기호만 써야 같은 값)
+        Returns:
+            int32 음소 ID 배열 또는 None (렉시콘 없음)
+        """
+        lexicon = get_lexicon()
+        if lexicon is None:
+            return None
+        ids = np.fromiter(
+            itertools.chain.from_iterable(
+                lexicon.word_ids(word) for word in re.findall(r'\w+', text.lower())
+            ),
+            dtype=np.int32
+        )
+        if static_only and ids.size and ids.max() >= lexicon.static_symbols:
+            return None
+        return ids
+    
+    def align_phonemes(
+        self,
+        ref_phonemes: List[str],
+        spoken_phonemes: List[str],
+        ref_ids: Optional["np.ndarray"] = None,
+        spoken_ids: Optional["np.ndarray"] = None
+    ) -> Tuple[float, List[Dict]]:
+        """
+        음소 시퀀스 정렬 (정수 ID 편집 거리)
+        Args:
+            ref_phonemes: 참조 음소 리스트
+            spoken_phonemes: 인식 음소 리스트
+            ref_ids: 참조 음소의 렉시콘 ID (spoken_ids와 함께 주면 문자열 → ID 변환 생략)
+            spoken_ids: 인식 음소의 렉시콘 ID
+        Returns:
+            (음소 유사도 0~100, 치환/삽입/삭제 목록)
+        """
+        if align_tokens is None:
+            # numpy가 없으면 음소 단위 SequenceMatcher (연산 목록 없음)
+            return SequenceMatcher(None, ref_phonemes, spoken_phonemes).ratio() * 100, []
+        
+        if ref_ids is not None and spoken_ids is not None:
+            alignment = align(ref_ids, spoken_ids)
+        else:
+            alignment = align_tokens(ref_phonemes, spoken_phonemes)
+        phoneme_errors = _alignment_errors(alignment.ops, ref_phonemes, spoken_phonemes)
+        return alignment.similarity * 100, phoneme_errors
+    
+    def align_words(
+        self,
+        ref_words: List[str],
+        spoken_words: List[str]
+    ) -> Tuple[int, List[Dict]]:
+        """
+        단어 시퀀스 정렬 (단어 ID 편집 거리, 긴 지문도 정확하게 정렬)
+        앞에서 한 단어를 빠뜨려도 뒤 단어들이 한 칸씩 밀려 모두 틀린 것으로 처리되지 않음
+        Args:
+            ref_words: 참조 단어 리스트
+            spoken_words: 인식 단어 리스트
+        Returns:
+            (맞은 단어 수, 치환/삽입/삭제 목록)
+        """
+        if align_tokens is not None:
+            ops = align_tokens(ref_words, spoken_words).ops
+        else:
+            ops = _opcode_ops(ref_words, spoken_words)
+        matches = sum(1 for op, _, _ in ops if op == 'match')
+        return matches, _alignment_errors(ops, ref_words, spoken_words)
+    
     def calculate_pronunciation_score(
         self, 
         reference_text: str, 
-        spoken_text: str
+        spoken_text: str,
+        ref_phonemes: Optional[List[str]] = None,
+        spoken_phonemes: Optional[List[str]] = None,
+        reference: Optional["PracticeSentence"] = None
     ) -> Dict[str, any]:
         """
         발음 정확도 스코어 계산
         Args:
             reference_text: 참조(정답) 텍스트
             spoken_text: 사용자가 말한 텍스트 (STT 결과)
+            ref_phonemes: 미리 계산한 참조 음소 (없으면 계산)
+            spoken_phonemes: 미리 계산한 인식 음소 (없으면 계산)
+            reference: 연습 문장 저장소의 문장 (참조 단어/음소/음소 ID를 그대로 사용)
         Returns:
             스코어 정보 딕셔너리
         """
-        ref_words = re.findall(r'\w+', reference_text.lower())
+        ref_ids = spoken_ids = None
+        if reference is not None:
+            ref_words, ref_phonemes, ref_ids = reference.words, reference.phonemes, reference.phoneme_ids
+        else:
+            ref_words = re.findall(r'\w+', reference_text.lower())
         spoken_words = re.findall(r'\w+', spoken_text.lower())
         
-        # 1. 단어 레벨 정확도
-        word_matches = 0
-        mispronounced_words = []
-        
-        max_len = max(len(ref_words), len(spoken_words))
-        for i in range(max_len):
-            ref_word = ref_words[i] if i < len(ref_words) else ""
-            spoken_word = spoken_words[i] if i < len(spoken_words) else ""
-            
-            if ref_word and spoken_word:
-                if ref_word == spoken_word:
-                    word_matches += 1
-                else:
-                    mispronounced_words.append({
-                        'expected': ref_word,
-                        'spoken': spoken_word,
-                        'position': i
-                    })
+        # 1. 단어 레벨 정확도 (정렬: 일치/치환/삽입/삭제)
+        word_matches, word_errors = self.align_words(ref_words, spoken_words)
+        mispronounced_words = [error for error in word_errors if error['type'] == 'substitute']
         
         word_accuracy = (word_matches / len(ref_words) * 100) if ref_words else 0
         
         # 2. 음소 레벨 유사도
-        ref_phonemes = self.get_phonemes(reference_text)
-        spoken_phonemes = self.get_phonemes(spoken_text)
+        if ref_phonemes is None:
+            ref_phonemes = self.get_phonemes(reference_text)
+        if spoken_phonemes is None and ref_ids is not None:
+            # 참조 음소 ID가 있으면 인식 쪽도 ID로 바로 변환해 ID끼리 정렬
+            spoken_ids = self.get_phoneme_ids(spoken_text)
+            if spoken_ids is not None:
+                spoken_phonemes = get_lexicon().to_symbols(spoken_ids.tolist())
+        if spoken_phonemes is None:
+            spoken_phonemes = self.get_phonemes(spoken_text)
         
-        phoneme_similarity = SequenceMatcher(
-            None, 
-            ' '.join(ref_phonemes), 
-            ' '.join(spoken_phonemes)
-        ).ratio() * 100
+        phoneme_similarity, phoneme_errors = self.align_phonemes(
+            ref_phonemes, spoken_phonemes, ref_ids, spoken_ids
+        )
         
         # 3. 전체 스코어 (가중 평균)
         overall_score = (word_accuracy * 0.6) + (phoneme_similarity * 0.4)
@@ -150,58 +450,187 @@ class PronunciationAnalyzer:
             'word_accuracy': round(word_accuracy, 1),
             'phoneme_similarity': round(phoneme_similarity, 1),
             'mispronounced_words': mispronounced_words,
+            'word_errors': word_errors,
+            'phoneme_errors': phoneme_errors,
             'word_count': len(ref_words),
             'correct_words': word_matches
         }
     
-    def analyze_prosody(self, audio_path: str) -> Dict[str, float]:
+    def score_chunk(self, pairs: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        텍스트 쌍 묶음 스코어링 (같은 텍스트의 음소는 묶음 안에서 한 번만 계산)
+        Args:
+            pairs: (참조 텍스트, 인식 텍스트) 리스트
+        Returns:
+            쌍별 스코어 정보 리스트 (입력 순서)
+        """
+        phonemes: Dict[str, List[str]] = {}
+        for text in itertools.chain.from_iterable(pairs):
+            if text not in phonemes:
+                phonemes[text] = self.get_phonemes(text)
+        
+        return [
+            self.calculate_pronunciation_score(
+                reference_text, spoken_text,
+                phonemes[reference_text], phonemes[spoken_text]
+            )
+            for reference_text, spoken_text in pairs
+        ]
+    
+    def score_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        chunk_size: int = 256,
+        submit: Optional[Callable[[List[Tuple[str, str]]], Future]] = None,
+        max_in_flight: int = 4
+    ) -> Iterator[Dict]:
+        """
+        대량 텍스트 쌍 스코어링 (입력을 청크로 나눠 처리하고 결과를 순서대로 스트리밍)
+        Args:
+            pairs: (참조 텍스트, 인식 텍스트) 이터러블 (지연 소비)
+            chunk_size: 청크당 쌍 수
+            submit: 청크를 병렬 실행기에 넘기고 Future를 돌려주는 함수
+                    (예: 워커 풀의 score_chunk 호출, 없으면 현재 스레드에서 처리)
+            max_in_flight: submit 사용 시 동시에 처리 중인 최대 청크 수
+        Yields:
+            쌍별 스코어 정보 (입력 순서)
+        """
+        iterator = iter(pairs)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+        
+        if submit is None:
+            for chunk in chunks:
+                yield from self.score_chunk(chunk)
+            return
+        
+        # 앞선 청크 결과를 내보내는 동안 다음 청크들을 미리 제출
+        pending = deque()
+        for chunk in chunks:
+            pending.append(submit(chunk))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    
+    def prosody_features(
+        self,
+        audio: AudioInput,
+        speech: Optional["SpeechActivity"] = None
+    ) -> Tuple[Dict[str, float], "FrameFeatures", Optional["SpeechActivity"]]:
+        """
+        운율 특징 계산: 말하기 속도 + 프레임 특징 행렬 (STFT 한 번에서 피치, 에너지, 스펙트럼 특징,
+        pitch_method가 yin이면 피치는 track_pitch_yin)
+        Args:
+            audio: 오디오 파일 경로, 16 kHz 모노 파형 또는 DecodedAudio
+            speech: 미리 검출한 발화 구간 (없으면 vad_trim 설정에 따라 검출)
+        Returns:
+            (estimate_syllable_rate 결과, FrameFeatures, 발화 구간 또는 None)
+        Raises:
+            ValueError: 발화가 검출되지 않음
+        """
+        # 오디오 로드 (이미 디코딩된 입력은 재사용)
+        decoded = as_audio(audio)
+        y, sr = decoded.samples, decoded.sample_rate
+        
+        # 앞뒤 묵음 제거 (말하기 속도가 녹음 앞뒤 대기 시간에 희석되지 않도록)
+        if self.vad_trim:
+            speech = speech or detect_speech(y, sr)
+            if not speech.has_speech:
+                raise ValueError("발화가 검출되지 않았습니다")
+            y = speech.trim(y)
+        
+        # 말하기 속도 (음절핵 검출 기반 초당 음절 수, 쉼 제외 조음 속도)
+        rate = estimate_syllable_rate(y, sr)
+        return rate, extract_frame_features(y, sr, pitch_method=self.pitch_method), speech
+    
+    def prosody_stream(self) -> "StreamingProsody":
+        """
+        이 분석기 설정의 블록 단위 운율 누적기 (블록 길이 prosody_block_s, 0이면 30초)
+        Returns:
+            StreamingProsody (16 kHz 샘플을 update로 넣고 finish로 결과)
+        """
+        block_samples = int((self.prosody_block_s or 30.0) * SAMPLE_RATE)
+        return StreamingProsody(SAMPLE_RATE, block_samples, self.pitch_method)
+    
+    def stream_prosody(
+        self,
+        audio: AudioInput,
+        speech: Optional["SpeechActivity"] = None
+    ) -> Dict[str, float]:
+        """
+        블록 단위 운율 분석 (prosody_block_s 길이 블록마다 특징을 계산해 누적 통계만 유지)
+        파일 경로는 블록 단위로 디코딩하므로 녹음 전체를 메모리에 올리지 않음 (이때는 앞뒤 묵음 제거와
+        쉼 통계 없음), 파형/DecodedAudio는 vad_trim 설정대로 묵음을 자른 뒤 복사 없는 슬라이스로 분석
+        Args:
+            audio: 오디오 파일 경로, 16 kHz 모노 파형 또는 DecodedAudio
+            speech: 미리 검출한 발화 구간 (없으면 vad_trim 설정에 따라 검출)
+        Returns:
+            운율 분석 결과 (analyze_prosody와 같은 키)
+        Raises:
+            ValueError: 발화가 검출되지 않음
+            RuntimeError: 파일을 블록 단위로 디코딩할 수 없음
+        """
+        stream = self.prosody_stream()
+        if isinstance(audio, (DecodedAudio, np.ndarray)):
+            y = as_audio(audio).samples
+            if self.vad_trim:
+                speech = speech or detect_speech(y, SAMPLE_RATE)
+                if not speech.has_speech:
+                    raise ValueError("발화가 검출되지 않았습니다")
+                y = speech.trim(y)
+            audio = y
+        else:
+            speech = None
+        
+        for block in stream_blocks(audio, stream.block_samples):
+            stream.update(block)
+        result = stream.finish()
+        if speech is not None:
+            result['pauses'] = speech.pause_stats()
+        return result
+    
+    def analyze_prosody(
+        self,
+        audio: AudioInput,
+        speech: Optional["SpeechActivity"] = None
+    ) -> Dict[str, float]:
         """
         운율(prosody) 분석: 말하기 속도, 피치 변화 등
         Args:
-            audio_path: 오디오 파일 경로
+            audio: 오디오 파일 경로, 16 kHz 모노 파형 또는 DecodedAudio
+            speech: 미리 검출한 발화 구간 (없으면 vad_trim 설정에 따라 검출)
         Returns:
-            운율 분석 결과
+            운율 분석 결과 (vad_trim이 켜져 있으면 쉼 통계 'pauses' 포함)
         """
         if not LIBROSA_AVAILABLE:
             return {
                 'speaking_rate': 0.0,
+                'articulation_rate': 0.0,
                 'pitch_variation': 0.0,
                 'energy_variation': 0.0
             }
         
+        digest = self._cache_digest(audio)
+        if digest is not None:
+            cached = self.result_cache.get('prosody', self._prosody_key(digest))
+            if cached is not None:
+                return cached
+        
         try:
-            # 오디오 로드
-            y, sr = librosa.load(audio_path, sr=None)
-            
-            # 1. 말하기 속도 (초당 음절 수 추정)
-            tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
-            speaking_rate = tempo / 60.0  # BPM to Hz
-            
-            # 2. 피치 변화 (F0 분석)
-            pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-            pitch_values = []
-            for t in range(pitches.shape[1]):
-                index = magnitudes[:, t].argmax()
-                pitch = pitches[index, t]
-                if pitch > 0:
-                    pitch_values.append(pitch)
-            
-            pitch_variation = np.std(pitch_values) if pitch_values else 0.0
-            
-            # 3. 에너지 변화
-            rms = librosa.feature.rms(y=y)[0]
-            energy_variation = np.std(rms)
-            
-            return {
-                'speaking_rate': round(float(speaking_rate), 2),
-                'pitch_variation': round(float(pitch_variation), 2),
-                'energy_variation': round(float(energy_variation), 4)
-            }
+            # 말하기 속도, 피치 변화(F0), 에너지 변화 (prosody_block_s가 있으면 블록 단위)
+            if self.prosody_block_s > 0:
+                prosody_result = self.stream_prosody(audio, speech)
+            else:
+                prosody_result = summarize_prosody(*self.prosody_features(audio, speech))
+            if digest is not None:
+                self.result_cache.put('prosody', self._prosody_key(digest), prosody_result)
+            return prosody_result
         
         except Exception as e:
             print(f"Prosody 분석 실패: {e}")
             return {
                 'speaking_rate': 0.0,
+                'articulation_rate': 0.0,
                 'pitch_variation': 0.0,
                 'energy_variation': 0.0
             }
@@ -247,12 +676,21 @@ class PronunciationAnalyzer:
                     f"  • '{error['expected']}' → 당신: '{error['spoken']}'"
                 )
         
+        # 빠뜨린 단어 / 덧붙인 단어
+        word_errors = pronunciation_result.get('word_errors', [])
+        missing = [error['expected'] for error in word_errors if error['type'] == 'delete']
+        extra = [error['spoken'] for error in word_errors if error['type'] == 'insert']
+        if missing:
+            feedback_parts.append(f"\n🔇 빠뜨린 단어: {', '.join(missing[:5])}")
+        if extra:
+            feedback_parts.append(f"\n➕ 덧붙인 단어: {', '.join(extra[:5])}")
+        
         # 운율 피드백
         if prosody_result and prosody_result.get('speaking_rate', 0) > 0:
             rate = prosody_result['speaking_rate']
-            if rate < 1.5:
+            if rate < 2.5:
                 feedback_parts.append("\n🐢 말하기 속도가 느려요. 좀 더 자연스럽게 말해보세요.")
-            elif rate > 3.0:
+            elif rate > 5.5:
                 feedback_parts.append("\n🐇 말하기 속도가 빨라요. 천천히 또박또박 발음해보세요.")
             else:
                 feedback_parts.append("\n✅ 말하기 속도가 적절해요.")
@@ -261,39 +699,268 @@ class PronunciationAnalyzer:
     
     def full_analysis(
         self, 
-        audio_path: str, 
-        reference_text: str
+        audio: AudioInput, 
+        reference_text: str,
+        reference: Optional["PracticeSentence"] = None
     ) -> Dict:
         """
         전체 분석 파이프라인 실행
         Args:
-            audio_path: 음성 파일 경로
+            audio: 음성 파일 경로, 16 kHz 모노 파형 또는 DecodedAudio
             reference_text: 참조 텍스트
+            reference: 연습 문장 저장소의 문장 (미리 계산한 참조 산출물 사용)
         Returns:
-            완전한 분석 결과
+            완전한 분석 결과 (reference에 참조 녹음 운율이 있으면 reference_prosody 포함)
         """
-        # 1. STT
-        spoken_text = self.transcribe_audio(audio_path)
+        # 같은 오디오 + 참조 텍스트의 이전 결과 재사용 (재제출/재시도)
+        digest = self._cache_digest(audio)
+        if digest is not None:
+            cached = self.result_cache.get('analysis', self._analysis_key(digest, reference_text))
+            if cached is not None:
+                return self._with_reference(cached, reference)
         
-        # 2. 발음 분석
-        pronunciation_result = self.calculate_pronunciation_score(
-            reference_text, 
-            spoken_text
-        )
+        # 0. 오디오 디코딩 (요청당 한 번, STT와 운율 분석이 공유)
+        if DECODER_AVAILABLE:
+            if not isinstance(audio, DecodedAudio):
+                with metrics.span('decode'):
+                    audio = as_audio(audio)
+            audio.digest = audio.digest or digest
         
-        # 3. 운율 분석
-        prosody_result = self.analyze_prosody(audio_path)
+        # 발화 구간 검출 (요청당 한 번, STT와 운율 분석이 공유)
+        with metrics.span('vad'):
+            speech = self.speech_activity(audio)
         
-        # 4. 피드백 생성
-        feedback = self.generate_feedback(pronunciation_result, prosody_result)
+        # 1. STT (참조 텍스트만 바뀐 재제출은 캐시된 인식 결과 사용)
+        with metrics.span('transcribe'):
+            spoken_text = self.transcribe_audio(audio, speech, prompt=reference_text)
         
-        return {
+        # 2~4. 발음 분석, 운율 분석, 피드백 생성
+        with metrics.span('prosody'):
+            prosody_result = self.analyze_prosody(audio, speech)
+        result = self.compose_analysis(reference_text, spoken_text, prosody_result, reference)
+        
+        if digest is not None:
+            self.result_cache.put('analysis', self._analysis_key(digest, reference_text),
+                                  self._with_reference(result, None))
+        return result
+    
+    def compose_analysis(
+        self,
+        reference_text: str,
+        spoken_text: str,
+        prosody_result: Dict,
+        reference: Optional["PracticeSentence"] = None
+    ) -> Dict:
+        """인식 텍스트와 운율 결과로 발음 스코어·피드백을 계산해 전체 결과 구성"""
+        with metrics.span('score'):
+            pronunciation_result = self.calculate_pronunciation_score(
+                reference_text, 
+                spoken_text,
+                reference=reference
+            )
+        with metrics.span('feedback'):
+            feedback = self.generate_feedback(pronunciation_result, prosody_result)
+        
+        return self._with_reference({
             'spoken_text': spoken_text,
             'reference_text': reference_text,
             'pronunciation': pronunciation_result,
             'prosody': prosody_result,
             'feedback': feedback
+        }, reference)
+    
+    @staticmethod
+    def _with_reference(result: Dict, reference: Optional["PracticeSentence"]) -> Dict:
+        """연습 문장의 참조 녹음 운율을 결과에 붙임 (캐시에는 붙이지 않은 결과를 저장)"""
+        if reference is None or not reference.reference_prosody:
+            return {key: value for key, value in result.items() if key != 'reference_prosody'}
+        return {**result, 'reference_prosody': reference.reference_prosody}
+    
+    def analyze_segment(self, samples: "np.ndarray", reference_text: str) -> Dict:
+        """
+        지문 구간 하나 인식 + 스코어링 (워커 풀에서 구간별로 병렬 실행)
+        Args:
+            samples: 구간 16 kHz 모노 파형
+            reference_text: 구간에 대응하는 참조 문장
+        Returns:
+            인식 텍스트와 발음 스코어
+        """
+        with metrics.span('transcribe'):
+            spoken_text = self.transcribe_audio(samples, prompt=reference_text)
+        with metrics.span('score'):
+            pronunciation_result = self.calculate_pronunciation_score(reference_text, spoken_text)
+        return {
+            'spoken_text': spoken_text,
+            'pronunciation': pronunciation_result
+        }
+    
+    def _transcribe_segments(
+        self,
+        samples: "np.ndarray",
+        bounds: List[Tuple[int, int]],
+        prompts: List[str]
+    ) -> List[str]:
+        """지문 구간들을 인식 (30초 넘는 구간은 쉼에서 다시 나누고 모든 조각을 한꺼번에 제출,
+        prompts는 구간별 참조 문장)"""
+        model = self.whisper_model
+        if not model:
+            return [self.transcribe_audio(samples[start:end], prompt=prompt)
+                    for (start, end), prompt in zip(bounds, prompts)]
+        
+        pieces, owners = [], []
+        for index, (start, end) in enumerate(bounds):
+            spans = [(start, end)]
+            if end - start > WHISPER_WINDOW_SAMPLES:
+                spans = [(start + s, start + e) for s, e in
+                         detect_speech(samples[start:end]).chunks(WHISPER_WINDOW_SAMPLES)]
+            pieces.extend(samples[s:e] for s, e in spans)
+            owners.extend([index] * len(spans))
+        
+        try:
+            texts = self._transcribe_many(model, pieces, [prompts[owner] for owner in owners])
+        except Exception as e:
+            print(f"Whisper 변환 실패: {e}")
+            texts = [""] * len(pieces)
+        
+        joined: List[List[str]] = [[] for _ in bounds]
+        for owner, text in zip(owners, texts):
+            if text:
+                joined[owner].append(text)
+        return [' '.join(parts) for parts in joined]
+    
+    def passage_analysis(
+        self,
+        audio: AudioInput,
+        reference_text: str,
+        submit: Optional[Callable[..., Future]] = None
+    ) -> Dict:
+        """
+        긴 지문 분석: 참조 지문은 문장으로, 녹음은 쉼에서 나눠 대응시킨 뒤
+        구간별로 인식·스코어링하고 문장 구간별/전체 결과로 합침
+        (문장이 하나뿐이면 full_analysis와 같음)
+        Args:
+            audio: 음성 파일 경로, 16 kHz 모노 파형 또는 DecodedAudio
+            reference_text: 참조 지문
+            submit: (메서드 이름, *인자)를 병렬 실행기에 넘기고 Future를 돌려주는 함수
+                    (예: 워커 풀 제출, 없으면 현재 프로세스에서 구간들을 한꺼번에 배치 인식)
+        Returns:
+            full_analysis와 같은 결과 + 구간별 결과 'segments'
+        """
+        sentences = split_sentences(reference_text) if DECODER_AVAILABLE else []
+        if len(sentences) < 2:
+            return self.full_analysis(audio, reference_text)
+        
+        digest = self._cache_digest(audio)
+        if digest is not None:
+            cached = self.result_cache.get('passage', self._analysis_key(digest, reference_text))
+            if cached is not None:
+                return cached
+        
+        if not isinstance(audio, DecodedAudio):
+            with metrics.span('decode'):
+                audio = as_audio(audio)
+        audio.digest = audio.digest or digest
+        samples, sr = audio.samples, audio.sample_rate
+        with metrics.span('vad'):
+            speech = self.speech_activity(audio) or detect_speech(samples, sr)
+        if not speech.has_speech:
+            result = self.compose_analysis(reference_text, "", self.analyze_prosody(audio, speech))
+            result['segments'] = []
+            return result
+        
+        with metrics.span('segment'):
+            spans = align_sentences(speech, sentences)
+        texts = [' '.join(sentences[first:last]) for first, last, _, _ in spans]
+        
+        if submit is not None:
+            # 운율 분석(녹음 전체)과 구간별 인식·스코어링을 워커들에 동시에 제출
+            prosody_future = submit('analyze_prosody', audio, speech)
+            futures = [submit('analyze_segment', samples[start:end], text)
+                       for (_, _, start, end), text in zip(spans, texts)]
+            parts = [future.result() for future in futures]
+            prosody_result = prosody_future.result()
+        else:
+            with metrics.span('transcribe'):
+                spoken = self._transcribe_segments(samples, [(start, end) for _, _, start, end in spans], texts)
+            with metrics.span('score'):
+                parts = [
+                    {'spoken_text': spoken_text,
+                     'pronunciation': self.calculate_pronunciation_score(text, spoken_text)}
+                    for text, spoken_text in zip(texts, spoken)
+                ]
+            with metrics.span('prosody'):
+                prosody_result = self.analyze_prosody(audio, speech)
+        
+        to_ms = 1000.0 / sr
+        segments = [
+            {
+                'sentences': [first, last],
+                'reference_text': text,
+                'spoken_text': part['spoken_text'],
+                'start_ms': round(start * to_ms, 1),
+                'end_ms': round(end * to_ms, 1),
+                'pronunciation': part['pronunciation']
+            }
+            for (first, last, start, end), text, part in zip(spans, texts, parts)
+        ]
+        pronunciation_result = merge_scores(
+            [part['pronunciation'] for part in parts],
+            [len(self.get_phonemes(text)) for text in texts]
+        )
+        result = {
+            'spoken_text': ' '.join(part['spoken_text'] for part in parts if part['spoken_text']),
+            'reference_text': reference_text,
+            'pronunciation': pronunciation_result,
+            'prosody': prosody_result,
+            'feedback': self.generate_feedback(pronunciation_result, prosody_result),
+            'segments': segments
         }
+        
+        if digest is not None:
+            self.result_cache.put('passage', self._analysis_key(digest, reference_text), result)
+        return result
+    
+    def cached_analysis(
+        self,
+        digest: str,
+        reference_text: str,
+        reference: Optional["PracticeSentence"] = None
+    ) -> Optional[Dict]:
+        """
+        캐시만으로 전체 분석 결과 구성 (디코딩/STT/운율 분석 없이)
+        Args:
+            digest: 오디오 내용 해시
+            reference_text: 참조 텍스트
+            reference: 연습 문장 저장소의 문장 (있으면 참조 산출물 사용)
+        Returns:
+            분석 결과 또는 None (인식 텍스트나 운율 결과가 캐시에 없음)
+        """
+        if self.result_cache is None:
+            return None
+        key = self._analysis_key(digest, reference_text)
+        result = self.result_cache.get('analysis', key)
+        if result is not None:
+            return self._with_reference(result, reference)
+        
+        spoken_text = self.cached_transcript(digest, reference_text)
+        prosody_result = self.result_cache.get('prosody', self._prosody_key(digest)) if spoken_text is not None else None
+        if prosody_result is None:
+            return None
+        
+        result = self.compose_analysis(reference_text, spoken_text, prosody_result, reference)
+        self.result_cache.put('analysis', key, self._with_reference(result, None))
+        return result
+    
+    def store_analysis(self, digest: str, result: Dict):
+        """다른 프로세스(워커 풀)에서 계산한 전체 분석 결과를 캐시에 저장"""
+        if self.result_cache is None:
+            return
+        self.result_cache.put('analysis', self._analysis_key(digest, result['reference_text']),
+                              self._with_reference(result, None))
+        self.store_transcript(digest, result['spoken_text'], result['reference_text'])
+        # 실패한 운율 분석(전부 0)은 저장하지 않음
+        if result.get('prosody') and any(result['prosody'].values()):
+            self.result_cache.put('prosody', self._prosody_key(digest), result['prosody'])
 
 
 # 테스트/데모용 함수
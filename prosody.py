@@ -0,0 +1,609 @@
+"""
+운율(prosody) 특징 추출 모듈
+피치/에너지/속도 계산을 NumPy 벡터 연산으로 처리
+(피치·에너지·스펙트럼 특징은 한 번의 프레임 분할/STFT에서 함께 계산)
+
+피치 추적 방식 (PITCH_METHODS):
+    piptrack  STFT 피크 선택 (librosa.piptrack과 같은 결과, 배음/포먼트 피크를 고를 수 있음)
+    yin       다운샘플한 신호에서 YIN(누적 평균 정규화 차분 함수)으로 60~400 Hz 기본 주파수 추적
+"""
+
+import importlib.util
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# scipy.signal은 필터링 시점에 import (모듈 로드 시간 단축)
+SCIPY_AVAILABLE = importlib.util.find_spec("scipy") is not None
+
+# 음절핵(모음) 에너지가 집중되는 대역 (Hz)
+SYLLABLE_BAND = (300.0, 2500.0)
+
+
+def extract_pitch_contour(pitches: np.ndarray, magnitudes: np.ndarray) -> np.ndarray:
+    """
+    piptrack 결과에서 프레임별 대표 피치(최대 크기 bin)를 한 번에 추출
+    Args:
+        pitches: librosa.piptrack 피치 행렬 (freq_bins × frames)
+        magnitudes: librosa.piptrack 크기 행렬 (freq_bins × frames)
+    Returns:
+        유성(pitch > 0) 프레임의 피치 값 배열 (Hz)
+    """
+    if pitches.size == 0:
+        return np.empty(0, dtype=pitches.dtype)
+
+    # 프레임별 argmax → gather → 무성 프레임 마스킹
+    index = magnitudes.argmax(axis=0)
+    contour = np.take_along_axis(pitches, index[np.newaxis, :], axis=0)[0]
+    return contour[contour > 0]
+
+
+PITCH_METHODS = ('piptrack', 'yin')
+
+# YIN 기본값: 말소리 F0 대역, 다운샘플 목표 레이트, 비주기성 임계값
+YIN_FMIN = 60.0
+YIN_FMAX = 400.0
+YIN_TARGET_SR = 4000
+YIN_THRESHOLD = 0.15
+YIN_SILENCE_DB = 40.0
+
+# 프레임 특징 행렬의 행 순서
+FRAME_FEATURES = ('pitch', 'pitch_magnitude', 'rms', 'onset', 'centroid', 'flatness')
+_FEATURE_INDEX = {name: i for i, name in enumerate(FRAME_FEATURES)}
+
+
+class FrameFeatures:
+    """프레임별 운율 특징 (특징 × 프레임 float32 행렬, 행 순서는 FRAME_FEATURES)"""
+
+    def __init__(self, matrix: np.ndarray, sample_rate: int, hop_length: int):
+        """
+        Args:
+            matrix: 특징 × 프레임 행렬
+            sample_rate: 샘플링 레이트
+            hop_length: 프레임 간격 (샘플)
+        """
+        self.matrix = matrix
+        self.sample_rate = sample_rate
+        self.hop_length = hop_length
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.matrix[_FEATURE_INDEX[name]]
+
+    @property
+    def n_frames(self) -> int:
+        return self.matrix.shape[1]
+
+    def times(self) -> np.ndarray:
+        """프레임 중심 시각 (초)"""
+        return np.arange(self.n_frames) * (self.hop_length / self.sample_rate)
+
+    def voiced_pitch(self) -> np.ndarray:
+        """유성 프레임의 피치 값 (Hz, extract_pitch_contour와 같음)"""
+        pitch = self['pitch']
+        return pitch[pitch > 0]
+
+
+@lru_cache(maxsize=8)
+def _hann(n_fft: int) -> np.ndarray:
+    """주기형 Hann 창 (librosa.stft 기본 창과 같음)"""
+    return (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n_fft) / n_fft)).astype(np.float32)
+
+
+def _peak_pitch(S: np.ndarray, sr: int, n_fft: int, fmin: float, fmax: float,
+                threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    프레임별 대표 피치 (librosa.piptrack + extract_pitch_contour와 같은 결과)
+    fmin~fmax 대역 bin만으로 국소 최대값 + 포물선 보간을 계산하고 보간 크기가 가장 큰 피크를 선택
+    Args:
+        S: 크기 스펙트로그램 (프레임 × bin)
+    Returns:
+        (프레임별 피치 Hz (무성이면 0), 피크 크기)
+    """
+    n_frames, n_bins = S.shape
+    freqs = np.arange(n_bins) * (sr / n_fft)
+    band = np.flatnonzero((freqs >= max(fmin, 0.0)) & (freqs < min(fmax, sr / 2)))
+    lo, hi = max(1, band[0]) if band.size else 1, min(n_bins - 1, band[-1] + 1) if band.size else 1
+    if hi <= lo or n_frames == 0:
+        return np.zeros(n_frames, dtype=np.float32), np.zeros(n_frames, dtype=np.float32)
+
+    # 이웃 bin 포함 대역 (국소 최대값/보간에 양옆 bin 필요)
+    seg = S[:, lo - 1:hi + 1]
+    masked = seg * (seg > threshold * S.max(axis=1, keepdims=True))
+    center = masked[:, 1:-1]
+    frame, col = np.nonzero((center > masked[:, :-2]) & (center >= masked[:, 2:]))
+
+    # 피크에서만 포물선 보간 (보간 위치가 ±1 bin을 넘으면 이동 없음)
+    left, mid, right = seg[frame, col], seg[frame, col + 1], seg[frame, col + 2]
+    a = right + left - 2 * mid
+    b = 0.5 * (right - left)
+    shift = np.divide(-b, a, out=np.zeros_like(b), where=np.abs(b) < np.abs(a))
+    magnitude = mid + 0.5 * b * shift
+
+    pitch = np.zeros(n_frames)
+    peak = np.zeros(n_frames)
+    if frame.size:
+        # 프레임별 보간 크기 최대 피크 (같으면 낮은 bin: np.nonzero 결과는 프레임, bin 순)
+        starts = np.flatnonzero(np.r_[True, frame[1:] != frame[:-1]])
+        best = np.maximum.reduceat(magnitude, starts)
+        is_best = magnitude == np.repeat(best, np.diff(np.r_[starts, frame.size]))
+        candidates = np.flatnonzero(is_best)
+        chosen = candidates[np.r_[True, frame[candidates[1:]] != frame[candidates[:-1]]]]
+        peak[frame[chosen]] = magnitude[chosen]
+        pitch[frame[chosen]] = (lo + col[chosen] + shift[chosen]) * (sr / n_fft)
+    return pitch.astype(np.float32), peak.astype(np.float32)
+
+
+@lru_cache(maxsize=8)
+def _lowpass(factor: int) -> np.ndarray:
+    """다운샘플 전 저역 통과 FIR (새 나이퀴스트의 75%에서 차단, F0와 낮은 배음만 남기면 되므로 짧은 필터)"""
+    from scipy import signal
+    return signal.firwin(8 * factor + 1, 0.75 / factor).astype(np.float32)
+
+
+def _downsample(y: np.ndarray, factor: int) -> np.ndarray:
+    """저역 통과 후 factor배 다운샘플 (출력 샘플 i는 입력 샘플 i × factor에 정렬, scipy 없으면 박스카 평균)"""
+    if factor <= 1:
+        return np.asarray(y, dtype=np.float32)
+    if not SCIPY_AVAILABLE:
+        return _decimate_boxcar(y, factor)
+    from scipy import signal
+    taps = _lowpass(factor)
+    delay = (len(taps) - 1) // 2
+    lead = -delay % factor
+    x = np.concatenate((np.zeros(lead, dtype=np.float32), np.asarray(y, dtype=np.float32)))
+    return signal.upfirdn(taps, x, 1, factor)[(delay + lead) // factor:][:-(-len(y) // factor)]
+
+
+def track_pitch_yin(
+    y: np.ndarray,
+    sr: int,
+    hop_length: int = 160,
+    fmin: float = YIN_FMIN,
+    fmax: float = YIN_FMAX,
+    threshold: float = YIN_THRESHOLD,
+    silence_db: float = YIN_SILENCE_DB,
+    block_frames: int = 1024,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    YIN 기본 주파수 추적 (다운샘플한 신호, 프레임 블록 단위 FFT 상관 → 메모리 사용량 제한)
+    프레임 t는 원본 샘플 t × hop_length를 중심으로 하므로 같은 hop_length의 STFT 프레임과 맞음
+    (hop_length가 다운샘플 배수로 나누어떨어지지 않아도 프레임마다 가장 가까운 다운샘플 위치를 쓰므로
+    어긋남이 누적되지 않음, 오차는 다운샘플 간격의 절반 이하)
+    Args:
+        y: 모노 파형
+        sr: 샘플링 레이트
+        hop_length: 프레임 간격 (원본 샘플)
+        fmin, fmax: F0 탐색 대역 (Hz)
+        threshold: 누적 평균 정규화 차분 임계값 (이하인 첫 골을 주기로 선택)
+        silence_db: 최대 프레임 에너지 대비 이보다 작은 프레임은 무성 처리 (dB)
+        block_frames: 한 번에 처리할 프레임 수
+    Returns:
+        (프레임별 F0 Hz (무성이면 0), 주기성 1 - 정규화 차분 (0~1))
+        프레임 수는 1 + len(y) // hop_length
+    """
+    n_frames = 1 + len(y) // hop_length
+    factor = max(1, int(sr // YIN_TARGET_SR))
+    x = _downsample(y, factor)
+    dsr = sr / factor
+    # 프레임 시작 위치 (다운샘플 샘플, 반올림한 hop을 누적하지 않고 프레임마다 계산)
+    starts = np.rint(np.arange(n_frames) * (hop_length / factor)).astype(np.int64)
+
+    min_lag = max(2, int(np.floor(dsr / fmax)))
+    max_lag = int(np.ceil(dsr / fmin))
+    # 양끝 lag도 국소 최소값으로 판정할 수 있도록 한 칸씩 더 계산 (min_lag - 1 … max_lag + 1)
+    last_lag = max_lag + 1
+    window = max_lag  # 가장 낮은 F0 한 주기 이상
+    frame_length = window + last_lag + 1
+    n_fft = 1 << int(np.ceil(np.log2(frame_length)))
+
+    # 프레임 중심 정렬 (STFT와 같은 양끝 패딩) + 마지막 프레임까지 채울 여유
+    half = frame_length // 2
+    padded = np.zeros(half + max(len(x), int(starts[-1])) + frame_length, dtype=np.float32)
+    padded[half:half + len(x)] = x
+    windows = sliding_window_view(padded, frame_length)
+
+    # 무성 판정용 프레임 에너지 기준
+    squares = np.concatenate(([0.0], np.cumsum(padded.astype(np.float64) ** 2)))
+    head_energy = squares[starts + window] - squares[starts]
+    floor = head_energy.max() * 10 ** (-silence_db / 10) if n_frames else 0.0
+
+    f0 = np.zeros(n_frames, dtype=np.float32)
+    periodicity = np.zeros(n_frames, dtype=np.float32)
+    lags = np.arange(1, last_lag + 1)
+    for begin in range(0, n_frames, block_frames):
+        block = windows[starts[begin:begin + block_frames]]
+        # r(τ) = Σ_j x[j]·x[j+τ] (j < window): 창 앞부분과 프레임의 FFT 상호 상관
+        spectrum = np.fft.rfft(block, n_fft, axis=1)
+        head = np.fft.rfft(block[:, :window], n_fft, axis=1)
+        acf = np.fft.irfft(np.conj(head) * spectrum, n_fft, axis=1)[:, :last_lag + 1]
+
+        # e(τ) = Σ_j x[j+τ]² (j < window), 차분 함수 d(τ) = e(0) + e(τ) - 2r(τ)
+        cumulative = np.cumsum(np.pad(block.astype(np.float64) ** 2, ((0, 0), (1, 0))), axis=1)
+        energy = cumulative[:, window:window + last_lag + 1] - cumulative[:, :last_lag + 1]
+        diff = np.maximum(energy[:, :1] + energy - 2 * acf, 0.0)
+
+        # 누적 평균 정규화 (d'(τ) = d(τ) · τ / Σ_{k≤τ} d(k))
+        cmnd = diff[:, 1:] * lags / np.maximum(np.cumsum(diff[:, 1:], axis=1), 1e-12)
+        search = cmnd[:, min_lag - 2:]  # search[i]는 lag min_lag - 1 + i
+
+        # 임계값 아래 첫 국소 최소값 (lag min_lag … max_lag, 없으면 무성)
+        is_min = np.zeros_like(search, dtype=bool)
+        is_min[:, 1:-1] = (search[:, 1:-1] < search[:, :-2]) & (search[:, 1:-1] <= search[:, 2:])
+        candidates = is_min & (search < threshold)
+        voiced = candidates.any(axis=1) & (head_energy[begin:begin + len(block)] > floor)
+        first = candidates.argmax(axis=1)
+
+        rows = np.flatnonzero(voiced)
+        index = first[rows]
+        left, mid, right = (search[rows, index - 1], search[rows, index], search[rows, index + 1])
+        denom = left + right - 2 * mid
+        shift = np.divide(0.5 * (left - right), denom, out=np.zeros_like(mid), where=denom > 0)
+        f0[begin + rows] = dsr / (min_lag - 1 + index + np.clip(shift, -1, 1))
+        periodicity[begin + rows] = np.clip(1 - mid, 0, 1)
+    return f0, periodicity
+
+
+def extract_frame_features(
+    y: np.ndarray,
+    sr: int,
+    n_fft: int = 2048,
+    hop_length: int = 512,
+    fmin: float = 150.0,
+    fmax: float = 4000.0,
+    threshold: float = 0.1,
+    pitch_method: str = 'piptrack',
+) -> FrameFeatures:
+    """
+    프레임 분할 한 번(복사 없는 strided 뷰)과 STFT 한 번으로 프레임별 운율 특징 계산
+    (librosa.piptrack/feature.rms 기본 설정과 같은 중앙 정렬 프레임: 양끝 n_fft/2 0 패딩)
+    Args:
+        y: 모노 파형
+        sr: 샘플링 레이트
+        n_fft: 프레임 길이 (샘플)
+        hop_length: 프레임 간격 (샘플)
+        fmin, fmax: 피치 탐색 대역 (Hz)
+        threshold: 프레임 최대 크기 대비 피치 피크 최소 비율
+        pitch_method: 피치 추적 방식 (piptrack: STFT 피크, yin: track_pitch_yin, fmin/fmax/threshold는 YIN 기본값)
+    Returns:
+        FrameFeatures (피치, 피치 피크 크기(yin이면 주기성), RMS, 온셋 강도(dB 스펙트럼 플럭스),
+                       스펙트럼 무게중심(Hz), 스펙트럼 평탄도)
+    Raises:
+        ValueError: 알 수 없는 피치 추적 방식
+    """
+    if pitch_method not in PITCH_METHODS:
+        raise ValueError(f"알 수 없는 피치 추적 방식: {pitch_method} (사용 가능: {', '.join(PITCH_METHODS)})")
+    padded = np.pad(np.asarray(y, dtype=np.float32), n_fft // 2)
+    frames = sliding_window_view(padded, n_fft)[::hop_length]
+
+    # 에너지: 창 없는 프레임의 RMS (librosa.feature.rms와 같음)
+    rms = np.sqrt(np.einsum('ij,ij->i', frames, frames) / n_fft)
+
+    # 크기 스펙트럼 (프레임 × bin, scipy.fft는 float32를 그대로 처리해 numpy.fft보다 빠름)
+    windowed = frames * _hann(n_fft)
+    if SCIPY_AVAILABLE:
+        import scipy.fft
+        S = np.abs(scipy.fft.rfft(windowed, axis=1))
+    else:
+        S = np.abs(np.fft.rfft(windowed, axis=1)).astype(np.float32)
+    if pitch_method == 'yin':
+        pitch, pitch_magnitude = track_pitch_yin(y, sr, hop_length)
+    else:
+        pitch, pitch_magnitude = _peak_pitch(S, sr, n_fft, fmin, fmax, threshold)
+
+    # 스펙트럼 특징: 로그 파워를 한 번 계산해 평탄도와 온셋 강도에 공유
+    power = S * S
+    power += 1e-10
+    log_power = np.log(power)
+    flatness = np.exp(log_power.mean(axis=1)) / power.mean(axis=1)
+    onset = np.zeros(len(S), dtype=np.float32)
+    if len(S) > 1:
+        flux = np.subtract(log_power[1:], log_power[:-1], out=power[1:])
+        np.maximum(flux, 0.0, out=flux)
+        onset[1:] = flux.mean(axis=1) * (10.0 / np.log(10.0))
+    freqs = np.arange(S.shape[1], dtype=np.float32) * (sr / n_fft)
+    centroid = (S @ freqs) / np.maximum(S.sum(axis=1), 1e-10)
+
+    matrix = np.vstack([pitch, pitch_magnitude, rms, onset, centroid, flatness]).astype(np.float32)
+    return FrameFeatures(matrix, sr, hop_length)
+
+
+def summarize_prosody(rate: Dict[str, float], features: FrameFeatures, speech=None) -> Dict:
+    """
+    말하기 속도 + 프레임 특징으로 운율 분석 결과 구성
+    Args:
+        rate: estimate_syllable_rate 결과
+        features: extract_frame_features 결과
+        speech: 발화 구간 검출 결과 (있으면 쉼 통계 'pauses' 포함)
+    """
+    pitch_values = features.voiced_pitch()
+    result = {
+        'speaking_rate': rate['speaking_rate'],
+        'articulation_rate': rate['articulation_rate'],
+        'pitch_variation': round(float(np.std(pitch_values)) if pitch_values.size else 0.0, 2),
+        'energy_variation': round(float(np.std(features['rms'])), 4)
+    }
+    if speech is not None:
+        result['pauses'] = speech.pause_stats()
+    return result
+
+
+@lru_cache(maxsize=16)
+def _bandpass_sos(low: float, high: float, sr: float) -> np.ndarray:
+    """2차 버터워스 대역통과 필터 계수 (설계 비용이 커서 캐시)"""
+    from scipy import signal
+    return signal.butter(2, (low, high), btype='bandpass', fs=sr,
+                         output='sos').astype(np.float32)
+
+
+def _decimate_boxcar(y: np.ndarray, factor: int) -> np.ndarray:
+    """박스카 평균 데시메이션 (strided 합, 복사 최소화)"""
+    if factor <= 1:
+        return np.asarray(y, dtype=np.float32)
+    n = len(y) // factor * factor
+    view = np.asarray(y[:n], dtype=np.float32).reshape(-1, factor)
+    out = view[:, 0].copy()
+    for i in range(1, factor):
+        out += view[:, i]
+    out /= factor
+    return out
+
+
+def band_energy_envelope(
+    y: np.ndarray,
+    sr: int,
+    band: Tuple[float, float] = SYLLABLE_BAND,
+    hop_length: float = 0.01,
+) -> Tuple[np.ndarray, float]:
+    """
+    대역 제한 에너지 포락선 (dB)
+    대역 상한에 맞춰 먼저 데시메이션한 뒤 저차 IIR 대역통과 필터를 적용하므로
+    원본 샘플링 레이트에서 필터링하는 것보다 훨씬 가볍다
+    Args:
+        y: 모노 파형
+        sr: 샘플링 레이트
+        band: 통과 대역 (Hz)
+        hop_length: 프레임 간격 (초)
+    Returns:
+        (프레임별 에너지 dB, 실제 프레임 간격 초)
+    """
+    factor = max(1, int(sr // (2 * band[1])))
+    x = _decimate_boxcar(y, factor)
+    dec_sr = sr / factor
+
+    if SCIPY_AVAILABLE and len(x) > 0:
+        from scipy import signal
+        high = min(band[1], 0.45 * dec_sr)
+        x = signal.sosfilt(_bandpass_sos(band[0], high, dec_sr), x)
+
+    hop = max(1, int(round(hop_length * dec_sr)))
+    n_frames = len(x) // hop
+    if n_frames == 0:
+        return np.empty(0), hop / dec_sr
+
+    # 겹치지 않는 프레임 뷰로 에너지를 한 번에 계산 (복사 없음)
+    frames = x[:n_frames * hop].reshape(n_frames, hop)
+    energy = np.einsum('ij,ij->i', frames, frames) / hop
+    return 10.0 * np.log10(energy + 1e-12), hop / dec_sr
+
+
+def estimate_syllable_rate(
+    y: np.ndarray,
+    sr: int,
+    silence_db: float = 25.0,
+    min_dip_db: float = 2.0,
+    min_pause: float = 0.25,
+    hop_length: float = 0.01,
+) -> Dict[str, float]:
+    """
+    음절핵 검출 기반 말하기 속도 추정
+    대역 에너지 포락선의 피크 중 무음 임계값 위에 있고 앞뒤로 충분한 골(dip)이 있는
+    지점을 음절로 간주 (de Jong & Wempe 방식의 단순화)
+    Args:
+        y: 모노 파형
+        sr: 샘플링 레이트
+        silence_db: 최대 에너지 대비 무음 판정 기준 (dB)
+        min_dip_db: 인접 음절 사이 최소 골 깊이 (dB)
+        min_pause: 쉼(pause)으로 볼 최소 무음 길이 (초)
+        hop_length: 포락선 프레임 간격 (초)
+    Returns:
+        syllable_count, speaking_rate(음절/초), articulation_rate(쉼 제외 음절/초),
+        speech_duration, pause_duration
+    """
+    duration = len(y) / float(sr) if sr else 0.0
+    result = {
+        'syllable_count': 0,
+        'speaking_rate': 0.0,
+        'articulation_rate': 0.0,
+        'speech_duration': 0.0,
+        'pause_duration': round(duration, 2),
+    }
+
+    envelope, hop_length = band_energy_envelope(y, sr, hop_length=hop_length)
+    if envelope.size < 3:
+        return result
+
+    # 50 ms 이동 평균으로 포락선 평활화
+    width = max(1, int(round(0.05 / hop_length)))
+    envelope = np.convolve(envelope, np.ones(width) / width, mode='same')
+
+    threshold = envelope.max() - silence_db
+    voiced = envelope > threshold
+
+    # 쉼: 최소 길이 이상 이어지는 무음 구간 (앞뒤 무음 포함)
+    edges = np.diff(np.concatenate(([0], (~voiced).astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_lengths = np.flatnonzero(edges == -1) - run_starts
+    min_pause_frames = int(round(min_pause / hop_length))
+    pause_frames = int(run_lengths[run_lengths >= min_pause_frames].sum())
+    pause_duration = min(duration, pause_frames * hop_length)
+    speech_duration = max(0.0, duration - pause_duration)
+
+    # 국소 최대값 후보 (벡터 연산)
+    is_peak = np.zeros_like(voiced)
+    is_peak[1:-1] = (envelope[1:-1] > envelope[:-2]) & (envelope[1:-1] >= envelope[2:])
+    candidates = np.flatnonzero(is_peak & voiced)
+
+    # 앞 음절과의 골 깊이 조건: 더 얕으면 더 큰 피크 하나로 병합
+    nuclei = []
+    for idx in candidates:
+        if nuclei:
+            prev = nuclei[-1]
+            dip = envelope[prev:idx + 1].min()
+            if min(envelope[prev], envelope[idx]) - dip < min_dip_db:
+                if envelope[idx] > envelope[prev]:
+                    nuclei[-1] = idx
+                continue
+        nuclei.append(idx)
+
+    count = len(nuclei)
+    result.update({
+        'syllable_count': count,
+        'speaking_rate': round(count / duration, 2) if duration > 0 else 0.0,
+        'articulation_rate': round(count / speech_duration, 2) if speech_duration > 0 else 0.0,
+        'speech_duration': round(speech_duration, 2),
+        'pause_duration': round(pause_duration, 2),
+    })
+    return result
+
+
+class RunningStats:
+    """평균/분산 누적기 (Welford, 배열 단위 갱신은 Chan의 병합식)"""
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray):
+        """값 묶음 반영"""
+        n = len(values)
+        if n == 0:
+            return
+        values = np.asarray(values, dtype=np.float64)
+        batch_mean = float(values.mean())
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.m2 += float(np.sum((values - batch_mean) ** 2)) + delta * delta * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+
+    @property
+    def std(self) -> float:
+        """모표준편차 (np.std와 같음, 값이 없으면 0)"""
+        return float(np.sqrt(self.m2 / self.count)) if self.count else 0.0
+
+
+class StreamingProsody:
+    """
+    블록 단위 운율 분석 (최대 메모리가 녹음 길이와 무관)
+    블록마다 앞뒤 문맥(n_fft 샘플)을 붙여 extract_frame_features를 계산하고 블록에 속한 프레임만 취하므로
+    피치/에너지 프레임 값은 전체를 한 번에 계산한 것과 같음 (yin의 무음 판정 기준만 블록 내 최대 에너지)
+    말하기 속도는 블록별 estimate_syllable_rate의 음절 수·쉼 길이 합 (무음 기준이 블록 내 최대 에너지)
+
+    사용:
+        stream = StreamingProsody(16000)
+        for block in stream_blocks(path, 16000 * 30):
+            stream.update(block)
+        result = stream.finish()
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        block_samples: int = 30 * 16000,
+        pitch_method: str = 'piptrack',
+        n_fft: int = 2048,
+        hop_length: int = 512,
+    ):
+        """
+        Args:
+            sample_rate: 입력 샘플링 레이트
+            block_samples: 한 번에 분석할 최소 샘플 수 (버퍼는 이 길이 + 문맥 + 입력 블록 길이를 넘지 않음,
+                           블록이 짧을수록(10초 미만) 말하기 속도가 전체 분석과 달라짐)
+            pitch_method: 피치 추적 방식 (PITCH_METHODS)
+            n_fft, hop_length: 프레임 특징 STFT 설정 (extract_frame_features와 같게)
+        Raises:
+            ValueError: 알 수 없는 피치 추적 방식
+        """
+        if pitch_method not in PITCH_METHODS:
+            raise ValueError(f"알 수 없는 피치 추적 방식: {pitch_method} (사용 가능: {', '.join(PITCH_METHODS)})")
+        self.sample_rate = sample_rate
+        self.pitch_method = pitch_method
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        # 블록 앞뒤 문맥 (프레임 시작이 hop 격자에 맞도록 hop 배수로 올림)
+        self.context = -(-n_fft // hop_length) * hop_length
+        self.block_samples = max(block_samples, hop_length)
+
+        self.pitch = RunningStats()
+        self.energy = RunningStats()
+        self.syllables = 0
+        self.pause_duration = 0.0
+
+        self._buffer = np.empty(0, dtype=np.float32)
+        self._offset = 0      # _buffer[0]의 전체 샘플 위치
+        self._next_frame = 0  # 아직 처리하지 않은 첫 프레임 (중심 = 번호 × hop_length)
+        self._finished = False
+
+    @property
+    def samples_seen(self) -> int:
+        return self._offset + len(self._buffer)
+
+    def update(self, samples: np.ndarray):
+        """샘플 추가 (block_samples 이상 쌓이면 처리하고 필요 없는 앞부분은 버림)"""
+        self._buffer = np.concatenate((self._buffer, np.asarray(samples, dtype=np.float32)))
+        ready = self.samples_seen - self.context - self._next_frame * self.hop_length
+        if ready >= self.block_samples:
+            self._process(final=False)
+
+    def _process(self, final: bool):
+        """문맥이 충분한 프레임들(final이면 남은 전부)의 특징 계산 → 누적"""
+        hop, total = self.hop_length, self.samples_seen
+        first = self._next_frame
+        last = total // hop if final else (total - self.context) // hop
+        if last < first:
+            return
+        start = max(0, first * hop - self.context)
+        end = min(total, last * hop + self.context)
+        chunk = self._buffer[start - self._offset:end - self._offset]
+        features = extract_frame_features(chunk, self.sample_rate, self.n_fft, hop,
+                                          pitch_method=self.pitch_method)
+        kept = features.matrix[:, first - start // hop:last - start // hop + 1]
+        pitch = kept[_FEATURE_INDEX['pitch']]
+        self.pitch.update(pitch[pitch > 0])
+        self.energy.update(kept[_FEATURE_INDEX['rms']])
+
+        # 말하기 속도: 이번에 처리한 프레임 구간의 샘플 (블록끼리 겹치지 않음)
+        region_end = total if final else (last + 1) * hop
+        region = self._buffer[first * hop - self._offset:region_end - self._offset]
+        rate = estimate_syllable_rate(region, self.sample_rate)
+        self.syllables += rate['syllable_count']
+        self.pause_duration += rate['pause_duration']
+
+        self._next_frame = last + 1
+        drop = max(0, self._next_frame * hop - self.context - self._offset)
+        self._buffer = self._buffer[drop:].copy()
+        self._offset += drop
+
+    def finish(self) -> Dict:
+        """
+        남은 샘플 처리 후 결과 (summarize_prosody와 같은 키, 'pauses' 제외)
+        Returns:
+            speaking_rate, articulation_rate, pitch_variation, energy_variation
+        """
+        if not self._finished:
+            self._process(final=True)
+            self._finished = True
+        duration = self.samples_seen / float(self.sample_rate)
+        pause = min(duration, self.pause_duration)
+        speech = duration - pause
+        return {
+            'speaking_rate': round(self.syllables / duration, 2) if duration > 0 else 0.0,
+            'articulation_rate': round(self.syllables / speech, 2) if speech > 0 else 0.0,
+            'pitch_variation': round(self.pitch.std, 2),
+            'energy_variation': round(self.energy.std, 4),
+        }
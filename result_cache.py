@@ -0,0 +1,231 @@
+"""
+분석 결과 캐시
+오디오 내용 해시로 키를 만들어 같은 녹음의 재제출/재시도에 STT·운율 분석을 재사용
+메모리 LRU(바이트 크기 기준 제거) + 선택적 로컬 디스크(SQLite) 2단 구성
+(디스크 계층은 최대 크기를 넘으면 오래 저장된 항목부터 제거, 보관 기간(TTL)이 지난 항목은 무시·삭제)
+
+네임스페이스 (model은 model_size, 기본 외 STT 백엔드는 model_size-백엔드):
+    transcript  {model}:{audio}              인식 텍스트
+    prosody     {audio}                      운율 분석 결과 (모델 무관)
+    analysis    {model}:{audio}:{reference}  full_analysis 전체 결과
+    passage     {model}:{audio}:{reference}  passage_analysis 결과 (문장 구간별 결과 포함)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+from audio_io import DecodedAudio
+
+DIGEST_SIZE = 20
+
+
+def digest_bytes(data: bytes) -> str:
+    """바이트 내용 해시 (blake2b, 16진 문자열)"""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def digest_text(text: str) -> str:
+    """텍스트 해시 (키 길이를 일정하게 유지)"""
+    return digest_bytes(text.encode("utf-8"))
+
+
+def audio_digest(audio) -> str:
+    """
+    오디오 입력의 내용 해시
+    (업로드 원본 바이트 해시가 붙은 DecodedAudio는 그대로 사용, 그 외에는 파형/파일 내용 해시)
+    Args:
+        audio: bytes, 파일 경로, 파형 배열 또는 DecodedAudio
+    Returns:
+        16진 해시 문자열
+    """
+    if isinstance(audio, DecodedAudio):
+        if audio.digest is None:
+            audio.digest = digest_bytes(audio.samples.tobytes())
+        return audio.digest
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return digest_bytes(audio)
+    if isinstance(audio, np.ndarray):
+        return digest_bytes(np.ascontiguousarray(audio, dtype=np.float32).tobytes())
+
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(os.fspath(audio), "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ResultCache:
+    """2단(메모리 LRU + SQLite) 결과 캐시, 값은 JSON으로 직렬화하여 저장"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, path: Optional[str] = None,
+                 max_disk_bytes: int = 1024 * 1024 * 1024, ttl_s: float = 0.0):
+        """
+        초기화
+        Args:
+            max_bytes: 메모리 계층 최대 크기 (직렬화된 값 기준 바이트)
+            path: 디스크 계층 SQLite 파일 경로 (None이면 메모리만 사용)
+            max_disk_bytes: 디스크 계층 최대 크기 (직렬화된 값 기준 바이트, 0이면 제한 없음)
+            ttl_s: 디스크 계층 보관 기간 (초, 0이면 무기한)
+        """
+        self.max_bytes = max_bytes
+        self.path = path
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._stats = {'hits': {}, 'misses': {}, 'memory_hits': 0, 'disk_hits': 0,
+                       'evictions': 0, 'disk_evictions': 0}
+        self._disk_bytes = 0
+        self._last_cleanup = 0.0
+
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            # 여러 워커 프로세스가 같은 파일을 공유할 수 있도록 WAL 모드
+            self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, created REAL NOT NULL, "
+                "size INTEGER NOT NULL DEFAULT 0)"
+            )
+            # 크기 열이 없던 이전 버전 파일
+            columns = [row[1] for row in self._db.execute("PRAGMA table_info(results)")]
+            if 'size' not in columns:
+                self._db.execute("ALTER TABLE results ADD COLUMN size INTEGER NOT NULL DEFAULT 0")
+                self._db.execute("UPDATE results SET size = length(value)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_created ON results (created)")
+            self._db.commit()
+            with self._lock:
+                self._evict_disk()
+
+    def _evict_disk(self):
+        """
+        디스크 계층 정리: 보관 기간이 지난 항목 삭제 → 최대 크기를 넘으면 오래 저장된 항목부터 삭제
+        (다른 프로세스도 같은 파일에 쓰므로 실제 합계를 다시 읽어 판단, self._lock을 잡은 상태에서 호출)
+        """
+        self._last_cleanup = time.monotonic()
+        if self.ttl_s > 0:
+            cursor = self._db.execute("DELETE FROM results WHERE created < ?",
+                                      (time.time() - self.ttl_s,))
+            self._stats['disk_evictions'] += cursor.rowcount
+        self._disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if self.max_disk_bytes > 0 and self._disk_bytes > self.max_disk_bytes:
+            excess, evicted = self._disk_bytes - self.max_disk_bytes, []
+            for key, size in self._db.execute("SELECT key, size FROM results ORDER BY created"):
+                if excess <= 0:
+                    break
+                evicted.append((key,))
+                excess -= size
+                self._disk_bytes -= size
+            self._db.executemany("DELETE FROM results WHERE key = ?", evicted)
+            self._stats['disk_evictions'] += len(evicted)
+        self._db.commit()
+
+    def _remember(self, key: str, payload: bytes):
+        """메모리 계층에 저장 (최근 사용으로 이동, 크기 초과 시 오래된 항목부터 제거)"""
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = payload
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._stats['evictions'] += 1
+
+    def _count(self, kind: str, namespace: str):
+        counts = self._stats[kind]
+        counts[namespace] = counts.get(namespace, 0) + 1
+
+    def get(self, namespace: str, key: str):
+        """
+        캐시 조회 (디스크 계층에서 찾으면 메모리로 승격)
+        Returns:
+            저장된 값의 사본 또는 None
+        """
+        full_key = f"{namespace}:{key}"
+        with self._lock:
+            payload = self._memory.get(full_key)
+            if payload is not None:
+                self._memory.move_to_end(full_key)
+                self._stats['memory_hits'] += 1
+            elif self._db is not None:
+                # 보관 기간이 지난 항목은 다음 정리 때 삭제되므로 없는 것으로 취급
+                oldest = time.time() - self.ttl_s if self.ttl_s > 0 else 0.0
+                row = self._db.execute(
+                    "SELECT value FROM results WHERE key = ? AND created >= ?", (full_key, oldest)
+                ).fetchone()
+                if row is not None:
+                    payload = bytes(row[0])
+                    self._remember(full_key, payload)
+                    self._stats['disk_hits'] += 1
+            self._count('hits' if payload is not None else 'misses', namespace)
+        return json.loads(payload) if payload is not None else None
+
+    def put(self, namespace: str, key: str, value):
+        """캐시 저장 (JSON 직렬화 가능한 값)"""
+        full_key = f"{namespace}:{key}"
+        payload = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            self._remember(full_key, payload)
+            if self._db is not None:
+                old = self._db.execute("SELECT size FROM results WHERE key = ?", (full_key,)).fetchone()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, value, created, size) VALUES (?, ?, ?, ?)",
+                    (full_key, payload, time.time(), len(payload)),
+                )
+                self._db.commit()
+                self._disk_bytes += len(payload) - (old[0] if old else 0)
+                # 이 프로세스 기준 합계가 한도를 넘었거나 보관 기간 정리 주기(10분)가 지났을 때만 정리
+                if (0 < self.max_disk_bytes < self._disk_bytes
+                        or (self.ttl_s > 0 and time.monotonic() - self._last_cleanup > 600)):
+                    self._evict_disk()
+
+    def clear(self):
+        """모든 계층 비우기"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict:
+        """
+        캐시 지표
+        Returns:
+            네임스페이스별 적중/실패 수, 계층별 적중 수, 메모리 사용량
+        """
+        with self._lock:
+            hits = sum(self._stats['hits'].values())
+            misses = sum(self._stats['misses'].values())
+            return {
+                'hits': dict(self._stats['hits']),
+                'misses': dict(self._stats['misses']),
+                'hit_rate': round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                'memory_hits': self._stats['memory_hits'],
+                'disk_hits': self._stats['disk_hits'],
+                'evictions': self._stats['evictions'],
+                'entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'max_bytes': self.max_bytes,
+                'disk_path': self.path,
+                'disk_bytes': self._disk_bytes,
+                'max_disk_bytes': self.max_disk_bytes,
+                'disk_evictions': self._stats['disk_evictions'],
+                'ttl_s': self.ttl_s,
+            }
@@ -0,0 +1,309 @@
+"""
+실시간 스트리밍 분석 세션
+학습자가 말하는 동안 PCM 청크를 받아 증분 VAD + 윈도 단위 Whisper 인식을 수행하고
+부분 인식 결과와 참조 문장 대비 누적 단어 스코어를 즉시 돌려줌
+
+세션 흐름:
+    feed(청크) → 발화 중이면 step_ms마다 현재 구간을 재인식해 'partial' 이벤트
+               → 발화 끝점(묵음) 또는 최대 윈도 길이에서 구간을 확정해 'segment' 이벤트
+    finish()   → 남은 구간 확정 후 운율 분석까지 포함한 'final' 이벤트
+                 (운율은 받는 대로 블록 단위로 누적하므로 세션 길이와 무관하게 메모리가 일정)
+"""
+
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from audio_io import SAMPLE_RATE, BlockResampler
+from vad import StreamingVAD
+
+# 발화 시작 전 묵음 중 구간 앞에 붙여 둘 길이 (첫 음절이 잘리지 않도록)
+PRE_ROLL_MS = 300
+
+# PCM 형식별 샘플 바이트 수
+SAMPLE_WIDTHS = {"s16le": 2, "f32le": 4}
+
+
+def pcm_to_float(chunk: Union[bytes, np.ndarray], sample_format: str = "s16le") -> np.ndarray:
+    """
+    PCM 청크를 float32 파형으로 변환 (샘플 크기로 나누어떨어지지 않는 끝 바이트는 버림,
+    StreamingSession은 다음 청크 앞으로 이월)
+    Args:
+        chunk: 원시 PCM 바이트 또는 샘플 배열
+        sample_format: s16le(16비트 정수) 또는 f32le(32비트 실수)
+    Returns:
+        float32 모노 파형
+    """
+    if isinstance(chunk, np.ndarray):
+        return np.asarray(chunk, dtype=np.float32)
+    if sample_format == "s16le":
+        usable = len(chunk) - len(chunk) % 2
+        return np.frombuffer(chunk[:usable], dtype="<i2").astype(np.float32) / 32768.0
+    if sample_format == "f32le":
+        usable = len(chunk) - len(chunk) % 4
+        return np.frombuffer(chunk[:usable], dtype="<f4").astype(np.float32)
+    raise ValueError(f"지원하지 않는 PCM 형식: {sample_format}")
+
+
+class StreamingSession:
+    """스트리밍 분석 세션 (한 명의 학습자 발화 하나)"""
+
+    def __init__(
+        self,
+        analyzer,
+        reference_text: str,
+        sample_rate: int = SAMPLE_RATE,
+        sample_format: str = "s16le",
+        step_ms: float = 1000.0,
+        max_window_s: float = 15.0,
+        vad: Optional[StreamingVAD] = None,
+    ):
+        """
+        초기화
+        Args:
+            analyzer: PronunciationAnalyzer
+            reference_text: 참조 텍스트
+            sample_rate: 입력 PCM 샘플링 레이트 (16 kHz가 아니면 청크 경계를 이어서 리샘플링)
+            sample_format: 입력 PCM 형식 (s16le/f32le)
+            step_ms: 발화 중 부분 인식 간격 (새로 들어온 오디오 기준, ms)
+            max_window_s: 묵음이 없어도 구간을 확정하는 최대 길이 (초, Whisper 30초 이하)
+            vad: 발화 검출기 (기본: StreamingVAD)
+        """
+        self.analyzer = analyzer
+        self.reference_text = reference_text
+        self.sample_rate = sample_rate
+        self.sample_format = sample_format
+        self._resampler = BlockResampler(sample_rate, SAMPLE_RATE) if sample_rate != SAMPLE_RATE else None
+        self._partial = b""  # 샘플 하나를 채우지 못한 마지막 바이트 (다음 청크 앞에 붙임)
+        self.step_samples = int(SAMPLE_RATE * step_ms / 1000)
+        self.max_window_samples = int(SAMPLE_RATE * min(max_window_s, 30.0))
+        self.vad = vad or StreamingVAD(SAMPLE_RATE)
+
+        self._ref_words = re.findall(r'\w+', reference_text.lower())
+        self._prosody = analyzer.prosody_stream()  # 첫 발화부터의 운율 누적기 (최종 운율 분석용)
+        self._held: List[np.ndarray] = []       # 발화 뒤 묵음 (다음 발화가 오면 운율 누적기에 넣음)
+        self._held_samples = 0
+        self._window: List[np.ndarray] = []     # 확정되지 않은 현재 구간
+        self._window_samples = 0
+        self._undecoded_samples = 0
+        self._pre_roll = np.empty(0, dtype=np.float32)
+        self._committed: List[str] = []
+        self._hypothesis = ""
+        self._lock = threading.Lock()
+
+        self.started_at: Optional[float] = None
+        self.speech_started_at: Optional[float] = None
+        self.first_feedback_ms: Optional[float] = None
+        self.samples_received = 0
+        self.transcribe_calls = 0
+        self.transcribe_seconds = 0.0
+        self.finished = False
+
+    @property
+    def audio_ms(self) -> float:
+        """지금까지 받은 오디오 길이 (ms)"""
+        return self.samples_received / SAMPLE_RATE * 1000
+
+    @property
+    def text(self) -> str:
+        """확정 구간 + 현재 가설을 이은 인식 텍스트"""
+        return ' '.join(t for t in self._committed + [self._hypothesis] if t)
+
+    def _transcribe(self, samples: np.ndarray) -> str:
+        start = time.perf_counter()
+        text = self.analyzer.transcribe_audio(samples, prompt=self.reference_text)
+        self.transcribe_seconds += time.perf_counter() - start
+        self.transcribe_calls += 1
+        return text
+
+    def _score(self, spoken_text: str) -> Dict:
+        """
+        누적 스코어: 지금까지 말한 단어 수만큼의 참조 문장 앞부분과 비교
+        """
+        spoken_count = len(re.findall(r'\w+', spoken_text.lower()))
+        prefix = ' '.join(self._ref_words[:max(spoken_count, 1)])
+        result = self.analyzer.calculate_pronunciation_score(prefix, spoken_text)
+        result['progress'] = round(min(spoken_count, len(self._ref_words))
+                                   / max(len(self._ref_words), 1), 3)
+        return result
+
+    def _event(self, kind: str) -> Dict:
+        text = self.text
+        event = {
+            'type': kind,
+            'text': text,
+            'committed_text': ' '.join(t for t in self._committed if t),
+            'audio_ms': round(self.audio_ms, 1),
+            'elapsed_ms': round((time.perf_counter() - self.started_at) * 1000, 1),
+            'score': self._score(text) if text else None,
+        }
+        # 첫 피드백까지 걸린 시간 (발화 시작이 담긴 청크를 받은 시점 기준)
+        if text and self.first_feedback_ms is None:
+            since = self.speech_started_at or self.started_at
+            self.first_feedback_ms = round((time.perf_counter() - since) * 1000, 1)
+        event['time_to_first_feedback_ms'] = self.first_feedback_ms
+        return event
+
+    def _commit(self) -> Optional[Dict]:
+        """현재 구간을 확정 인식하고 다음 구간을 시작"""
+        if not self._window_samples:
+            return None
+        text = self._transcribe(np.concatenate(self._window))
+        self._committed.append(text)
+        self._hypothesis = ""
+        self._window = []
+        self._window_samples = 0
+        self._undecoded_samples = 0
+        return self._event('segment')
+
+    def _feed_prosody(self, samples: np.ndarray, speech: bool):
+        """
+        운율 누적기에 입력 (첫 발화 전 묵음은 건너뛰고 발화 뒤 묵음은 다음 발화가 올 때 넣으므로
+        analyze_prosody의 앞뒤 묵음 제거와 같은 효과, 보관한 묵음이 블록 길이를 넘으면 바로 넣음)
+        """
+        if not speech:
+            if not self._prosody.samples_seen:
+                return
+            self._held.append(samples)
+            self._held_samples += len(samples)
+            if self._held_samples < self._prosody.block_samples:
+                return
+            samples = np.empty(0, dtype=np.float32)
+        elif not self._prosody.samples_seen:
+            self._prosody.update(self._pre_roll)
+        for held in self._held:
+            self._prosody.update(held)
+        self._held = []
+        self._held_samples = 0
+        self._prosody.update(samples)
+
+    def feed(self, chunk: Union[bytes, np.ndarray]) -> List[Dict]:
+        """
+        PCM 청크 입력
+        Args:
+            chunk: PCM 바이트 또는 샘플 배열
+        Returns:
+            이번 입력으로 발생한 이벤트 목록 (partial/segment)
+        """
+        received_at = time.perf_counter()
+        with self._lock:
+            if self.finished:
+                raise RuntimeError("이미 종료된 세션입니다")
+            if self.started_at is None:
+                self.started_at = received_at
+
+            if not isinstance(chunk, np.ndarray) and self.sample_format in SAMPLE_WIDTHS:
+                data = self._partial + bytes(chunk)
+                usable = len(data) - len(data) % SAMPLE_WIDTHS[self.sample_format]
+                chunk, self._partial = data[:usable], data[usable:]
+            samples = pcm_to_float(chunk, self.sample_format)
+            if self._resampler is not None:
+                samples = self._resampler(samples)
+            if not len(samples):
+                return []
+            self.samples_received += len(samples)
+
+            was_speech = self.vad.in_speech
+            endpoint = self.vad.update(samples)
+            if self.vad.in_speech and self.speech_started_at is None:
+                self.speech_started_at = received_at
+            self._feed_prosody(samples, self.vad.in_speech)
+            events = []
+
+            if self.vad.in_speech or endpoint or self._window_samples:
+                if not was_speech and not self._window_samples:
+                    # 발화가 시작됨: 직전 묵음 일부를 앞에 붙여 구간 시작
+                    self._window.append(self._pre_roll)
+                    self._window_samples += len(self._pre_roll)
+                self._window.append(samples)
+                self._window_samples += len(samples)
+                self._undecoded_samples += len(samples)
+            else:
+                pre_roll = int(SAMPLE_RATE * PRE_ROLL_MS / 1000)
+                self._pre_roll = np.concatenate([self._pre_roll, samples])[-pre_roll:]
+
+            if endpoint or self._window_samples >= self.max_window_samples:
+                event = self._commit()
+                if event is not None:
+                    events.append(event)
+            elif self.vad.in_speech and self._undecoded_samples >= self.step_samples:
+                self._hypothesis = self._transcribe(np.concatenate(self._window))
+                self._undecoded_samples = 0
+                events.append(self._event('partial'))
+            return events
+
+    def finish(self) -> Dict:
+        """
+        세션 종료: 남은 구간을 확정하고 전체 결과 반환
+        Returns:
+            'final' 이벤트 (full_analysis와 같은 결과 + 지연 지표)
+        """
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = time.perf_counter()
+            self._commit()
+            self.finished = True
+
+            spoken_text = self.text
+            # 발화가 없었으면 운율 결과 없음 (끝에 보관 중인 묵음은 버림)
+            prosody_result = self._prosody.finish() if self._prosody.samples_seen else None
+            result = self.analyzer.compose_analysis(self.reference_text, spoken_text,
+                                                    prosody_result)
+
+            elapsed = time.perf_counter() - self.started_at
+            return {
+                'type': 'final',
+                'data': result,
+                'metrics': {
+                    'audio_ms': round(self.audio_ms, 1),
+                    'elapsed_ms': round(elapsed * 1000, 1),
+                    'time_to_first_feedback_ms': self.first_feedback_ms,
+                    'transcribe_calls': self.transcribe_calls,
+                    'transcribe_ms': round(self.transcribe_seconds * 1000, 1),
+                    'real_time_factor': round(self.transcribe_seconds / (self.audio_ms / 1000), 3)
+                    if self.samples_received else None,
+                },
+            }
+
+
+class StreamingStats:
+    """스트리밍 세션 지연 지표 집계 (/health 보고용)"""
+
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window: 분위수 계산에 사용할 최근 세션 수
+        """
+        self.window = window
+        self.sessions = 0
+        self.active = 0
+        self._ttff: List[float] = []
+        self._lock = threading.Lock()
+
+    def session_started(self):
+        with self._lock:
+            self.sessions += 1
+            self.active += 1
+
+    def session_finished(self, session: StreamingSession):
+        with self._lock:
+            self.active -= 1
+            if session.first_feedback_ms is not None:
+                self._ttff.append(session.first_feedback_ms)
+                del self._ttff[:-self.window]
+
+    def stats(self) -> Dict:
+        """세션 수와 첫 피드백까지 시간(ms) 분위수"""
+        with self._lock:
+            ttff = np.array(self._ttff)
+            summary = {'sessions': self.sessions, 'active': self.active}
+            if ttff.size:
+                summary['time_to_first_feedback_ms'] = {
+                    'p50': round(float(np.percentile(ttff, 50)), 1),
+                    'p95': round(float(np.percentile(ttff, 95)), 1),
+                    'max': round(float(ttff.max()), 1),
+                }
+            return summary
@@ -0,0 +1,290 @@
+"""
+STT 백엔드
+Whisper 모델 로드/인식 방식을 백엔드로 분리 (PronunciationAnalyzer.transcribe_audio와
+배처는 백엔드의 transcribe/decode_batch만 호출)
+
+백엔드:
+    torch  PyTorch 모델 그대로 (CPU는 fp32, GPU는 fp16 디코딩)
+    int8   CPU 동적 양자화 (nn.Linear 가중치를 int8로, 활성값은 실행 중 양자화)
+           CPU 전용 노드에서 인코더/디코더의 행렬 곱을 int8 커널로 실행
+
+디코딩 옵션 (DecodeOptions):
+    default     model.transcribe 기본값 (언어 감지, 온도 폴백, 30초 패딩)
+    read_aloud  2~10초 영어 낭독 클립용: 영어 고정(언어 감지 인코더 패스 생략),
+                온도 0 greedy 디코딩(폴백 없음), 참조 텍스트를 디코더 프롬프트로,
+                짧은 클립은 30초 대신 클립 길이 + 여유만큼만 패딩해 인코딩
+"""
+
+import math
+import threading
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_BACKEND = 'torch'
+
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30  # Whisper 인코더 입력 (30초 = 멜 3000프레임)
+
+# 짧은 클립 패딩: 클립 길이 + 여유를 1초 단위로 올림 (학습 분포와 너무 다르지 않도록 최소 길이 보장)
+TRIM_MARGIN_S = 1.0
+TRIM_MIN_S = 4
+
+
+class DecodeOptions:
+    """Whisper 디코딩 옵션"""
+
+    def __init__(
+        self,
+        name: str = 'default',
+        language: Optional[str] = None,
+        temperature_fallback: bool = True,
+        prompt_reference: bool = False,
+        trim_padding: bool = False,
+    ):
+        """
+        Args:
+            name: 프리셋 이름
+            language: 인식 언어 (None이면 클립마다 언어 감지)
+            temperature_fallback: 압축률/로그 확률이 나쁘면 온도를 올려 다시 디코딩
+                                  (False면 온도 0 greedy 한 번)
+            prompt_reference: 참조 텍스트를 디코더 프롬프트로 사용
+                              (인식이 참조 쪽으로 끌려가 발음 오류를 덜 드러낼 수 있음)
+            trim_padding: 30초 이하 클립을 30초 대신 클립 길이 + 여유만큼만 패딩해 인코딩
+        """
+        self.name = name
+        self.language = language
+        self.temperature_fallback = temperature_fallback
+        self.prompt_reference = prompt_reference
+        self.trim_padding = trim_padding
+
+    @property
+    def is_default(self) -> bool:
+        return (self.language is None and self.temperature_fallback
+                and not self.prompt_reference and not self.trim_padding)
+
+    @property
+    def key(self) -> str:
+        """결과 캐시 키 구분자 (기본 옵션은 빈 문자열)"""
+        if self.is_default:
+            return ''
+        parts = [self.language or 'auto']
+        if not self.temperature_fallback:
+            parts.append('greedy')
+        if self.prompt_reference:
+            parts.append('prompt')
+        if self.trim_padding:
+            parts.append('trim')
+        return '.'.join(parts)
+
+    def window_samples(self, longest: int) -> int:
+        """가장 긴 클립(샘플 수)에 맞춘 인코더 입력 길이"""
+        full = WINDOW_SECONDS * SAMPLE_RATE
+        if not self.trim_padding:
+            return full
+        seconds = math.ceil(longest / SAMPLE_RATE + TRIM_MARGIN_S)
+        return min(full, max(TRIM_MIN_S, seconds) * SAMPLE_RATE)
+
+
+DECODE_PRESETS: Dict[str, DecodeOptions] = {
+    'default': DecodeOptions(),
+    'read_aloud': DecodeOptions('read_aloud', language='en', temperature_fallback=False,
+                                prompt_reference=True, trim_padding=True),
+}
+
+
+def decode_options(name: str = 'default', **overrides) -> DecodeOptions:
+    """
+    프리셋 디코딩 옵션 (overrides로 항목별 변경)
+    Raises:
+        ValueError: 알 수 없는 프리셋
+    """
+    if name not in DECODE_PRESETS:
+        raise ValueError(f"알 수 없는 디코딩 프리셋: {name} (사용 가능: {', '.join(DECODE_PRESETS)})")
+    preset = DECODE_PRESETS[name]
+    values = {
+        'language': preset.language,
+        'temperature_fallback': preset.temperature_fallback,
+        'prompt_reference': preset.prompt_reference,
+        'trim_padding': preset.trim_padding,
+    }
+    values.update({key: value for key, value in overrides.items() if value is not None})
+    return DecodeOptions(name, **values)
+
+
+class WhisperBackend:
+    """PyTorch Whisper 백엔드 (기본)"""
+
+    name = 'torch'
+
+    def __init__(self, threads: int = 0):
+        """
+        Args:
+            threads: torch 연산 스레드 수 (0이면 torch 기본값, 프로세스 전역 설정)
+        """
+        self.threads = threads
+
+    def _configure_threads(self):
+        if self.threads > 0:
+            import torch
+            torch.set_num_threads(self.threads)
+
+    def load(self, model_size: str):
+        """모델 로드 (레지스트리가 model_size/백엔드별로 한 번만 호출)"""
+        import whisper
+        self._configure_threads()
+        return whisper.load_model(model_size)
+
+    def decode_options(self, model) -> Dict:
+        """디코딩 옵션 (CPU에서는 fp16 미지원 경고 없이 fp32로)"""
+        return {'fp16': model.device.type != 'cpu'}
+
+    def transcribe(
+        self,
+        model,
+        audio: np.ndarray,
+        options: Optional[DecodeOptions] = None,
+        prompt: Optional[str] = None,
+    ) -> str:
+        """
+        16 kHz 모노 파형(30초 이하 권장) 인식
+        Args:
+            options: 디코딩 옵션 (None이면 기본값)
+            prompt: 디코더 프롬프트 (options.prompt_reference일 때만 사용)
+        Returns:
+            소문자 인식 텍스트
+        """
+        if options is None or options.is_default:
+            result = model.transcribe(audio, **self.decode_options(model))
+            return result["text"].strip().lower()
+
+        if len(audio) <= WINDOW_SECONDS * SAMPLE_RATE:
+            # 30초 이하는 transcribe의 구간 탐색 루프 없이 한 번에 디코딩
+            return self.decode_batch(model, [audio], options, prompt)[0]
+
+        kwargs = {'language': options.language, 'without_timestamps': True}
+        if not options.temperature_fallback:
+            kwargs['temperature'] = 0.0
+        if options.prompt_reference and prompt:
+            kwargs['initial_prompt'] = prompt
+        result = model.transcribe(audio, **kwargs, **self.decode_options(model))
+        return result["text"].strip().lower()
+
+    def decode_batch(
+        self,
+        model,
+        audios: List[np.ndarray],
+        options: Optional[DecodeOptions] = None,
+        prompt: Optional[str] = None,
+    ) -> List[str]:
+        """
+        30초 이하 파형 여러 개를 한 번의 배치 인코딩/디코딩으로 인식
+        Args:
+            options: 디코딩 옵션 (None이면 기본값: 언어 감지, 30초 패딩)
+            prompt: 모든 파형에 공통인 디코더 프롬프트 (options.prompt_reference일 때만 사용)
+        Returns:
+            파형별 소문자 인식 텍스트
+        """
+        import torch
+        import whisper
+        options = options or DECODE_PRESETS['default']
+        window = options.window_samples(max(len(audio) for audio in audios))
+        n_mels = model.dims.n_mels
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(audio, window), n_mels=n_mels)
+            for audio in audios
+        ]).to(model.device)
+
+        kwargs = {'without_timestamps': True, 'language': options.language}
+        if not options.temperature_fallback:
+            kwargs['temperature'] = 0.0
+        if options.prompt_reference and prompt:
+            kwargs['prompt'] = prompt
+        decoding = whisper.DecodingOptions(**kwargs, **self.decode_options(model))
+
+        encoder = model.encoder
+        full_embedding = encoder.positional_embedding
+        if window < WINDOW_SECONDS * SAMPLE_RATE:
+            # 인코더는 위치 임베딩 길이와 같은 입력만 받으므로 잘린 입력 길이에 맞춰 잠시 교체
+            # (모델 잠금 안에서 호출됨)
+            encoder.positional_embedding = full_embedding[:mel.shape[-1] // 2]
+        try:
+            results = whisper.decode(model, mel, decoding)
+        finally:
+            encoder.positional_embedding = full_embedding
+        return [result.text.strip().lower() for result in results]
+
+
+def _plain_linears(module):
+    """
+    Whisper의 Linear(nn.Linear 하위 클래스, 입력 dtype으로 가중치를 캐스팅)를 nn.Linear로 교체
+    (동적 양자화는 정확히 nn.Linear 타입만 변환하므로)
+    """
+    import torch
+    for name, child in module.named_children():
+        if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+            plain = torch.nn.Linear(child.in_features, child.out_features, bias=child.bias is not None)
+            plain.weight = child.weight
+            plain.bias = child.bias
+            setattr(module, name, plain)
+        else:
+            _plain_linears(child)
+
+
+class Int8Backend(WhisperBackend):
+    """CPU int8 동적 양자화 백엔드"""
+
+    name = 'int8'
+
+    def load(self, model_size: str):
+        import torch
+        import whisper
+        self._configure_threads()
+        model = whisper.load_model(model_size, device='cpu')
+        _plain_linears(model)
+        # 토큰 임베딩(출력 로짓 행렬 곱 공유)과 합성곱은 fp32 유지
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    def decode_options(self, model) -> Dict:
+        return {'fp16': False}
+
+
+_backends: Dict[str, Callable[..., WhisperBackend]] = {
+    WhisperBackend.name: WhisperBackend,
+    Int8Backend.name: Int8Backend,
+}
+_instances: Dict[str, WhisperBackend] = {}
+_lock = threading.Lock()
+
+
+def register_backend(name: str, factory: Callable[..., WhisperBackend]):
+    """
+    STT 백엔드 등록 (예: 다른 추론 엔진)
+    Args:
+        name: 백엔드 이름
+        factory: threads 키워드 인자를 받아 WhisperBackend와 같은 메서드를 가진 객체를 만드는 함수
+    """
+    with _lock:
+        _backends[name] = factory
+        _instances.pop(name, None)
+
+
+def available_backends() -> List[str]:
+    """등록된 백엔드 이름 목록"""
+    return sorted(_backends)
+
+
+def get_backend(name: Optional[str] = None, threads: int = 0) -> WhisperBackend:
+    """
+    백엔드 인스턴스 (이름별로 하나, 처음 요청한 스레드 수 사용)
+    Raises:
+        ValueError: 등록되지 않은 백엔드
+    """
+    name = name or DEFAULT_BACKEND
+    with _lock:
+        backend = _instances.get(name)
+        if backend is None:
+            if name not in _backends:
+                raise ValueError(f"알 수 없는 STT 백엔드: {name} (사용 가능: {', '.join(sorted(_backends))})")
+            backend = _instances[name] = _backends[name](threads=threads)
+    return backend
@@ -0,0 +1,260 @@
+"""
+음성 구간 검출 (VAD)
+프레임 RMS 에너지(+ 영교차율)를 잡음 바닥과 비교하여 발화/묵음을 판정 (NumPy 벡터화)
+
+- detect_speech: 녹음 전체에서 발화 구간 검출 → 앞뒤 묵음 제거, 쉼 기준 분할, 쉼 통계
+- StreamingVAD: 청크 단위 증분 검출 (스트리밍 세션)
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+def _runs(mask: np.ndarray) -> np.ndarray:
+    """불리언 배열의 True 구간 [start, end) 목록 (N × 2)"""
+    edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+    return np.column_stack([np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)])
+
+
+class SpeechActivity:
+    """녹음 하나의 발화 구간 검출 결과 (샘플 단위)"""
+
+    def __init__(self, segments: np.ndarray, num_samples: int, sample_rate: int,
+                 min_pause_samples: int):
+        """
+        Args:
+            segments: 발화 구간 [start, end) 샘플 인덱스 (N × 2, 시간순)
+            num_samples: 전체 샘플 수
+            sample_rate: 샘플링 레이트
+            min_pause_samples: 쉼으로 집계할 최소 묵음 길이 (샘플)
+        """
+        self.segments = segments
+        self.num_samples = num_samples
+        self.sample_rate = sample_rate
+        self.min_pause_samples = min_pause_samples
+
+    @property
+    def has_speech(self) -> bool:
+        return len(self.segments) > 0
+
+    @property
+    def bounds(self) -> Tuple[int, int]:
+        """앞뒤 묵음을 뺀 [start, end) (발화가 없으면 (0, 0))"""
+        if not self.has_speech:
+            return 0, 0
+        return int(self.segments[0, 0]), int(self.segments[-1, 1])
+
+    def trim(self, samples: np.ndarray) -> np.ndarray:
+        """앞뒤 묵음 제거 (복사 없는 슬라이스)"""
+        start, end = self.bounds
+        return samples[start:end]
+
+    def chunks(self, max_samples: int) -> List[Tuple[int, int]]:
+        """
+        앞뒤 묵음을 뺀 구간을 쉼의 가운데에서 나눠 max_samples 이하 조각으로 분할
+        (조각들이 구간 전체를 빈틈없이 덮으므로 약한 발음이 쉼으로 오검출되어도 버려지지 않음,
+        쉼 없이 너무 긴 발화는 고정 길이로 자름)
+        Returns:
+            [start, end) 샘플 인덱스 목록
+        """
+        start, end = self.bounds
+        cuts = ((self.segments[1:, 0] + self.segments[:-1, 1]) // 2).tolist()
+        chunks: List[Tuple[int, int]] = []
+        last_cut = start
+        for cut in cuts + [end]:
+            while cut - start > max_samples:
+                boundary = last_cut if last_cut > start else start + max_samples
+                chunks.append((start, boundary))
+                start = boundary
+            last_cut = cut
+        if end > start:
+            chunks.append((start, end))
+        return chunks
+
+    def pause_stats(self) -> Dict[str, float]:
+        """
+        쉼 통계 (ms)
+        Returns:
+            발화/앞뒤 묵음 길이, 발화 사이 쉼 횟수·총합·평균·최대, 발화 비율
+        """
+        to_ms = 1000.0 / self.sample_rate
+        if not self.has_speech:
+            return {
+                'speech_ms': 0.0,
+                'leading_silence_ms': round(self.num_samples * to_ms, 1),
+                'trailing_silence_ms': 0.0,
+                'pause_count': 0,
+                'total_pause_ms': 0.0,
+                'mean_pause_ms': 0.0,
+                'longest_pause_ms': 0.0,
+                'speech_ratio': 0.0,
+            }
+        gaps = self.segments[1:, 0] - self.segments[:-1, 1]
+        pauses = gaps[gaps >= self.min_pause_samples]
+        speech = int((self.segments[:, 1] - self.segments[:, 0]).sum())
+        start, end = self.bounds
+        return {
+            'speech_ms': round(speech * to_ms, 1),
+            'leading_silence_ms': round(start * to_ms, 1),
+            'trailing_silence_ms': round((self.num_samples - end) * to_ms, 1),
+            'pause_count': int(len(pauses)),
+            'total_pause_ms': round(float(pauses.sum()) * to_ms, 1),
+            'mean_pause_ms': round(float(pauses.mean()) * to_ms, 1) if len(pauses) else 0.0,
+            'longest_pause_ms': round(float(pauses.max()) * to_ms, 1) if len(pauses) else 0.0,
+            'speech_ratio': round(speech / self.num_samples, 3) if self.num_samples else 0.0,
+        }
+
+
+def detect_speech(
+    y: np.ndarray,
+    sr: int = SAMPLE_RATE,
+    frame_ms: float = 20.0,
+    threshold_db: float = 12.0,
+    min_energy_db: float = -50.0,
+    zcr_threshold: float = 0.25,
+    min_speech_ms: float = 60.0,
+    min_pause_ms: float = 250.0,
+    pad_ms: float = 150.0,
+) -> SpeechActivity:
+    """
+    녹음 전체의 발화 구간 검출
+    잡음 바닥(하위 10% 프레임 에너지)보다 threshold_db 이상 큰 프레임을 발화로 보고,
+    그보다 약간 약해도 영교차율이 높은 프레임(무성 마찰음 s/f/th 등)은 발화에 포함
+    (그렇게 찾은 구간이 없어도 min_energy_db를 넘는 프레임이 있으면 녹음 전체를 발화로 봄)
+    Args:
+        y: 모노 파형
+        sr: 샘플링 레이트
+        frame_ms: 프레임 길이 (ms)
+        threshold_db: 잡음 바닥 대비 발화 판정 기준 (dB)
+        min_energy_db: 발화로 볼 최소 절대 에너지 (dBFS)
+        zcr_threshold: 무성음으로 볼 영교차율 (프레임 내 부호 변화 비율)
+        min_speech_ms: 이보다 짧은 발화 조각은 잡음으로 제거
+        min_pause_ms: 이보다 짧은 묵음은 발화에 포함 (쉼으로 보지 않음)
+        pad_ms: 각 발화 구간 앞뒤 여유 (자음 시작/끝 보존)
+    Returns:
+        SpeechActivity
+    """
+    y = np.asarray(y, dtype=np.float32)
+    frame = max(1, int(sr * frame_ms / 1000))
+    n = len(y) // frame
+    min_pause_samples = int(sr * min_pause_ms / 1000)
+    if n == 0:
+        return SpeechActivity(np.empty((0, 2), dtype=np.int64), len(y), sr, min_pause_samples)
+
+    frames = y[:n * frame].reshape(n, frame)
+    energy = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+    zcr = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+
+    floor = np.percentile(energy, 10)
+    threshold = max(floor + threshold_db, min_energy_db)
+    speech = (energy > threshold) | ((energy > threshold - 6.0) & (zcr > zcr_threshold))
+
+    # 짧은 묵음 메우기 → 짧은 발화 조각 제거 (프레임 단위)
+    runs = _runs(~speech)
+    gap_frames = max(1, int(round(min_pause_ms / frame_ms)))
+    interior = (runs[:, 0] > 0) & (runs[:, 1] < n) & (runs[:, 1] - runs[:, 0] < gap_frames)
+    for start, end in runs[interior]:
+        speech[start:end] = True
+    runs = _runs(speech)
+    runs = runs[runs[:, 1] - runs[:, 0] >= max(1, int(round(min_speech_ms / frame_ms)))]
+
+    # 조용한 구간이 없는 녹음(꽉 자른 클립, 계속되는 말소리/배경음)은 잡음 바닥이 발화 에너지와 같아져
+    # 아무 구간도 남지 않음 → 절대 기준을 넘는 프레임이 있으면 녹음 전체를 발화로 간주
+    if len(runs) == 0 and energy.max() > min_energy_db:
+        return SpeechActivity(np.array([[0, len(y)]], dtype=np.int64), len(y), sr, min_pause_samples)
+
+    # 샘플 단위로 변환 + 여유 추가 (겹치는 구간은 병합)
+    pad = int(sr * pad_ms / 1000)
+    segments = np.clip(runs * frame + np.array([-pad, pad]), 0, len(y))
+    if len(segments) > 1:
+        merged = [segments[0].tolist()]
+        for start, end in segments[1:].tolist():
+            if start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        segments = np.array(merged, dtype=np.int64)
+    return SpeechActivity(segments.astype(np.int64).reshape(-1, 2), len(y), sr, min_pause_samples)
+
+
+class StreamingVAD:
+    """청크 단위로 입력받는 증분 에너지 VAD (발화 시작/끝점 검출)"""
+
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        frame_ms: float = 30.0,
+        threshold_db: float = 10.0,
+        min_energy_db: float = -50.0,
+        min_speech_ms: float = 90.0,
+        min_silence_ms: float = 600.0,
+    ):
+        """
+        초기화
+        Args:
+            sample_rate: 입력 샘플링 레이트
+            frame_ms: 판정 프레임 길이 (ms)
+            threshold_db: 잡음 바닥보다 이만큼 크면 발화 프레임
+            min_energy_db: 발화로 볼 최소 절대 에너지 (dBFS)
+            min_speech_ms: 발화 시작으로 인정할 연속 발화 길이 (ms)
+            min_silence_ms: 발화 끝으로 인정할 연속 묵음 길이 (ms)
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = int(sample_rate * frame_ms / 1000)
+        self.threshold_db = threshold_db
+        self.min_energy_db = min_energy_db
+        self.min_speech_frames = max(1, int(round(min_speech_ms / frame_ms)))
+        self.min_silence_frames = max(1, int(round(min_silence_ms / frame_ms)))
+
+        self._remainder = np.empty(0, dtype=np.float32)
+        self.noise_floor_db: Optional[float] = None
+        self.in_speech = False
+        self.speech_run = 0
+        self.silence_run = 0
+        self.frames_seen = 0
+
+    def frame_energy_db(self, samples: np.ndarray) -> np.ndarray:
+        """완전한 프레임들의 RMS 에너지 (dBFS), 남은 샘플은 다음 호출로 이월"""
+        samples = np.concatenate([self._remainder, np.asarray(samples, dtype=np.float32)])
+        n = len(samples) // self.frame_length
+        self._remainder = samples[n * self.frame_length:]
+        frames = samples[:n * self.frame_length].reshape(n, self.frame_length)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        return 20 * np.log10(rms + 1e-10)
+
+    def update(self, samples: np.ndarray) -> bool:
+        """
+        새 샘플을 반영하여 발화 상태 갱신
+        Args:
+            samples: 모노 float32 샘플
+        Returns:
+            이번 입력에서 발화 끝점(충분히 긴 묵음)이 검출되었는지 여부
+        """
+        endpoint = False
+        for energy in self.frame_energy_db(samples).tolist():
+            self.frames_seen += 1
+            # 잡음 바닥: 아래로는 빠르게, 위로는 천천히 따라감
+            if self.noise_floor_db is None:
+                self.noise_floor_db = energy
+            elif energy < self.noise_floor_db:
+                self.noise_floor_db = 0.7 * self.noise_floor_db + 0.3 * energy
+            else:
+                self.noise_floor_db = 0.995 * self.noise_floor_db + 0.005 * energy
+
+            speech = (energy > self.min_energy_db
+                      and energy > self.noise_floor_db + self.threshold_db)
+            if speech:
+                self.speech_run += 1
+                self.silence_run = 0
+                if self.speech_run >= self.min_speech_frames:
+                    self.in_speech = True
+            else:
+                self.speech_run = 0
+                self.silence_run += 1
+                if self.in_speech and self.silence_run >= self.min_silence_frames:
+                    self.in_speech = False
+                    endpoint = True
+        return endpoint
@@ -0,0 +1,369 @@
+"""
+분석 워커 풀
+워커 프로세스마다 PronunciationAnalyzer(Whisper 모델)를 한 번만 로드하고
+요청을 제한된 대기열로 분배 (대기열이 가득 차면 즉시 거절 → 백프레셔)
+작업은 부모 프로세스가 쉬는 워커의 전용 큐에 하나씩 넘기므로 어느 워커가 어떤 작업을 가졌는지 항상 알고,
+워커가 죽으면 그 작업을 바로 실패 처리
+모델 로드 중에 죽는 워커는 지수 백오프(RESTART_BACKOFF_S → MAX_RESTART_BACKOFF_S)로 재시작하고
+다시 준비될 때까지 health()에 unhealthy로 보고
+"""
+
+import itertools
+import multiprocessing as mp
+import os
+import pickle
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+import metrics
+
+# 시작(모델 로드) 중에 연속으로 죽은 워커의 재시작 대기 시간 (초, 실패할 때마다 두 배)
+RESTART_BACKOFF_S = 1.0
+MAX_RESTART_BACKOFF_S = 60.0
+
+
+class PoolSaturatedError(RuntimeError):
+    """처리 중 + 대기 중 작업 수가 한도에 도달함"""
+
+
+class WorkerTaskError(RuntimeError):
+    """워커 프로세스에서 작업이 실패함"""
+
+
+def _worker_main(worker_id: int, model_size: str, stt_backend: str, stt_threads: int, decode,
+                 pitch_method: str, prosody_block_s: float, tasks, results):
+    """워커 프로세스 진입점: 모델을 한 번 로드한 뒤 작업을 반복 처리"""
+    results.put(('status', worker_id, {'state': 'loading', 'pid': os.getpid()}))
+
+    # 모델은 워커당 한 번만 로드
+    from pronunciation_analyzer import PronunciationAnalyzer
+    analyzer = PronunciationAnalyzer(model_size=model_size, preload=True,
+                                     stt_backend=stt_backend, stt_threads=stt_threads,
+                                     decode=decode, pitch_method=pitch_method,
+                                     prosody_block_s=prosody_block_s)
+    results.put(('status', worker_id, {
+        'state': 'ready',
+        'pid': os.getpid(),
+        'model_loaded': analyzer.whisper_model is not None,
+    }))
+
+    while True:
+        item = tasks.get()
+        if item is None:
+            break
+        task_id, method, args, kwargs = item
+        results.put(('start', worker_id, task_id, os.getpid()))
+        # 단계 시간은 부모 프로세스로 돌려보내 부모 히스토그램/요청 timings에 기록
+        with metrics.collect() as timings:
+            try:
+                value = getattr(analyzer, method)(*args, **kwargs)
+                error = None
+            except Exception as e:
+                value, error = None, f"{type(e).__name__}: {e}"
+        # 결과 큐는 별도 스레드에서 pickle하므로 실패하면 작업이 끝나지 않음 → 미리 확인해 오류로 보냄
+        try:
+            pickle.dumps(value)
+        except Exception as e:
+            value, error = None, f"result of {method} could not be pickled: {type(e).__name__}: {e}"
+        results.put(('done', worker_id, task_id, value, error, timings, os.getpid()))
+
+
+class AnalyzerPool:
+    """PronunciationAnalyzer 프로세스 풀"""
+
+    def __init__(
+        self,
+        model_size: str = "base",
+        workers: int = 2,
+        max_queue: int = 8,
+        start_method: str = "spawn",
+        stt_backend: str = "torch",
+        stt_threads: int = 0,
+        decode=None,
+        pitch_method: str = 'piptrack',
+        prosody_block_s: float = 0.0,
+    ):
+        """
+        초기화
+        Args:
+            model_size: 워커가 로드할 Whisper 모델 크기
+            workers: 워커 프로세스 수
+            max_queue: 처리 중인 작업 외에 대기할 수 있는 최대 작업 수
+            start_method: multiprocessing 시작 방식 (torch 사용 시 spawn 권장)
+            stt_backend: 워커의 STT 백엔드 (torch / int8)
+            stt_threads: 워커당 STT 추론 스레드 수 (0이면 torch 기본값,
+                         워커 수 × 스레드 수가 CPU 코어 수를 넘지 않게)
+            decode: 워커의 Whisper 디코딩 옵션 (stt_backends.DecodeOptions, None이면 기본값)
+            pitch_method: 워커의 운율 분석 피치 추적 방식 (piptrack / yin)
+            prosody_block_s: 워커의 운율 분석 블록 길이 (초, 0이면 전체를 한 번에)
+        """
+        self.model_size = model_size
+        self.stt_backend = stt_backend
+        self.stt_threads = stt_threads
+        self.decode = decode
+        self.pitch_method = pitch_method
+        self.prosody_block_s = prosody_block_s
+        self.num_workers = workers
+        self.max_queue = max_queue
+
+        self._ctx = mp.get_context(start_method)
+        self._results = self._ctx.Queue()
+        # 아직 워커에 넘기지 않은 작업 (task_id, method, args, kwargs)
+        self._backlog = deque()
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._futures: Dict[int, Future] = {}
+        self._workers: Dict[int, Dict] = {}
+        self._closed = False
+
+        with self._lock:
+            for worker_id in range(workers):
+                self._start_worker(worker_id)
+
+        self._collector = threading.Thread(
+            target=self._collect_results, name="analyzer-pool-collector", daemon=True
+        )
+        self._collector.start()
+
+    def _start_worker(self, worker_id: int, restarts: int = 0, startup_failures: int = 0):
+        """워커 프로세스 시작 (재시작 포함, self._lock을 잡은 상태에서 호출)"""
+        tasks = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self.model_size, self.stt_backend, self.stt_threads, self.decode,
+                  self.pitch_method, self.prosody_block_s, tasks, self._results),
+            name=f"analyzer-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[worker_id] = {
+            'process': process,
+            'pid': process.pid,
+            'tasks': tasks,
+            'state': 'starting',
+            'model_loaded': False,
+            # 이 워커에 넘긴 작업 (부모가 넘길 때 기록, 워커가 끝내거나 죽으면 비움)
+            'current_task': None,
+            'dispatched_at': None,
+            'tasks_done': 0,
+            'errors': 0,
+            'restarts': restarts,
+            # 준비(ready)되기 전에 연속으로 죽은 횟수와 다음 재시작 시각 (죽은 뒤에만 설정)
+            'startup_failures': startup_failures,
+            'restart_at': None,
+            'last_seen': time.time(),
+        }
+
+    def submit(self, method: str, *args, block: bool = False,
+               timeout: Optional[float] = None, **kwargs) -> Future:
+        """
+        분석 작업 제출
+        Args:
+            method: 호출할 PronunciationAnalyzer 메서드 이름
+            block: 대기열이 가득 찼을 때 자리가 날 때까지 기다릴지 여부
+            timeout: block=True일 때 최대 대기 시간 (초)
+        Returns:
+            결과 Future (완료 후 future.timings에 워커에서 잰 단계 시간)
+        Raises:
+            PoolSaturatedError: 대기열이 가득 참
+        """
+        if self._closed:
+            raise RuntimeError("풀이 종료되었습니다")
+        if method.startswith('_'):
+            raise ValueError(f"호출할 수 없는 메서드: {method}")
+
+        if not self._slots.acquire(blocking=block, timeout=timeout if block else None):
+            raise PoolSaturatedError("분석 대기열이 가득 찼습니다")
+
+        future = Future()
+        task_id = next(self._task_ids)
+        with self._lock:
+            self._futures[task_id] = future
+            self._backlog.append((task_id, method, args, kwargs))
+            self._dispatch()
+        return future
+
+    def _dispatch(self):
+        """쉬는(작업이 없는) 살아 있는 워커에 대기 작업을 하나씩 넘김 (self._lock을 잡은 상태에서 호출)"""
+        for info in self._workers.values():
+            if not self._backlog:
+                return
+            if info['current_task'] is not None or not info['process'].is_alive():
+                continue
+            item = self._backlog.popleft()
+            info['current_task'] = item[0]
+            info['dispatched_at'] = time.time()
+            info['tasks'].put(item)
+
+    def call(self, method: str, *args, timeout: Optional[float] = None, **kwargs):
+        """
+        작업을 제출하고 결과를 기다림
+        Raises:
+            PoolSaturatedError: 대기열이 가득 참
+            concurrent.futures.TimeoutError: timeout 안에 결과가 오지 않음
+            WorkerTaskError: 워커에서 작업이 실패함
+        """
+        future = self.submit(method, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        finally:
+            metrics.merge(getattr(future, 'timings', {}))
+
+    def _finish(self, task_id: int, value=None, error: str = None, timings: Optional[Dict] = None):
+        """작업 완료 처리: Future 결과 설정 + 슬롯 반환"""
+        with self._lock:
+            future = self._futures.pop(task_id, None)
+        if future is None:
+            return
+        self._slots.release()
+        if timings:
+            metrics.observe_stages(timings)
+        future.timings = timings or {}
+        if error is None:
+            future.set_result(value)
+        else:
+            future.set_exception(WorkerTaskError(error))
+
+    def _collect_results(self):
+        """워커 메시지 수집 스레드: 결과 전달, 상태 갱신, 죽은 워커 재시작"""
+        while not self._closed:
+            try:
+                message = self._results.get(timeout=1.0)
+            except queue.Empty:
+                message = None
+            except (EOFError, OSError):
+                break
+
+            if message is not None:
+                self._handle(message)
+            self._check_workers()
+
+    def _handle(self, message):
+        """워커 메시지 하나 처리 (재시작 전 워커가 늦게 보낸 메시지는 새 워커 상태에 반영하지 않음)"""
+        kind, worker_id = message[0], message[1]
+        with self._lock:
+            info = self._workers.get(worker_id)
+            if kind == 'status':
+                current = info is not None and message[2].get('pid', info['pid']) == info['pid']
+            else:
+                current = info is not None and message[-1] == info['pid']
+            if current:
+                info['last_seen'] = time.time()
+            if kind == 'status' and current:
+                info.update(message[2])
+                if info['state'] == 'ready':
+                    info['startup_failures'] = 0
+            elif kind == 'start' and current and info['current_task'] == message[2]:
+                info['state'] = 'busy'
+            elif kind == 'done':
+                task_id, error = message[2], message[4]
+                if current and info['current_task'] == task_id:
+                    info['state'] = 'ready'
+                    info['current_task'] = None
+                    info['dispatched_at'] = None
+                    info['tasks_done'] += 1
+                    if error is not None:
+                        info['errors'] += 1
+                    self._dispatch()
+        if kind == 'done':
+            _, _, task_id, value, error, timings, _ = message
+            self._finish(task_id, value, error, timings)
+
+    def _check_workers(self):
+        """
+        비정상 종료된 워커의 작업을 실패 처리하고 새 워커로 교체
+        (모델 로드 중에 죽은 워커는 연속 실패 횟수에 따라 재시작을 늦춤)
+        """
+        if self._closed:
+            return
+        failed = []
+        now = time.time()
+        with self._lock:
+            for worker_id, info in list(self._workers.items()):
+                process = info['process']
+                if process.is_alive():
+                    continue
+                # 넘긴 작업은 'start' 메시지를 보냈는지와 무관하게 이 워커 소유
+                if info['current_task'] is not None:
+                    failed.append((info['current_task'],
+                                   f"worker {worker_id} exited with code {process.exitcode}"))
+                    info['current_task'] = None
+                    info['dispatched_at'] = None
+                if info['restart_at'] is None:
+                    if info['state'] in ('starting', 'loading'):
+                        info['startup_failures'] += 1
+                    delay = (min(MAX_RESTART_BACKOFF_S,
+                                 RESTART_BACKOFF_S * 2 ** (info['startup_failures'] - 1))
+                             if info['startup_failures'] else 0.0)
+                    info['state'] = 'dead'
+                    info['restart_at'] = now + delay
+                    print(f"워커 {worker_id} 비정상 종료 (exitcode={process.exitcode}), "
+                          f"{delay:.0f}초 후 재시작")
+                if info['restart_at'] <= now:
+                    self._start_worker(worker_id, restarts=info['restarts'] + 1,
+                                       startup_failures=info['startup_failures'])
+            if failed:
+                self._dispatch()
+        for task_id, error in failed:
+            self._finish(task_id, error=error)
+
+    def health(self) -> Dict:
+        """
+        풀 상태 보고
+        Returns:
+            워커별 상태와 대기열 현황 (시작 중에 죽은 뒤 아직 준비되지 않은 워커는 healthy=False)
+        """
+        with self._lock:
+            pending = len(self._futures)
+            backlog = len(self._backlog)
+            snapshot = sorted(self._workers.items())
+        workers = []
+        for worker_id, info in snapshot:
+            workers.append({
+                'id': worker_id,
+                'pid': info['pid'],
+                'alive': info['process'].is_alive(),
+                'state': info['state'],
+                'busy_for': (round(time.time() - info['dispatched_at'], 1)
+                             if info['dispatched_at'] is not None else None),
+                'model_loaded': info['model_loaded'],
+                'tasks_done': info['tasks_done'],
+                'errors': info['errors'],
+                'restarts': info['restarts'],
+                'healthy': info['startup_failures'] == 0,
+                'startup_failures': info['startup_failures'],
+                'restart_in': (round(max(0.0, info['restart_at'] - time.time()), 1)
+                               if info['restart_at'] is not None else None),
+                'last_seen': round(time.time() - info['last_seen'], 1),
+            })
+        return {
+            'model_size': self.model_size,
+            'pending': pending,
+            'backlog': backlog,
+            'capacity': self.num_workers + self.max_queue,
+            'unhealthy': sum(not worker['healthy'] for worker in workers),
+            'workers': workers,
+        }
+
+    def shutdown(self, timeout: float = 5.0):
+        """워커 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        for info in self._workers.values():
+            info['tasks'].put(None)
+        for info in self._workers.values():
+            info['process'].join(timeout)
+            if info['process'].is_alive():
+                info['process'].terminate()
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+            self._backlog.clear()
+        for future in futures:
+            future.set_exception(RuntimeError("풀이 종료되었습니다"))